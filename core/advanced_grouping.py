@@ -10,6 +10,7 @@ duplicate content with slight name variations.
 
 RELATIONSHIPS:
 - Used by: core.duplicate_detection for advanced duplicate detection
+- Uses: core.filename_comparison for the shared duplicate indicator patterns
 - Uses: re, pathlib, typing, logging standard libraries
 - Provides: Advanced grouping functionality for potential duplicates
 - Called when: Advanced grouping is enabled in scan settings
@@ -43,9 +44,16 @@ import re
 from pathlib import Path
 from typing import List, Dict, Tuple
 import logging
+from core.filename_comparison import DUPLICATE_INDICATOR_PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Base-name patterns tried in order by extract_base_name_with_pattern
+_UNDERSCORE_NUMBER = re.compile(r'^(.+?)_([0-9]+)$')
+_PARENTHESES_NUMBER = re.compile(r'^(.+?)\(([0-9]+)\)$')
+_PARENTHESES_COPY = re.compile(r'^(.+?)\(([Cc]opy|[Dd]uplicate)\)$')
+_SUFFIX_COPY = re.compile(r'^(.+?) (copy|duplicate)$')
+
 
 def normalize_for_grouping(filename: str) -> str:
     """
@@ -61,28 +69,10 @@ def normalize_for_grouping(filename: str) -> str:
     path = Path(filename)
     stem = path.stem.lower()
     
-    # Remove common duplicate indicators:
-    # - Numbers with underscores like "_1", "_2", etc.
-    # - Numbers in parentheses like "(1)", "(2)", etc.
-    # - "copy" in various forms
-    # - "duplicate" in various forms
-    
-    # Remove patterns like _1, _2, _copy, _duplicate
-    stem = re.sub(r'_[0-9]+$', '', stem)
-    stem = re.sub(r'_copy$', '', stem)
-    stem = re.sub(r'_duplicate$', '', stem)
-    stem = re.sub(r'_duplicates$', '', stem)
-    
-    # Remove patterns like (1), (2), (copy), (duplicate)
-    stem = re.sub(r'\([0-9]+\)$', '', stem)
-    stem = re.sub(r'\(copy\)$', '', stem)
-    stem = re.sub(r'\(duplicate\)$', '', stem)
-    
-    # Remove common variations of "copy" and "duplicate"
-    stem = re.sub(r' copy$', '', stem)
-    stem = re.sub(r' duplicate$', '', stem)
-    stem = re.sub(r' \([Cc]opy\)$', '', stem)
-    stem = re.sub(r' \([Dd]uplicate\)$', '', stem)
+    # Strip the duplicate indicators in order; each pattern sees the result
+    # of the ones before it
+    for pattern in DUPLICATE_INDICATOR_PATTERNS:
+        stem = pattern.sub('', stem)
     
     return stem
 
@@ -101,22 +91,22 @@ def extract_base_name_with_pattern(filename: str) -> Tuple[str, str]:
     stem = path.stem.lower()
     
     # Pattern for _1, _2, etc.
-    match = re.match(r'^(.+?)_([0-9]+)$', stem)
+    match = _UNDERSCORE_NUMBER.match(stem)
     if match:
         return match.group(1), f"underscore_number_{match.group(2)}"
     
     # Pattern for (1), (2), etc.
-    match = re.match(r'^(.+?)\(([0-9]+)\)$', stem)
+    match = _PARENTHESES_NUMBER.match(stem)
     if match:
         return match.group(1), f"parentheses_number_{match.group(2)}"
     
     # Pattern for (copy), (duplicate), etc.
-    match = re.match(r'^(.+?)\(([Cc]opy|[Dd]uplicate)\)$', stem)
+    match = _PARENTHESES_COPY.match(stem)
     if match:
         return match.group(1), f"parentheses_{match.group(2).lower()}"
     
     # Pattern for copy, duplicate at the end
-    match = re.match(r'^(.+?) (copy|duplicate)$', stem)
+    match = _SUFFIX_COPY.match(stem)
     if match:
         return match.group(1), f"suffix_{match.group(2)}"
     
@@ -231,12 +221,22 @@ def group_files_by_relationships(file_paths: List[str]) -> List[List[str]]:
     groups = []
     processed_files = set()
     
+    # Extract each base name once and index files by it, instead of comparing
+    # every file against every other file
+    files_by_base_name: Dict[str, List[str]] = {}
+    for file_path in file_paths:
+        base_name, _ = extract_base_name_with_pattern(file_path)
+        files_by_base_name.setdefault(base_name, []).append(file_path)
+    base_name_of = {file_path: base_name
+                    for base_name, paths in files_by_base_name.items() for file_path in paths}
+    
     for file_path in file_paths:
         if file_path in processed_files:
             continue
-            
+        
         # Find related files for the current file
-        related = find_related_files(file_path, file_paths)
+        related = [other_path for other_path in files_by_base_name[base_name_of[file_path]]
+                   if other_path != file_path]
         
         # Create a group with the current file and its related files
         group = [file_path] + [f for f in related if f not in processed_files]
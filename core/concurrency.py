@@ -9,13 +9,14 @@ threads for operations like hashing and file information retrieval.
 
 RELATIONSHIPS:
 - Used by: core.hashing, core.scanning, core.duplicate_detection for performance optimization
-- Uses: concurrent.futures, os, pathlib, xxhash and other standard libraries
+- Uses: concurrent.futures, os, pathlib, xxhash and other standard libraries; core.hash_cache for optional cached hashes, core.scanning for directory walks
 - Provides: Concurrent processing capabilities to speed up file operations
 - Called when: Processing large numbers of files to improve performance
 
 DEPENDENCIES:
 - concurrent.futures: For ThreadPoolExecutor and ProcessPoolExecutor
 - os: For file system operations
+- threading: For per-thread read buffers
 - xxhash: For concurrent hash calculation
 - pathlib: For path manipulation
 - typing: For type hints
@@ -41,18 +42,46 @@ Use the main functions to process files concurrently:
 This module is essential for performance optimization when dealing with large datasets.
 """
 import os
+import threading
 import xxhash
 from pathlib import Path
-from typing import List, Dict, Tuple, Callable, Any
+from typing import List, Dict, Tuple, Callable, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from functools import partial
 import logging
-from datetime import datetime
 
 from core.models import FileInfo
+from core.hash_cache import HashCache
+from core.scanning import scan_directory_for_files
 
 logger = logging.getLogger(__name__)
 
+# Hash used for full-content comparison. XXH3 uses the CPU's SIMD units
+# (SSE2/AVX2/NEON) and is several times faster than xxh64, and its 128-bit
+# digest keeps accidental collisions negligible even across millions of files.
+CONTENT_HASHER = xxhash.xxh3_128
+
+# Read chunk size for content hashing
+HASH_CHUNK_SIZE = 128 * 1024
+
+_read_buffers = threading.local()
+
+
+def read_buffer() -> memoryview:
+    """
+    Return this thread's reusable read buffer of HASH_CHUNK_SIZE bytes.
+    
+    Allocating (and zeroing) a fresh 128KB buffer for every file costs about
+    as much as hashing a small file, so each worker thread keeps one.
+    
+    Returns:
+        Writable memoryview over the thread's buffer
+    """
+    buffer = getattr(_read_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _read_buffers.buffer = memoryview(bytearray(HASH_CHUNK_SIZE))
+    return buffer
+
 
 def get_hash_concurrent(filepath: str) -> Tuple[str, str]:
     """
@@ -64,9 +93,8 @@ def get_hash_concurrent(filepath: str) -> Tuple[str, str]:
     Returns:
         Tuple of (filepath, hash) or (filepath, "") if error
     """
-    h = xxhash.xxh64()
-    b = bytearray(128 * 1024)  # 128KB chunks
-    mv = memoryview(b)
+    h = CONTENT_HASHER()
+    mv = read_buffer()
     
     try:
         with open(filepath, 'rb', buffering=0) as f:
@@ -95,8 +123,8 @@ def get_file_info_concurrent(filepath: str) -> Tuple[str, FileInfo]:
         file_info = FileInfo(
             path=path_obj,
             size=stat.st_size,
-            created_time=datetime.fromtimestamp(stat.st_ctime),
-            modified_time=datetime.fromtimestamp(stat.st_mtime),
+            created_timestamp=stat.st_ctime,
+            modified_timestamp=stat.st_mtime,
             extension=path_obj.suffix.lower(),
             name=path_obj.name
         )
@@ -148,20 +176,89 @@ def process_files_concurrent(
     return results
 
 
-def calculate_hashes_concurrent(file_paths: List[str], max_workers: int = None) -> Dict[str, str]:
+def _order_largest_first(file_paths: List[str],
+                         stats: Optional[Dict[str, os.stat_result]] = None) -> List[str]:
+    """
+    Sort file paths by size, largest first, reusing known stat results.
+    Files that cannot be stat'ed are placed at the end.
+    """
+    def size_key(filepath: str) -> int:
+        st = stats.get(filepath) if stats else None
+        if st is not None:
+            return st.st_size
+        try:
+            return os.stat(filepath).st_size
+        except OSError:
+            return -1
+    
+    return sorted(file_paths, key=size_key, reverse=True)
+
+
+def calculate_hashes_concurrent(
+    file_paths: List[str],
+    max_workers: int = None,
+    hash_cache: Optional[HashCache] = None,
+    stats: Optional[Dict[str, os.stat_result]] = None
+) -> Dict[str, str]:
     """
     Calculate hashes for a list of files concurrently.
     
+    Files are submitted largest first (longest-processing-time-first), so a
+    few huge files start early instead of leaving one worker busy at the
+    end while the others sit idle.
+    
     Args:
         file_paths: List of file paths to hash
         max_workers: Maximum number of worker threads (defaults to number of CPUs)
+        hash_cache: Optional HashCache; files whose size and mtime are unchanged
+            since they were cached are not read again, and new hashes are recorded
+        stats: Optional stat results by path from an earlier pass (e.g. size
+            bucketing); used for ordering and cache keys instead of statting again
         
     Returns:
         Dictionary mapping file paths to their hash values
     """
+    if hash_cache is not None:
+        return _calculate_hashes_cached(file_paths, max_workers, hash_cache, stats)
+    
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    if len(file_paths) > workers:
+        file_paths = _order_largest_first(file_paths, stats)
     return process_files_concurrent(file_paths, get_hash_concurrent, max_workers)
 
 
+def _calculate_hashes_cached(file_paths: List[str], max_workers: Optional[int], hash_cache: HashCache,
+                             stats: Optional[Dict[str, os.stat_result]]) -> Dict[str, str]:
+    """
+    Take unchanged files' hashes from the cache and hash only the rest.
+    """
+    keys: Dict[str, Tuple[int, int]] = {}
+    for filepath in file_paths:
+        st = stats.get(filepath) if stats else None
+        if st is None:
+            try:
+                st = os.stat(filepath)
+            except OSError as e:
+                logger.error(f"Error getting info for file {filepath}: {e}")
+                continue
+        keys[filepath] = (st.st_size, st.st_mtime_ns)
+    
+    algorithm = CONTENT_HASHER().name
+    cached = hash_cache.get_hashes(
+        ((filepath, size, mtime_ns) for filepath, (size, mtime_ns) in keys.items()), algorithm)
+    
+    # Largest first, using the sizes we already have
+    to_hash = sorted((filepath for filepath in keys if filepath not in cached),
+                     key=lambda filepath: keys[filepath][0], reverse=True)
+    fresh = process_files_concurrent(to_hash, get_hash_concurrent, max_workers)
+    hash_cache.update(((filepath, *keys[filepath], file_hash) for filepath, file_hash in fresh.items()),
+                      algorithm)
+    
+    logger.info(f"Hash cache: {len(cached)} hits, {len(to_hash)} files hashed")
+    cached.update(fresh)
+    return cached
+
+
 def get_file_info_concurrent_batch(file_paths: List[str], max_workers: int = None) -> Dict[str, FileInfo]:
     """
     Get file info for a list of files concurrently.
@@ -176,13 +273,20 @@ def get_file_info_concurrent_batch(file_paths: List[str], max_workers: int = Non
     return process_files_concurrent(file_paths, get_file_info_concurrent, max_workers)
 
 
-def find_duplicates_by_hash_concurrent(file_paths: List[str], max_workers: int = None) -> Dict[str, List[str]]:
+def find_duplicates_by_hash_concurrent(
+    file_paths: List[str],
+    max_workers: int = None,
+    hash_cache: Optional[HashCache] = None,
+    stats: Optional[Dict[str, os.stat_result]] = None
+) -> Dict[str, List[str]]:
     """
     Find duplicate files by comparing their hashes using concurrent processing.
     
     Args:
         file_paths: List of file paths to check for duplicates
         max_workers: Maximum number of worker threads (defaults to number of CPUs)
+        hash_cache: Optional HashCache to reuse hashes of unchanged files
+        stats: Optional stat results by path, to avoid statting files again
         
     Returns:
         Dictionary mapping hash values to lists of duplicate file paths
@@ -190,7 +294,7 @@ def find_duplicates_by_hash_concurrent(file_paths: List[str], max_workers: int =
     logger.info(f"Starting concurrent hash calculation for {len(file_paths)} files")
     
     # Calculate all hashes concurrently
-    path_to_hash = calculate_hashes_concurrent(file_paths, max_workers)
+    path_to_hash = calculate_hashes_concurrent(file_paths, max_workers, hash_cache, stats)
     
     # Group files by hash
     hash_map: Dict[str, List[str]] = {}
@@ -209,43 +313,21 @@ def find_duplicates_by_hash_concurrent(file_paths: List[str], max_workers: int =
 
 def scan_directory_concurrent(directory_path: str, extensions: List[str] = None, max_workers: int = None) -> List[str]:
     """
-    Concurrently scan a directory for files with specified extensions.
+    Scan a directory for files with specified extensions.
+    
+    The walk uses core.scanning's os.scandir-based walker, which filters
+    extensions while listing each directory. Directory listing is bound by
+    the file system, so there is no work left to spread over threads.
     
     Args:
         directory_path: Path to the directory to scan
         extensions: List of file extensions to include (e.g., ['.jpg', '.png'])
-        max_workers: Maximum number of worker threads (defaults to number of CPUs)
+        max_workers: Unused; kept for compatibility with existing callers
         
     Returns:
         List of file paths matching the specified extensions
     """
-    if extensions is None:
-        extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', 
-                      '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.txt', '.pdf', 
-                      '.doc', '.docx', '.xls', '.xlsx']
-    
-    extensions = [ext.lower() for ext in extensions]
-    
-    def is_valid_file(filepath: str) -> Tuple[str, bool]:
-        """Check if a file has a valid extension."""
-        return filepath, Path(filepath).suffix.lower() in extensions
-    
-    # First, collect all files (not concurrent since it's I/O bound to disk)
-    all_files = []
-    try:
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                filepath = os.path.join(root, file)
-                all_files.append(filepath)
-    except PermissionError as e:
-        logger.warning(f"Permission denied when scanning directory {directory_path}: {e}")
-    
-    # Then check extensions concurrently
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        results = list(executor.map(is_valid_file, all_files))
-    
-    # Filter files with valid extensions
-    valid_files = [filepath for filepath, is_valid in results if is_valid]
+    valid_files = list(scan_directory_for_files(directory_path, extensions))
     
     logger.info(f"Found {len(valid_files)} files with valid extensions")
     return valid_files
\ No newline at end of file
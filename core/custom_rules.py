@@ -44,6 +44,7 @@ Use the main functions to create and apply custom rules:
 
 This module enables flexible and user-defined duplicate detection beyond standard methods.
 """
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Tuple, Callable, Any
@@ -62,8 +63,10 @@ def create_filename_ending_rule(ending: str) -> Callable[[str], bool]:
     Returns:
         A function that takes a filename and returns True if it ends with the specified string
     """
+    ending_lower = ending.lower()
+    
     def rule(filename: str) -> bool:
-        return filename.lower().endswith(ending.lower())
+        return filename.lower().endswith(ending_lower)
     
     return rule
 
@@ -78,8 +81,10 @@ def create_filename_containing_rule(contains: str) -> Callable[[str], bool]:
     Returns:
         A function that takes a filename and returns True if it contains the specified string
     """
+    contains_lower = contains.lower()
+    
     def rule(filename: str) -> bool:
-        return contains.lower() in filename.lower()
+        return contains_lower in filename.lower()
     
     return rule
 
@@ -94,8 +99,10 @@ def create_filename_starting_rule(starting: str) -> Callable[[str], bool]:
     Returns:
         A function that takes a filename and returns True if it starts with the specified string
     """
+    starting_lower = starting.lower()
+    
     def rule(filename: str) -> bool:
-        return filename.lower().startswith(starting.lower())
+        return filename.lower().startswith(starting_lower)
     
     return rule
 
@@ -143,13 +150,15 @@ def find_duplicates_by_custom_rules(
     if not rule_names:
         rule_names = [f"custom_rule_{i}" for i in range(len(custom_rules))]
     
+    # Extract each filename once rather than once per rule
+    named_paths = [(file_path, os.path.basename(file_path)) for file_path in file_paths]
+    
     # Apply each rule to the file paths
     for rule, rule_name in zip(custom_rules, rule_names):
         matching_files = []
         
-        for file_path in file_paths:
+        for file_path, filename in named_paths:
             try:
-                filename = Path(file_path).name
                 if rule(filename):
                     matching_files.append(file_path)
             except Exception as e:
@@ -16,8 +16,9 @@ RELATIONSHIPS:
 
 DEPENDENCIES:
 - sqlite3: For SQLite database operations
+- threading: For per-thread connection reuse
 - pathlib: For path manipulation
-- json: For serializing complex data structures
+- json: For serializing complex data structures (orjson is used instead when installed)
 - datetime: For handling timestamps
 - core.models: For ScanResult, DuplicateGroup, and FileInfo models
 
@@ -28,37 +29,190 @@ Initialize the database and use it to save and retrieve scan results:
     
     db = DuplicateDatabase(Path("my_scans.db"))
     scan_id = db.save_scan_result(my_scan_result)
+    scan_ids = db.save_scan_results([result_a, result_b])  # one transaction
     retrieved_result = db.get_scan_result(scan_id)
+    db.close()  # optional; open connections are also closed at exit
 
 The database automatically creates required tables on initialization.
 """
+import os
 import sqlite3
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import json
 import logging
+import threading
+import atexit
+import weakref
 from core.models import ScanResult, DuplicateGroup, FileInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def normalize_directory(directory) -> str:
+    """
+    Normalize a scanned directory to the lookup key stored in scans.directory_key.
+    
+    Args:
+        directory: Directory path as a string or Path
+        
+    Returns:
+        Absolute, case-normalized path string
+    """
+    return os.path.normcase(os.path.abspath(str(directory)))
+
+
+# Databases with possibly open connections, closed at interpreter exit
+_open_databases = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_databases():
+    """Close the connections of every live DuplicateDatabase."""
+    for database in list(_open_databases):
+        database.close()
+
+
+# Per-connection PRAGMAs applied when tuning is enabled
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64MB page cache
+    "PRAGMA mmap_size=30000000000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+# Columns returned by the scan summary queries, in _scan_row_to_dict order
+_SCAN_SUMMARY_COLUMNS = """
+    id, 
+    directory, 
+    scanned_files_count, 
+    scan_start_time, 
+    scan_end_time, 
+    scan_duration,
+    methods_used,
+    created_at
+"""
+
+
 class DuplicateDatabase:
     """Class for managing the SQLite database for duplicate file scan results."""
     
-    def __init__(self, db_path: Path = Path("duplicates.db")):
+    def __init__(self, db_path: Path = Path("duplicates.db"), tune_pragmas: bool = True):
         """
         Initialize the database connection and create tables if they don't exist.
         
         Args:
             db_path: Path to the SQLite database file
+            tune_pragmas: Whether to enable WAL journaling and the performance
+                PRAGMAs (synchronous=NORMAL, in-memory temp store, larger page
+                cache, mmap I/O, busy timeout) on every connection
         """
         self.db_path = db_path
+        self.tune_pragmas = tune_pragmas
+        
+        # One connection per thread, since a connection must not be shared
+        # between threads; all of them are tracked so close() can reach them
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        _open_databases.add(self)
+        
         self.init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get this thread's connection, opening it with the configured PRAGMAs on first use.
+        
+        The connection stays open for reuse; use it as a context manager to
+        commit or roll back a transaction.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+        
+        if str(self.db_path) == ':memory:':
+            # An in-memory database lives inside its connection, so a second
+            # connection would see an empty database; every thread shares one
+            with self._connections_lock:
+                if not self._connections:
+                    self._connections.append(self._open_connection())
+                conn = self._local.conn = self._connections[0]
+            return conn
+        
+        conn = self._open_connection()
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection with the configured PRAGMAs."""
+        # check_same_thread is off so close() may run from another thread, and
+        # so an in-memory database's single connection can serve every thread
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.tune_pragmas:
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+        return conn
+    
+    def optimize(self):
+        """
+        Let SQLite refresh query planner statistics where they are stale.
+        
+        Runs PRAGMA optimize, which is cheap when nothing needs analyzing.
+        """
+        try:
+            self._connect().execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"Error optimizing database {self.db_path}: {e}")
+    
+    def close(self):
+        """Refresh planner statistics and close every connection opened by this database."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        if connections:
+            try:
+                connections[0].execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"Error optimizing database {self.db_path}: {e}")
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing database connection for {self.db_path}: {e}")
+        # Threads that still hold a closed connection will reopen on next use
+        self._local = threading.local()
+    
     def init_db(self):
         """Initialize the database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # WAL is persistent in the database file, so it only needs setting once.
+            # In-memory databases cannot use WAL.
+            if self.tune_pragmas and str(self.db_path) != ':memory:':
+                conn.execute("PRAGMA journal_mode=WAL")
+            
             cursor = conn.cursor()
             
             # Create scans table
@@ -71,9 +225,11 @@ class DuplicateDatabase:
                     scan_end_time TEXT,
                     scan_duration REAL,
                     methods_used TEXT,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    directory_key TEXT
                 )
             """)
+            self._add_directory_key_column(cursor)
             
             # Create duplicate_groups table
             cursor.execute("""
@@ -86,11 +242,13 @@ class DuplicateDatabase:
                 )
             """)
             
-            # Create files table
+            # Create files table. Rows are clustered by (group_id, position) so a
+            # group's files are stored together, in their original order.
+            legacy_files = self._detach_legacy_files_table(cursor)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    group_id INTEGER,
+                    group_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
                     path TEXT NOT NULL,
                     size INTEGER,
                     hash_value TEXT,
@@ -98,14 +256,108 @@ class DuplicateDatabase:
                     modified_time TEXT,
                     extension TEXT,
                     name TEXT,
+                    PRIMARY KEY (group_id, position),
                     FOREIGN KEY (group_id) REFERENCES duplicate_groups (id)
-                )
+                ) WITHOUT ROWID
             """)
+            if legacy_files:
+                self._migrate_legacy_files_table(cursor, legacy_files)
+            
+            # Index for the group lookups done when loading a single scan
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_duplicate_groups_scan
+                ON duplicate_groups (scan_id)
+            """)
+            
+            # Index for per-directory history lookups, newest first. It is keyed
+            # on the normalized directory, replacing the older raw-directory index.
+            cursor.execute("DROP INDEX IF EXISTS idx_scans_dir_ts")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scans_dirkey_ts
+                ON scans (directory_key, created_at DESC)
+            """)
+            
+            # Index for the recent-scans listing, so ORDER BY created_at DESC
+            # LIMIT n reads n index entries instead of sorting every scan
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scans_created_at
+                ON scans (created_at DESC)
+            """)
+            
+            # Gather planner statistics once, so the indexes above get chosen
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
             
             conn.commit()
         
         logger.info(f"Database initialized at {self.db_path}")
     
+    @staticmethod
+    def _add_directory_key_column(cursor: sqlite3.Cursor):
+        """
+        Add and backfill scans.directory_key on databases created before it existed.
+        
+        Args:
+            cursor: Cursor of the connection initializing the schema
+        """
+        cursor.execute("PRAGMA table_info(scans)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if 'directory_key' in columns:
+            return
+        
+        cursor.execute("ALTER TABLE scans ADD COLUMN directory_key TEXT")
+        cursor.execute("SELECT id, directory FROM scans")
+        cursor.executemany(
+            "UPDATE scans SET directory_key = ? WHERE id = ?",
+            [(normalize_directory(directory), scan_id) for scan_id, directory in cursor.fetchall()]
+        )
+    
+    @staticmethod
+    def _detach_legacy_files_table(cursor: sqlite3.Cursor) -> Optional[str]:
+        """
+        Rename a files table from the old rowid schema out of the way.
+        
+        Args:
+            cursor: Cursor of the connection initializing the schema
+            
+        Returns:
+            Name of the renamed legacy table, or None if no migration is needed
+        """
+        cursor.execute("PRAGMA table_info(files)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if not columns or 'position' in columns:
+            return None
+        
+        cursor.execute("ALTER TABLE files RENAME TO files_legacy")
+        return 'files_legacy'
+    
+    @staticmethod
+    def _migrate_legacy_files_table(cursor: sqlite3.Cursor, legacy_table: str):
+        """
+        Copy rows from the old files table into the clustered one and drop it.
+        
+        Args:
+            cursor: Cursor of the connection initializing the schema
+            legacy_table: Name returned by _detach_legacy_files_table
+        """
+        cursor.execute(f"""
+            INSERT INTO files (
+                group_id, position, path, size, hash_value,
+                created_time, modified_time, extension, name
+            )
+            SELECT
+                group_id,
+                ROW_NUMBER() OVER (PARTITION BY group_id ORDER BY id) - 1,
+                path, size, hash_value,
+                created_time, modified_time, extension, name
+            FROM {legacy_table}
+            WHERE group_id IS NOT NULL
+        """)
+        migrated_rows = cursor.rowcount
+        cursor.execute(f"DROP TABLE {legacy_table}")
+        logger.info(f"Migrated {migrated_rows} file rows to the clustered files table")
+    
     def save_scan_result(self, scan_result: ScanResult) -> int:
         """
         Save a scan result to the database.
@@ -116,69 +368,103 @@ class DuplicateDatabase:
         Returns:
             ID of the saved scan record
         """
-        with sqlite3.connect(self.db_path) as conn:
+        return self.save_scan_results([scan_result])[0]
+    
+    def save_scan_results(self, scan_results: List[ScanResult]) -> List[int]:
+        """
+        Save several scan results in a single transaction (one commit for all).
+        
+        Args:
+            scan_results: ScanResult models to save
+            
+        Returns:
+            IDs of the saved scan records, in the same order
+        """
+        with self._connect() as conn:
             cursor = conn.cursor()
+            scan_ids = [self._insert_scan_result(cursor, scan_result) for scan_result in scan_results]
+            conn.commit()
+        
+        for scan_id in scan_ids:
+            logger.info(f"Saved scan result with ID {scan_id} to database")
+        return scan_ids
+    
+    def _insert_scan_result(self, cursor: sqlite3.Cursor, scan_result: ScanResult) -> int:
+        """
+        Insert one scan result with its groups and files, without committing.
+        
+        Args:
+            cursor: Cursor of the connection holding the open transaction
+            scan_result: ScanResult model to insert
             
-            # Insert scan record
+        Returns:
+            ID of the inserted scan record
+        """
+        # Insert scan record
+        cursor.execute("""
+            INSERT INTO scans (
+                directory,
+                scanned_files_count,
+                scan_start_time,
+                scan_end_time,
+                scan_duration,
+                methods_used,
+                directory_key
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            str(scan_result.directory),
+            scan_result.scanned_files_count,
+            scan_result.scan_start_time.isoformat(),
+            scan_result.scan_end_time.isoformat(),
+            scan_result.scan_duration,
+            _json_dumps(scan_result.methods_used),
+            normalize_directory(scan_result.directory)
+        ))
+        
+        scan_id = cursor.lastrowid
+        
+        # Insert duplicate groups, collecting their file rows for one batched insert
+        file_rows = []
+        for group in scan_result.duplicate_groups:
             cursor.execute("""
-                INSERT INTO scans (
-                    directory,
-                    scanned_files_count,
-                    scan_start_time,
-                    scan_end_time,
-                    scan_duration,
-                    methods_used
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                str(scan_result.directory),
-                scan_result.scanned_files_count,
-                scan_result.scan_start_time.isoformat(),
-                scan_result.scan_end_time.isoformat(),
-                scan_result.scan_duration,
-                json.dumps(scan_result.methods_used)
-            ))
-            
-            scan_id = cursor.lastrowid
-            
-            # Insert duplicate groups and their files
-            for group in scan_result.duplicate_groups:
-                cursor.execute("""
-                    INSERT INTO duplicate_groups (
-                        scan_id,
-                        group_id,
-                        detection_method
-                    ) VALUES (?, ?, ?)
-                """, (scan_id, group.id, group.detection_method))
-                
-                group_db_id = cursor.lastrowid
-                
-                # Insert files in the group
-                for file_info in group.files:
-                    cursor.execute("""
-                        INSERT INTO files (
-                            group_id,
-                            path,
-                            size,
-                            hash_value,
-                            created_time,
-                            modified_time,
-                            extension,
-                            name
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        group_db_id,
-                        str(file_info.path),
-                        file_info.size,
-                        file_info.hash_value,
-                        file_info.created_time.isoformat() if file_info.created_time else None,
-                        file_info.modified_time.isoformat() if file_info.modified_time else None,
-                        file_info.extension,
-                        file_info.name
-                    ))
+                INSERT INTO duplicate_groups (
+                    scan_id,
+                    group_id,
+                    detection_method
+                ) VALUES (?, ?, ?)
+            """, (scan_id, group.id, group.detection_method))
             
-            conn.commit()
-            logger.info(f"Saved scan result with ID {scan_id} to database")
-            return scan_id
+            group_db_id = cursor.lastrowid
+            
+            for position, file_info in enumerate(group.files):
+                file_rows.append((
+                    group_db_id,
+                    position,
+                    str(file_info.path),
+                    file_info.size,
+                    file_info.hash_value,
+                    file_info.created_time.isoformat() if file_info.created_time else None,
+                    file_info.modified_time.isoformat() if file_info.modified_time else None,
+                    file_info.extension,
+                    file_info.name
+                ))
+        
+        # Insert all files of the scan at once
+        cursor.executemany("""
+            INSERT INTO files (
+                group_id,
+                position,
+                path,
+                size,
+                hash_value,
+                created_time,
+                modified_time,
+                extension,
+                name
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, file_rows)
+        
+        return scan_id
     
     def get_scan_result(self, scan_id: int) -> Optional[ScanResult]:
         """
@@ -190,12 +476,15 @@ class DuplicateDatabase:
         Returns:
             ScanResult model or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            # Get scan record
-            cursor.execute("""
-                SELECT * FROM scans WHERE id = ?
+            # Get scan record (id is the INTEGER PRIMARY KEY, i.e. a rowid lookup)
+            cursor.execute(f"""
+                SELECT {_SCAN_SUMMARY_COLUMNS}
+                FROM scans 
+                WHERE id = ? 
+                LIMIT 1
             """, (scan_id,))
             
             scan_row = cursor.fetchone()
@@ -210,49 +499,51 @@ class DuplicateDatabase:
             
             scan_start_time = datetime.fromisoformat(scan_start_time_str)
             scan_end_time = datetime.fromisoformat(scan_end_time_str)
-            methods_used = json.loads(methods_used_str)
+            methods_used = _json_loads(methods_used_str)
             
             # Get duplicate groups for this scan
             cursor.execute("""
-                SELECT * FROM duplicate_groups WHERE scan_id = ?
+                SELECT id, group_id, detection_method 
+                FROM duplicate_groups 
+                WHERE scan_id = ? 
+                ORDER BY id
             """, (scan_id,))
             
             group_rows = cursor.fetchall()
-            duplicate_groups = []
             
-            for group_row in group_rows:
+            # Get every file of the scan in one query instead of one per group
+            cursor.execute("""
+                SELECT f.group_id, f.path, f.size, f.hash_value,
+                       f.created_time, f.modified_time, f.extension, f.name
+                FROM files f
+                JOIN duplicate_groups g ON g.id = f.group_id
+                WHERE g.scan_id = ?
+                ORDER BY f.group_id, f.position
+            """, (scan_id,))
+            
+            files_by_group: Dict[int, List[FileInfo]] = {}
+            for file_row in cursor.fetchall():
                 (
-                    group_id, scan_id_ref, group_id_str, detection_method
-                ) = group_row
-                
-                # Get files for this group
-                cursor.execute("""
-                    SELECT * FROM files WHERE group_id = ?
-                """, (group_id,))
-                
-                file_rows = cursor.fetchall()
-                files = []
-                
-                for file_row in file_rows:
-                    (
-                        file_id, group_id_ref, path, size, hash_value,
-                        created_time_str, modified_time_str, extension, name
-                    ) = file_row
-                    
-                    file_info = FileInfo(
-                        path=Path(path),
-                        size=size,
-                        hash_value=hash_value,
-                        created_time=datetime.fromisoformat(created_time_str) if created_time_str else None,
-                        modified_time=datetime.fromisoformat(modified_time_str) if modified_time_str else None,
-                        extension=extension,
-                        name=name
-                    )
-                    files.append(file_info)
+                    group_id_ref, path, size, hash_value,
+                    created_time_str, modified_time_str, extension, name
+                ) = file_row
                 
+                file_info = FileInfo(
+                    path=Path(path),
+                    size=size,
+                    hash_value=hash_value,
+                    created_time=datetime.fromisoformat(created_time_str) if created_time_str else None,
+                    modified_time=datetime.fromisoformat(modified_time_str) if modified_time_str else None,
+                    extension=extension,
+                    name=name
+                )
+                files_by_group.setdefault(group_id_ref, []).append(file_info)
+            
+            duplicate_groups = []
+            for group_id, group_id_str, detection_method in group_rows:
                 duplicate_group = DuplicateGroup(
                     id=group_id_str,
-                    files=files,
+                    files=files_by_group.get(group_id, []),
                     detection_method=detection_method
                 )
                 duplicate_groups.append(duplicate_group)
@@ -279,46 +570,65 @@ class DuplicateDatabase:
         Returns:
             List of dictionaries containing basic scan information
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT 
-                    id, 
-                    directory, 
-                    scanned_files_count, 
-                    scan_start_time, 
-                    scan_end_time, 
-                    scan_duration,
-                    methods_used,
-                    created_at
+            cursor.execute(f"""
+                SELECT {_SCAN_SUMMARY_COLUMNS}
                 FROM scans 
                 ORDER BY created_at DESC 
                 LIMIT ?
             """, (limit,))
             
-            rows = cursor.fetchall()
+            return [self._scan_row_to_dict(row) for row in cursor.fetchall()]
+    
+    def get_scans_by_directory(self, directory: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the most recent scan records for one directory.
+        
+        Uses the (directory_key, created_at) index, so only matching rows are
+        read. Directories are matched in normalized form (see normalize_directory),
+        so relative paths and differently cased paths on Windows find the same scans.
+        
+        Args:
+            directory: The scanned directory to look up
+            limit: Maximum number of scans to return, or None for all of them
+            
+        Returns:
+            List of dictionaries containing basic scan information
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
             
-            scans = []
-            for row in rows:
-                (
-                    id_val, directory, scanned_files_count, scan_start_time_str, 
-                    scan_end_time_str, scan_duration, methods_used_str, created_at
-                ) = row
-                
-                scan_info = {
-                    'id': id_val,
-                    'directory': directory,
-                    'scanned_files_count': scanned_files_count,
-                    'scan_start_time': datetime.fromisoformat(scan_start_time_str),
-                    'scan_end_time': datetime.fromisoformat(scan_end_time_str),
-                    'scan_duration': scan_duration,
-                    'methods_used': json.loads(methods_used_str),
-                    'created_at': datetime.fromisoformat(created_at)
-                }
-                scans.append(scan_info)
-            
-            return scans
+            # SQLite treats a negative LIMIT as no limit
+            cursor.execute(f"""
+                SELECT {_SCAN_SUMMARY_COLUMNS}
+                FROM scans 
+                WHERE directory_key = ?
+                ORDER BY created_at DESC 
+                LIMIT ?
+            """, (normalize_directory(directory), -1 if limit is None else limit))
+            
+            return [self._scan_row_to_dict(row) for row in cursor.fetchall()]
+    
+    @staticmethod
+    def _scan_row_to_dict(row: tuple) -> Dict[str, Any]:
+        """Convert a row selected with _SCAN_SUMMARY_COLUMNS into a scan info dict."""
+        (
+            id_val, directory, scanned_files_count, scan_start_time_str, 
+            scan_end_time_str, scan_duration, methods_used_str, created_at
+        ) = row
+        
+        return {
+            'id': id_val,
+            'directory': directory,
+            'scanned_files_count': scanned_files_count,
+            'scan_start_time': datetime.fromisoformat(scan_start_time_str),
+            'scan_end_time': datetime.fromisoformat(scan_end_time_str),
+            'scan_duration': scan_duration,
+            'methods_used': _json_loads(methods_used_str),
+            'created_at': datetime.fromisoformat(created_at)
+        }
     
     def delete_scan(self, scan_id: int):
         """
@@ -327,7 +637,7 @@ class DuplicateDatabase:
         Args:
             scan_id: ID of the scan to delete
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Delete files in groups associated with this scan
@@ -355,7 +665,7 @@ class DuplicateDatabase:
         """
         Delete all scan records and related data from the database.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM files")
@@ -14,8 +14,8 @@ This module provides functions to find duplicate files using multiple methods:
 
 RELATIONSHIPS:
 - Uses: core.hashing, core.filename_comparison, core.custom_rules, core.advanced_grouping,
-        core.size_filtering, core.ignore_list, core.scanning, core.concurrency
-- Depends on: os, pathlib, typing, logging, datetime
+        core.size_filtering, core.ignore_list, core.scanning, core.pipeline, core.concurrency
+- Depends on: os, pathlib, typing, logging
 - Used by: main application flow, UI controllers
 - Provides: Comprehensive duplicate detection across multiple algorithms
 
@@ -27,6 +27,7 @@ DEPENDENCIES:
 - core.size_filtering: For size-based filtering
 - core.ignore_list: For filtering out ignored files/directories
 - core.scanning: For file discovery
+- core.pipeline: For single-pass ignore, size and type classification
 - core.models: For data models
 - core.concurrency: For concurrent processing
 
@@ -49,9 +50,8 @@ This module orchestrates the entire duplicate detection process across multiple
 """
 import os
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Sequence, Tuple, Optional
 import logging
-from datetime import datetime
 
 from core.hashing import find_duplicates_by_hash, find_duplicates_by_hash_models
 from core.filename_comparison import (
@@ -72,9 +72,11 @@ from core.advanced_grouping import (
     group_files_by_relationships,
     group_by_custom_rules
 )
-from core.size_filtering import filter_files_by_size
+from core.size_filtering import collect_sized_paths, filter_unique_by_size
 from core.ignore_list import IgnoreList, create_default_ignore_list
-from core.scanning import scan_directory_for_files
+from core.hash_cache import HashCache
+from core.scanning import DEFAULT_EXTENSIONS, scan_directory_for_entries
+from core.pipeline import classify
 from core.models import DuplicateGroup, FileInfo, ScanSettings, ScanResult
 
 # Import concurrent processing functions
@@ -83,18 +85,27 @@ from core.concurrency import find_duplicates_by_hash_concurrent
 logger = logging.getLogger(__name__)
 
 
-def find_duplicates_by_size(file_paths: List[str]) -> Dict[int, List[str]]:
+def find_duplicates_by_size(file_paths: List[str], sizes: Sequence[int] = None) -> Dict[int, List[str]]:
     """
     Find duplicate files by comparing their sizes.
     
     Args:
         file_paths: List of file paths to check for duplicates
+        sizes: Optional sizes in bytes parallel to file_paths (e.g. from
+            SizedPaths); when given, the files are not statted again
         
     Returns:
         Dictionary mapping file sizes to lists of duplicate file paths
     """
     size_map: Dict[int, List[str]] = {}
     
+    if sizes is not None:
+        for file_path, size in zip(file_paths, sizes):
+            size_map.setdefault(int(size), []).append(file_path)
+        duplicates = {size: paths for size, paths in size_map.items() if len(paths) > 1}
+        logger.info(f"Found {len(duplicates)} groups of duplicate files by size")
+        return duplicates
+    
     for file_path in file_paths:
         try:
             size = os.path.getsize(file_path)
@@ -129,7 +140,8 @@ def find_all_duplicates(
     prefix_rules: List[str] = None,
     containing_rules: List[str] = None,
     regex_rules: List[str] = None,
-    image_similarity_threshold: int = 10
+    image_similarity_threshold: int = 10,
+    hash_cache: HashCache = None
 ) -> Dict[str, Dict[str, List[str]]]:
     """
     Find duplicate files using all available methods.
@@ -153,44 +165,48 @@ def find_all_duplicates(
         containing_rules: Substrings to look for in filenames
         regex_rules: Regex patterns to match
         image_similarity_threshold: Threshold for image similarity detection (not used in this module)
+        hash_cache: Optional HashCache so repeat scans only hash new or changed files
         
     Returns:
         Dictionary mapping detection method names to their results
     """
     logger.info(f"Starting comprehensive duplicate scan of: {directory_path}")
     
-    # First, scan for all files
-    all_file_paths = list(scan_directory_for_files(directory_path, extensions))
-    logger.info(f"Found {len(all_file_paths)} files before filtering")
-    
-    # Apply ignore list filtering if provided
-    if ignore_list:
-        logger.info("Applying ignore list filtering...")
-        file_paths = ignore_list.filter_paths(all_file_paths)
-        logger.info(f"Files after ignore list filtering: {len(file_paths)}")
-    else:
-        file_paths = all_file_paths
-    
-    # Apply size filtering if thresholds are provided
+    # Scan, then apply the ignore list and size limits in a single pass
     if min_file_size_mb is not None or max_file_size_mb is not None:
         logger.info(f"Applying size filtering (min: {min_file_size_mb}, max: {max_file_size_mb})")
-        file_paths, excluded_by_size = filter_files_by_size(
-            file_paths, 
-            min_size_mb=min_file_size_mb, 
-            max_size_mb=max_file_size_mb
-        )
-        logger.info(f"Files after size filtering: {len(file_paths)}")
+    # Hash and size detection need sizes; keep the stat taken from each scanned entry
+    file_stats = {} if use_hash or use_size else None
+    classification = classify(
+        scan_directory_for_entries(directory_path, extensions),
+        min_size_mb=min_file_size_mb,
+        max_size_mb=max_file_size_mb,
+        ignore_list=ignore_list,
+        stats=file_stats
+    )
+    file_paths = classification.kept
+    logger.info(f"Found {len(file_paths) + len(classification.excluded)} files before filtering")
+    logger.info(f"Files after ignore list and size filtering: {len(file_paths)} "
+                f"({len(classification.excluded)} excluded)")
     
     results = {}
     
+    if file_stats is not None:
+        sized_paths = [file_path for file_path in file_paths if file_path in file_stats]
+        sizes = [file_stats[file_path].st_size for file_path in sized_paths]
+    
     if use_hash and file_paths:
         logger.info("Starting hash-based duplicate detection...")
-        # Use concurrent processing for hash-based detection
-        results['hash'] = find_duplicates_by_hash_concurrent(file_paths)
+        # Use concurrent processing for hash-based detection, skipping files
+        # whose size is unique since they cannot have identical content
+        hash_candidates, _ = filter_unique_by_size(sized_paths, sizes)
+        results['hash'] = (find_duplicates_by_hash_concurrent(hash_candidates, hash_cache=hash_cache,
+                                                              stats=file_stats)
+                           if hash_candidates else {})
     
     if use_size and file_paths:
         logger.info("Starting size-based duplicate detection...")
-        results['size'] = find_duplicates_by_size(file_paths)
+        results['size'] = find_duplicates_by_size(sized_paths, sizes)
     
     if use_filename and file_paths:
         logger.info("Starting filename-based duplicate detection...")
@@ -240,60 +256,129 @@ def find_all_duplicates(
     return results
 
 
-def find_all_duplicates_with_models(settings: ScanSettings) -> List[DuplicateGroup]:
+def _file_info(file_path: str, file_stats: Dict[str, os.stat_result],
+               file_infos: Dict[str, FileInfo] = None) -> FileInfo:
+    """
+    Build a FileInfo, reusing the stat taken during the scan when there is one.
+    
+    Args:
+        file_path: Path to the file
+        file_stats: Stat results by path; files missing from it are statted
+            and added, so each file is statted at most once per scan
+        file_infos: Optional FileInfo models by path; a file found by several
+            detection methods is then built (and validated) only once
+        
+    Returns:
+        FileInfo model for the file
+    """
+    if file_infos is not None and file_path in file_infos:
+        return file_infos[file_path]
+    stat = file_stats.get(file_path)
+    if stat is None:
+        stat = file_stats[file_path] = os.stat(file_path)
+    path_obj = Path(file_path)
+    file_info = FileInfo(
+        path=path_obj,
+        size=stat.st_size,
+        created_timestamp=stat.st_ctime,
+        modified_timestamp=stat.st_mtime,
+        extension=path_obj.suffix.lower(),
+        name=path_obj.name
+    )
+    if file_infos is not None:
+        file_infos[file_path] = file_info
+    return file_info
+
+
+def find_all_duplicates_with_models(settings: ScanSettings, hash_cache: HashCache = None) -> List[DuplicateGroup]:
     """
     Find duplicate files using all available methods with Pydantic models.
     
     Args:
         settings: ScanSettings model containing all scan parameters
+        hash_cache: Optional HashCache so repeat scans only hash new or changed files
         
     Returns:
         List of DuplicateGroup models containing the duplicate groups
     """
+    duplicate_groups, _ = find_all_duplicates_with_models_and_count(settings, hash_cache=hash_cache)
+    return duplicate_groups
+
+
+def find_all_duplicates_with_models_and_count(
+    settings: ScanSettings,
+    hash_cache: HashCache = None
+) -> Tuple[List[DuplicateGroup], int]:
+    """
+    Find duplicate files like find_all_duplicates_with_models, also reporting
+    how many files the directory walk found.
+    
+    The count comes from the same walk used for detection, so callers that
+    need it for a ScanResult do not have to traverse the tree again.
+    
+    Args:
+        settings: ScanSettings model containing all scan parameters
+        hash_cache: Optional HashCache so repeat scans only hash new or changed files
+        
+    Returns:
+        Tuple of (list of DuplicateGroup models, number of files found by the scan
+        before size filtering)
+    """
     logger.info(f"Starting comprehensive duplicate scan with models for: {settings.directory}")
     
     # First, scan for all files
-    extensions = settings.extensions or [
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp',
-        '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.txt', '.pdf',
-        '.doc', '.docx', '.xls', '.xlsx'
-    ]
-    
-    all_file_paths = list(scan_directory_for_files(str(settings.directory), extensions))
-    logger.info(f"Found {len(all_file_paths)} files before filtering")
-    
-    # Apply size filtering if thresholds are provided
-    file_paths = all_file_paths
-    if settings.min_file_size_mb is not None or settings.max_file_size_mb is not None:
-        logger.info(f"Applying size filtering (min: {settings.min_file_size_mb}, max: {settings.max_file_size_mb})")
-        file_paths, excluded_by_size = filter_files_by_size(
-            file_paths, 
+    extensions = settings.extensions or DEFAULT_EXTENSIONS
+    
+    scanned_files_count = 0
+    
+    def walk_entries():
+        nonlocal scanned_files_count
+        for entry in scan_directory_for_entries(str(settings.directory), extensions,
+                                                settings.ignored_directories, settings.ignored_extensions):
+            scanned_files_count += 1
+            yield entry
+    
+    entries = walk_entries()
+    
+    # Stat during the walk, reusing the walk's DirEntry stats, when sizes are
+    # needed for filtering or detection; the sizes are kept for later stages
+    size_filtered = settings.min_file_size_mb is not None or settings.max_file_size_mb is not None
+    file_sizes = None
+    file_stats: Dict[str, os.stat_result] = {}
+    if size_filtered or settings.use_hash or settings.use_size:
+        if size_filtered:
+            logger.info(f"Applying size filtering (min: {settings.min_file_size_mb}, max: {settings.max_file_size_mb})")
+        file_paths, file_sizes, _ = collect_sized_paths(
+            entries, 
             min_size_mb=settings.min_file_size_mb, 
-            max_size_mb=settings.max_file_size_mb
+            max_size_mb=settings.max_file_size_mb,
+            stat_threads=settings.stat_threads,
+            stats=file_stats
         )
+    else:
+        # Neither filtering nor detection needs sizes; grouped files are
+        # statted later, one at a time, only to build their FileInfo
+        logger.debug("No size limits, size or hash detection: skipping size collection")
+        file_paths = [entry.path for entry in entries]
+    logger.info(f"Found {scanned_files_count} files before filtering")
+    if size_filtered:
         logger.info(f"Files after size filtering: {len(file_paths)}")
     
     duplicate_groups = []
+    # One FileInfo per file, shared by every group the file appears in
+    file_infos: Dict[str, FileInfo] = {}
     
     # Use hash-based detection with concurrent processing
     if settings.use_hash and file_paths:
         logger.info("Starting hash-based duplicate detection...")
-        hash_results = find_duplicates_by_hash_concurrent(file_paths)
+        # Files with a unique size cannot have identical content
+        hash_candidates, _ = filter_unique_by_size(file_paths, file_sizes)
+        hash_results = (find_duplicates_by_hash_concurrent(hash_candidates, hash_cache=hash_cache,
+                                                          stats=file_stats)
+                       if hash_candidates else {})
         for hash_value, file_list in hash_results.items():
             if len(file_list) > 1:  # Only include groups with actual duplicates
-                file_info_list = []
-                for fp in file_list:
-                    path_obj = Path(fp)
-                    stat = path_obj.stat()
-                    file_info = FileInfo(
-                        path=path_obj,
-                        size=stat.st_size,
-                        created_time=datetime.fromtimestamp(stat.st_ctime),
-                        modified_time=datetime.fromtimestamp(stat.st_mtime),
-                        extension=path_obj.suffix.lower(),
-                        name=path_obj.name
-                    )
-                    file_info_list.append(file_info)
+                file_info_list = [_file_info(fp, file_stats, file_infos) for fp in file_list]
                 
                 duplicate_groups.append(
                     DuplicateGroup(
@@ -306,22 +391,10 @@ def find_all_duplicates_with_models(settings: ScanSettings) -> List[DuplicateGro
     # Use size-based detection
     if settings.use_size and file_paths:
         logger.info("Starting size-based duplicate detection...")
-        size_results = find_duplicates_by_size(file_paths)
+        size_results = find_duplicates_by_size(file_paths, file_sizes)
         for size, file_list in size_results.items():
             if len(file_list) > 1:  # Only include groups with actual duplicates
-                file_info_list = []
-                for fp in file_list:
-                    path_obj = Path(fp)
-                    stat = path_obj.stat()
-                    file_info = FileInfo(
-                        path=path_obj,
-                        size=stat.st_size,
-                        created_time=datetime.fromtimestamp(stat.st_ctime),
-                        modified_time=datetime.fromtimestamp(stat.st_mtime),
-                        extension=path_obj.suffix.lower(),
-                        name=path_obj.name
-                    )
-                    file_info_list.append(file_info)
+                file_info_list = [_file_info(fp, file_stats, file_infos) for fp in file_list]
                 
                 duplicate_groups.append(
                     DuplicateGroup(
@@ -337,19 +410,7 @@ def find_all_duplicates_with_models(settings: ScanSettings) -> List[DuplicateGro
         filename_results = find_duplicates_by_filename(file_paths)
         for group_id, file_list in filename_results.items():
             if len(file_list) > 1:  # Only include groups with actual duplicates
-                file_info_list = []
-                for fp in file_list:
-                    path_obj = Path(fp)
-                    stat = path_obj.stat()
-                    file_info = FileInfo(
-                        path=path_obj,
-                        size=stat.st_size,
-                        created_time=datetime.fromtimestamp(stat.st_ctime),
-                        modified_time=datetime.fromtimestamp(stat.st_mtime),
-                        extension=path_obj.suffix.lower(),
-                        name=path_obj.name
-                    )
-                    file_info_list.append(file_info)
+                file_info_list = [_file_info(fp, file_stats, file_infos) for fp in file_list]
                 
                 duplicate_groups.append(
                     DuplicateGroup(
@@ -373,19 +434,7 @@ def find_all_duplicates_with_models(settings: ScanSettings) -> List[DuplicateGro
         custom_results = find_duplicates_by_custom_rules(file_paths, custom_rules, rule_names)
         for rule_name, file_list in custom_results.items():
             if len(file_list) > 1:  # Only include groups with actual duplicates
-                file_info_list = []
-                for fp in file_list:
-                    path_obj = Path(fp)
-                    stat = path_obj.stat()
-                    file_info = FileInfo(
-                        path=path_obj,
-                        size=stat.st_size,
-                        created_time=datetime.fromtimestamp(stat.st_ctime),
-                        modified_time=datetime.fromtimestamp(stat.st_mtime),
-                        extension=path_obj.suffix.lower(),
-                        name=path_obj.name
-                    )
-                    file_info_list.append(file_info)
+                file_info_list = [_file_info(fp, file_stats, file_infos) for fp in file_list]
                 
                 duplicate_groups.append(
                     DuplicateGroup(
@@ -397,7 +446,7 @@ def find_all_duplicates_with_models(settings: ScanSettings) -> List[DuplicateGro
     
     logger.info(f"Completed duplicate detection with models. Found {len(duplicate_groups)} groups")
     
-    return duplicate_groups
+    return duplicate_groups, scanned_files_count
 
 
 def merge_duplicate_groups(results: Dict[str, Dict[str, List[str]]]) -> List[List[str]]:
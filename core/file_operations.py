@@ -18,6 +18,7 @@ DEPENDENCIES:
 - pathlib: For path manipulation
 - typing: For type hints (List, Tuple)
 - PIL (Pillow): For image resolution comparison in 'lowest_res' strategy
+- core.pipeline: For the set of image extensions
 - logging: For logging operations
 
 USAGE:
@@ -34,9 +35,11 @@ Use the main functions to perform safe file operations:
 The module provides safe operations that prevent accidental permanent data loss.
 """
 from send2trash import send2trash
+from os.path import splitext
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import logging
+from core.pipeline import IMAGE_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
@@ -66,18 +69,26 @@ def safe_delete_files(file_paths: List[str]) -> Tuple[List[str], List[str]]:
     return successful, failed
 
 
-def auto_select_duplicates_for_deletion(duplicate_groups: List[List[str]], strategy: str = 'oldest') -> List[str]:
+def auto_select_duplicates_for_deletion(duplicate_groups: List[List[str]], strategy: str = 'oldest',
+                                        mtimes: Optional[Dict[str, float]] = None) -> List[str]:
     """
     Auto-select duplicates for deletion based on a strategy.
     
     Args:
         duplicate_groups: List of duplicate file groups (each group is a list of file paths)
         strategy: Selection strategy ('oldest', 'newest', 'lowest_res')
+        mtimes: Optional modification times by path, e.g. from the FileInfo models
+            of a scan; files missing from it are statted
         
     Returns:
         List of file paths selected for deletion
     """
     files_to_delete = []
+    mtimes = mtimes or {}
+    
+    def get_mtime(file_path: str) -> float:
+        mtime = mtimes.get(file_path)
+        return mtime if mtime is not None else Path(file_path).stat().st_mtime
     
     for group in duplicate_groups:
         if len(group) <= 1:
@@ -85,15 +96,15 @@ def auto_select_duplicates_for_deletion(duplicate_groups: List[List[str]], strat
             
         if strategy == 'oldest':
             # Find the oldest file in the group
-            oldest_file = min(group, key=lambda f: Path(f).stat().st_mtime)
+            oldest_file = min(group, key=get_mtime)
             files_to_delete.append(oldest_file)
         elif strategy == 'newest':
             # Find the newest file in the group
-            newest_file = max(group, key=lambda f: Path(f).stat().st_mtime)
+            newest_file = max(group, key=get_mtime)
             files_to_delete.append(newest_file)
         elif strategy == 'lowest_res':
             # For image files, find the one with the lowest resolution
-            image_files = [f for f in group if Path(f).suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']]
+            image_files = [f for f in group if splitext(f)[1].lower() in IMAGE_EXTENSIONS]
             if image_files:
                 try:
                     from PIL import Image
@@ -105,11 +116,11 @@ def auto_select_duplicates_for_deletion(duplicate_groups: List[List[str]], strat
                 except Exception as e:
                     logger.error(f"Error determining image resolution: {e}")
                     # Fallback to oldest if resolution check fails
-                    oldest_file = min(group, key=lambda f: Path(f).stat().st_mtime)
+                    oldest_file = min(group, key=get_mtime)
                     files_to_delete.append(oldest_file)
             else:
                 # For non-image files, default to oldest
-                oldest_file = min(group, key=lambda f: Path(f).stat().st_mtime)
+                oldest_file = min(group, key=get_mtime)
                 files_to_delete.append(oldest_file)
     
     logger.info(f"Auto-selected {len(files_to_delete)} files for deletion using '{strategy}' strategy")
@@ -46,6 +46,36 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Duplicate indicators removed by normalize_filename (and by
+# core.advanced_grouping.normalize_for_grouping), applied in this order:
+# - Numbers with underscores like "_1", "_2", etc., and "_copy"/"_duplicate"
+# - Numbers in parentheses like "(1)", "(2)", and "(copy)"/"(duplicate)"
+# - Common variations of "copy" and "duplicate" after a space
+DUPLICATE_INDICATOR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'_[0-9]+$',
+    r'_copy$',
+    r'_duplicate$',
+    r'_duplicates$',
+    r'\([0-9]+\)$',
+    r'\(copy\)$',
+    r'\(duplicate\)$',
+    r' copy$',
+    r' duplicate$',
+    r' \([Cc]opy\)$',
+    r' \([Dd]uplicate\)$',
+))
+
+# Default patterns for common duplicate naming conventions, compiled once
+# as (pattern, compiled_pattern) pairs
+_DEFAULT_DUPLICATE_PATTERNS = tuple((pattern, re.compile(pattern, re.IGNORECASE)) for pattern in (
+    r'(.+?)_[0-9]+$',           # matches "name_1", "name_2", etc.
+    r'(.+?)\([0-9]+\)$',        # matches "name(1)", "name(2)", etc.
+    r'(.+?) \([0-9]+\)$',       # matches "name (1)", "name (2)", etc.
+    r'(.+?) copy$',             # matches "name copy"
+    r'(.+?) \([Cc]opy\)$',      # matches "name (Copy)"
+    r'(.+?) duplicate$',        # matches "name duplicate"
+))
+
 
 def normalize_filename(filename: str) -> str:
     """
@@ -61,28 +91,10 @@ def normalize_filename(filename: str) -> str:
     path = Path(filename)
     stem = path.stem.lower()
     
-    # Remove common duplicate indicators:
-    # - Numbers with underscores like "_1", "_2", etc.
-    # - Numbers in parentheses like "(1)", "(2)", etc.
-    # - "copy" in various forms
-    # - "duplicate" in various forms
-    
-    # Remove patterns like _1, _2, _copy, _duplicate
-    stem = re.sub(r'_[0-9]+$', '', stem)
-    stem = re.sub(r'_copy$', '', stem)
-    stem = re.sub(r'_duplicate$', '', stem)
-    stem = re.sub(r'_duplicates$', '', stem)
-    
-    # Remove patterns like (1), (2), (copy), (duplicate)
-    stem = re.sub(r'\([0-9]+\)$', '', stem)
-    stem = re.sub(r'\(copy\)$', '', stem)
-    stem = re.sub(r'\(duplicate\)$', '', stem)
-    
-    # Remove common variations of "copy" and "duplicate"
-    stem = re.sub(r' copy$', '', stem)
-    stem = re.sub(r' duplicate$', '', stem)
-    stem = re.sub(r' \([Cc]opy\)$', '', stem)
-    stem = re.sub(r' \([Dd]uplicate\)$', '', stem)
+    # Strip the duplicate indicators in order; each pattern sees the result
+    # of the ones before it
+    for pattern in DUPLICATE_INDICATOR_PATTERNS:
+        stem = pattern.sub('', stem)
     
     return stem
 
@@ -161,26 +173,22 @@ def find_duplicates_by_patterns(file_paths: List[str], custom_patterns: List[str
     """
     pattern_groups: Dict[str, List[str]] = {}
     
-    # Default patterns for common duplicate naming conventions
-    default_patterns = [
-        r'(.+?)_[0-9]+$',           # matches "name_1", "name_2", etc.
-        r'(.+?)\([0-9]+\)$',        # matches "name(1)", "name(2)", etc.
-        r'(.+?) \([0-9]+\)$',       # matches "name (1)", "name (2)", etc.
-        r'(.+?) copy$',             # matches "name copy"
-        r'(.+?) \([Cc]opy\)$',      # matches "name (Copy)"
-        r'(.+?) duplicate$',        # matches "name duplicate"
-    ]
-    
-    # Add custom patterns if provided
-    all_patterns = default_patterns + (custom_patterns or [])
+    # The defaults are precompiled; only custom patterns are compiled per call
+    custom_patterns = custom_patterns or []
+    compiled_patterns = list(_DEFAULT_DUPLICATE_PATTERNS)
+    for pattern in custom_patterns:
+        try:
+            compiled_patterns.append((pattern, re.compile(pattern, re.IGNORECASE)))
+        except re.error as e:
+            logger.error(f"Invalid regex pattern: {pattern}, Error: {e}")
     
     for file_path in file_paths:
         try:
             path_obj = Path(file_path)
             stem = path_obj.stem
             
-            for pattern in all_patterns:
-                match = re.match(pattern, stem, re.IGNORECASE)
+            for pattern, compiled_pattern in compiled_patterns:
+                match = compiled_pattern.match(stem)
                 if match:
                     # Use the pattern as a key for grouping
                     pattern_key = f"pattern:{pattern}"
@@ -191,7 +199,7 @@ def find_duplicates_by_patterns(file_paths: List[str], custom_patterns: List[str
         except Exception as e:
             logger.error(f"Error processing file {file_path} with patterns: {e}")
     
-    logger.info(f"Applied {len(all_patterns)} patterns and found {len(pattern_groups)} pattern groups")
+    logger.info(f"Applied {len(_DEFAULT_DUPLICATE_PATTERNS) + len(custom_patterns)} patterns and found {len(pattern_groups)} pattern groups")
     
     return pattern_groups
 
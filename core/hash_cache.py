@@ -0,0 +1,157 @@
+"""
+Hash cache module for the Duplicate File Finder application.
+
+PURPOSE:
+This module provides a persistent cache of content hashes keyed by path and
+validated by each file's size and modification time (in nanoseconds). A
+repeated scan only has to read and hash files that were added or changed
+since the last scan; every other hash comes from the cache after one stat.
+
+RELATIONSHIPS:
+- Used by: core.concurrency when a HashCache is passed to calculate_hashes_concurrent;
+  main.py opens one at DEFAULT_HASH_CACHE_PATH for every hash scan
+- Uses: sqlite3 for storage
+- Depends on: os, sqlite3, time, typing, logging
+- Provides: HashCache for incremental content hashing
+
+DEPENDENCIES:
+- os: For the default cache location
+- sqlite3: For the on-disk cache table
+- time: For pruning entries that have not been seen for a while
+
+USAGE:
+Create a cache and use it for lookups and updates:
+    from core.hash_cache import HashCache
+    
+    cache = HashCache("hash_cache.db")
+    cached = cache.get_hashes([(path, size, mtime_ns), ...], "XXH3_128")  # {path: hash}
+    cache.update([(path, size, mtime_ns, file_hash), ...], "XXH3_128")
+    cache.close()
+
+An entry is only used when the file's current size and mtime_ns both match
+and it was produced by the same hash algorithm, so changing the hasher
+invalidates old entries. SQLite's own locking (WAL mode) lets several
+processes share one cache file safely.
+"""
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Paths per IN (...) lookup, below SQLite's bound-parameter limit on old builds
+_LOOKUP_BATCH_SIZE = 900
+
+# Per-user cache used by the command-line application, next to its settings
+DEFAULT_HASH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".duplicate_file_finder", "hash_cache.db")
+
+
+class HashCache:
+    """
+    A persistent (path, size, mtime_ns) -> content hash cache backed by SQLite.
+    """
+    
+    def __init__(self, db_path: str = "hash_cache.db"):
+        """
+        Open (and create if needed) the hash cache.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ':memory:':
+            # Ensure the directory exists
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS hash_cache (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+    
+    def get_hashes(self, entries: Iterable[Tuple[str, int, int]], algorithm: str) -> Dict[str, str]:
+        """
+        Look up cached hashes for files that are unchanged since they were hashed.
+        
+        Args:
+            entries: Tuples of (path, size in bytes, st_mtime_ns) from a fresh stat
+            algorithm: Name of the hash algorithm the caller would use
+        
+        Returns:
+            Dictionary mapping each unchanged, cached path to its hash; paths
+            missing from the result need to be hashed
+        """
+        current = {path: (size, mtime_ns) for path, size, mtime_ns in entries}
+        paths = list(current)
+        hashes = {}
+        
+        for start in range(0, len(paths), _LOOKUP_BATCH_SIZE):
+            batch = paths[start:start + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = self.conn.execute(f"""
+                SELECT path, size, mtime_ns, hash FROM hash_cache
+                WHERE path IN ({placeholders}) AND algorithm = ?
+            """, (*batch, algorithm))
+            for path, size, mtime_ns, file_hash in cursor:
+                if current[path] == (size, mtime_ns):
+                    hashes[path] = file_hash
+        
+        return hashes
+    
+    def update(self, entries: Iterable[Tuple[str, int, int, str]], algorithm: str):
+        """
+        Record freshly hashed files in the cache.
+        
+        Args:
+            entries: Tuples of (path, size in bytes, st_mtime_ns, hash)
+            algorithm: Name of the hash algorithm that produced the hashes
+        """
+        now = time.time()
+        rows = [(path, size, mtime_ns, algorithm, file_hash, now)
+                for path, size, mtime_ns, file_hash in entries]
+        if not rows:
+            return
+        
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO hash_cache (path, size, mtime_ns, algorithm, hash, seen_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+    
+    def prune(self, max_age_seconds: float):
+        """
+        Remove entries hashed longer ago than max_age_seconds, e.g. to drop
+        files that were deleted or moved. Files that still exist are simply
+        hashed again on their next scan.
+        
+        Args:
+            max_age_seconds: Entries written longer ago than this are removed
+        
+        Returns:
+            Number of entries removed
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM hash_cache WHERE seen_at < ?",
+                                       (time.time() - max_age_seconds,))
+        return cursor.rowcount
+    
+    def clear(self):
+        """Remove every entry from the cache."""
+        with self.conn:
+            self.conn.execute("DELETE FROM hash_cache")
+    
+    def close(self):
+        """Close the cache database."""
+        self.conn.close()
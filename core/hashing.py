@@ -2,14 +2,14 @@
 Hashing module for duplicate file detection.
 
 PURPOSE:
-This module provides functions to calculate file hashes using xxhash for fast performance.
+This module provides functions to calculate file hashes using xxhash (XXH3) for fast performance.
 It implements memory-efficient file reading and hash calculation, which is crucial for
 detecting exact duplicate files. The module also provides functions to get file
 information and group files by hash values.
 
 RELATIONSHIPS:
 - Used by: core.duplicate_detection, main application flow
-- Uses: core.concurrency for concurrent hash calculation
+- Uses: core.concurrency for concurrent hash calculation, core.size_filtering for size bucketing
 - Depends on: xxhash, pathlib, typing, logging
 - Provides: Core duplicate detection capability based on hash comparison
 
@@ -21,35 +21,61 @@ DEPENDENCIES:
 
 USAGE:
 Use the main functions to calculate hashes and find duplicates:
-    from core.hashing import get_hash, find_duplicates_by_hash, find_duplicates_by_hash_models
+    from core.hashing import (get_hash, get_hash_pipelined, get_signature_hash,
+                              find_duplicates_by_hash, find_duplicates_by_hash_models)
     
     # Calculate hash for a single file
     file_hash = get_hash("/path/to/file.txt")
     
+    # Hash a large file with reads and hashing overlapped
+    file_hash = get_hash_pipelined("/path/to/video.mp4")
+    
     # Find duplicates by hash from a list of files
     duplicates = find_duplicates_by_hash(["/path/to/file1.txt", "/path/to/file2.txt"])
     
-    # Get duplicates as Pydantic models
+    # Get duplicates as Pydantic models (files are pre-bucketed by a
+    # head+tail+size signature and only signature matches are fully hashed)
     duplicates_models = find_duplicates_by_hash_models(file_paths)
 
 The module uses memory-efficient chunked reading for large files and handles errors gracefully.
 """
+import os
+import queue
+import threading
 import xxhash
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 import logging
-from datetime import datetime
 from core.models import FileInfo, FileHash
+from core.hash_cache import HashCache
+from core.size_filtering import filter_unique_by_size, get_file_stats
 
 # Import concurrent processing functions
-from core.concurrency import find_duplicates_by_hash_concurrent, calculate_hashes_concurrent
+from core.concurrency import (
+    CONTENT_HASHER,
+    read_buffer,
+    find_duplicates_by_hash_concurrent,
+    calculate_hashes_concurrent,
+    process_files_concurrent
+)
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are hashed with the double-buffered reader
+PIPELINE_MIN_SIZE = 10 * 1024 * 1024  # 10MB
+_PIPELINE_CHUNK_SIZE = 1024 * 1024  # 1MB per buffer
+
+# Bytes read from each end of a file for its signature hash
+SIGNATURE_CHUNK_SIZE = 64 * 1024  # 64KB
+
 
 def get_hash(filepath: str) -> str:
     """
-    Calculate xxhash for a file using memory-efficient chunked reading.
+    Calculate the XXH3-128 content hash of a file using memory-efficient
+    chunked reading.
+    
+    Large files (>= PIPELINE_MIN_SIZE) are hashed with a double-buffered
+    pipeline so that reading and hashing overlap.
     
     Args:
         filepath: Path to the file to hash
@@ -57,12 +83,14 @@ def get_hash(filepath: str) -> str:
     Returns:
         Hex digest of the file's hash
     """
-    h = xxhash.xxh64()
-    b = bytearray(128 * 1024)  # 128KB chunks
-    mv = memoryview(b)
+    h = CONTENT_HASHER()
     
     try:
         with open(filepath, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size >= PIPELINE_MIN_SIZE:
+                return _hash_stream_pipelined(f)
+            
+            mv = read_buffer()
             while n := f.readinto(mv):
                 h.update(mv[:n])
         return h.hexdigest()
@@ -71,6 +99,147 @@ def get_hash(filepath: str) -> str:
         return ""
 
 
+def get_hash_pipelined(filepath: str) -> str:
+    """
+    Calculate the content hash of a file, overlapping disk reads with hashing.
+    
+    A reader thread fills one 1MB buffer while the calling thread hashes
+    the other, so the disk and the hash function are busy at the same time.
+    
+    Args:
+        filepath: Path to the file to hash
+        
+    Returns:
+        Hex digest of the file's hash, or empty string if error
+    """
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            return _hash_stream_pipelined(f)
+    except (OSError, IOError) as e:
+        logger.error(f"Error reading file {filepath}: {e}")
+        return ""
+
+
+def _hash_stream_pipelined(f: BinaryIO) -> str:
+    """
+    Hash an open binary file using two buffers swapped between a reader
+    thread and the calling thread. Read errors are re-raised here.
+    """
+    h = CONTENT_HASHER()
+    free_buffers: queue.Queue = queue.Queue()
+    filled_buffers: queue.Queue = queue.Queue()
+    for _ in range(2):
+        free_buffers.put(bytearray(_PIPELINE_CHUNK_SIZE))
+    read_errors: List[BaseException] = []
+    
+    def reader():
+        try:
+            while True:
+                buf = free_buffers.get()
+                n = f.readinto(buf)
+                if not n:
+                    break
+                filled_buffers.put((buf, n))
+        except BaseException as e:
+            read_errors.append(e)
+        finally:
+            # Always wake the consumer, whatever stopped the reader
+            filled_buffers.put((None, 0))
+    
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+    
+    while True:
+        buf, n = filled_buffers.get()
+        if not n:
+            break
+        h.update(memoryview(buf)[:n])
+        free_buffers.put(buf)
+    
+    reader_thread.join()
+    if read_errors:
+        raise read_errors[0]
+    return h.hexdigest()
+
+
+def get_signature_hash(filepath: str, size: int = None) -> str:
+    """
+    Calculate a cheap signature hash from a file's size, head and tail.
+    
+    The signature covers the file size plus the first and last
+    SIGNATURE_CHUNK_SIZE bytes, so files with different signatures can
+    never be identical. Matching signatures still need a full hash.
+    
+    Args:
+        filepath: Path to the file
+        size: File size in bytes, if already known
+        
+    Returns:
+        Hex digest of the signature, or empty string if error
+    """
+    h = xxhash.xxh3_64()
+    
+    try:
+        with open(filepath, 'rb', buffering=0) as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+            h.update(size.to_bytes(8, 'little'))
+            h.update(f.read(SIGNATURE_CHUNK_SIZE))
+            if size > SIGNATURE_CHUNK_SIZE:
+                # Don't re-read bytes already covered by the head chunk
+                f.seek(max(size - SIGNATURE_CHUNK_SIZE, SIGNATURE_CHUNK_SIZE))
+                h.update(f.read(SIGNATURE_CHUNK_SIZE))
+        return h.hexdigest()
+    except (OSError, IOError) as e:
+        logger.error(f"Error reading signature of file {filepath}: {e}")
+        return ""
+
+
+def _filter_by_signature(file_paths: List[str], sizes: Dict[str, int]) -> List[str]:
+    """
+    Drop files whose head+tail+size signature no other file shares.
+    
+    Files small enough that the signature would read them whole are kept
+    without one, since their full hash costs the same read.
+    """
+    whole_read_size = 2 * SIGNATURE_CHUNK_SIZE
+    kept = [fp for fp in file_paths if sizes[fp] <= whole_read_size]
+    large = [fp for fp in file_paths if sizes[fp] > whole_read_size]
+    
+    path_to_signature = process_files_concurrent(
+        large, lambda filepath: (filepath, get_signature_hash(filepath, sizes[filepath])))
+    signature_map: Dict[str, List[str]] = {}
+    for filepath, signature in path_to_signature.items():
+        signature_map.setdefault(signature, []).append(filepath)
+    kept.extend(fp for paths in signature_map.values() if len(paths) > 1 for fp in paths)
+    
+    logger.info(f"Signature pass kept {len(kept)} of {len(file_paths)} files for full hashing")
+    return kept
+
+
+def _hash_candidates(file_paths: List[str],
+                     hash_cache: HashCache = None) -> Tuple[List[str], Dict[str, os.stat_result]]:
+    """
+    Narrow file_paths down to the files that need a full content hash.
+    
+    Each file is statted once and files with a unique size are dropped.
+    Without a hash cache, larger files are also bucketed by signature.
+    
+    Args:
+        file_paths: List of file paths to check for duplicates
+        hash_cache: Optional HashCache; when given the signature pass is skipped
+        
+    Returns:
+        Tuple of (candidate paths, stat results by path for every readable file)
+    """
+    stats = {path: st for path, st in zip(file_paths, get_file_stats(file_paths)) if st is not None}
+    readable = list(stats)
+    candidates, _ = filter_unique_by_size(readable, [stats[path].st_size for path in readable])
+    if hash_cache is None and candidates:
+        candidates = _filter_by_signature(candidates, {path: stats[path].st_size for path in candidates})
+    return candidates, stats
+
+
 def get_file_info(filepath: str) -> FileInfo:
     """
     Get detailed information about a file and return as a FileInfo model.
@@ -88,8 +257,8 @@ def get_file_info(filepath: str) -> FileInfo:
         return FileInfo(
             path=path_obj,
             size=stat.st_size,
-            created_time=datetime.fromtimestamp(stat.st_ctime),
-            modified_time=datetime.fromtimestamp(stat.st_mtime),
+            created_timestamp=stat.st_ctime,
+            modified_timestamp=stat.st_mtime,
             extension=path_obj.suffix.lower(),
             name=path_obj.name
         )
@@ -115,18 +284,36 @@ def get_file_size(filepath: str) -> int:
         return -1
 
 
-def find_duplicates_by_hash(file_paths: List[str]) -> Dict[str, List[str]]:
+def find_duplicates_by_hash(file_paths: List[str], hash_cache: Optional[HashCache] = None) -> Dict[str, List[str]]:
     """
     Find duplicate files by comparing their hashes.
     
+    Each file is statted once. Files are bucketed by size and only files
+    sharing a size are considered; the same stat results are reused for
+    ordering and hash cache keys.
+    
+    Without a hash cache, larger candidates are then bucketed by their
+    head+tail signature, so files that differ early are never read in full.
+    With a cache the signature pass is skipped, since unchanged files need
+    no read at all.
+    
+    Hashing runs on a thread pool. Both file reads and xxhash release the
+    GIL, so the threads already use every core without the start-up and
+    pickling cost of worker processes.
+    
     Args:
         file_paths: List of file paths to check for duplicates
+        hash_cache: Optional HashCache so unchanged files are not hashed again
         
     Returns:
         Dictionary mapping hash values to lists of duplicate file paths
     """
+    candidates, stats = _hash_candidates(file_paths, hash_cache)
+    if not candidates:
+        return {}
+    
     # Use concurrent processing for better performance
-    return find_duplicates_by_hash_concurrent(file_paths)
+    return find_duplicates_by_hash_concurrent(candidates, hash_cache=hash_cache, stats=stats)
 
 
 def find_duplicates_by_hash_models(file_paths: List[str]) -> List[FileHash]:
@@ -139,8 +326,11 @@ def find_duplicates_by_hash_models(file_paths: List[str]) -> List[FileHash]:
     Returns:
         List of FileHash models containing hash values and their duplicate file paths
     """
+    # Same size and signature pre-filters as find_duplicates_by_hash
+    candidates, stats = _hash_candidates(file_paths)
+    
     # Use concurrent processing to calculate hashes
-    path_to_hash = calculate_hashes_concurrent(file_paths)
+    path_to_hash = calculate_hashes_concurrent(candidates, stats=stats) if candidates else {}
     
     # Group files by hash
     hash_map: Dict[str, List[Path]] = {}
@@ -57,11 +57,14 @@ This module helps optimize scanning by excluding unnecessary files and directori
 import os
 import re
 from pathlib import Path
-from typing import List, Set, Pattern, Union, Tuple
+from typing import Dict, List, Optional, Set, Pattern, Union, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of path verdicts kept by IgnoreList before the oldest are evicted
+_IGNORED_CACHE_MAX = 200_000
+
 
 class IgnoreList:
     """
@@ -74,15 +77,62 @@ class IgnoreList:
         self.ignored_patterns: List[Pattern] = []
         self.ignored_extensions: Set[str] = set()
         self.ignored_sizes: List[Tuple[int, int]] = []  # (min_size, max_size) in bytes
+        # Path-rule verdicts keyed on normalized path (FIFO-bounded)
+        self._ignored_cache: Dict[str, bool] = {}
+        # Directory and pattern rules combined into single regexes, built on first use
+        self._dir_regex: Optional[Pattern] = None
+        self._pattern_regex: Optional[Pattern] = None
+        self._regexes_built = False
+    
+    def clear_cache(self):
+        """Forget cached ignore verdicts (called whenever a rule changes)."""
+        self._ignored_cache.clear()
+        self._regexes_built = False
+    
+    def _build_regexes(self):
+        """
+        Combine the directory rules into one prefix regex and the pattern
+        rules into one alternation, so each path costs one C-level match per
+        rule kind instead of a Python loop over every rule.
+        """
+        self._dir_regex = None
+        if self.ignored_dirs:
+            # A directory matches itself or anything below it; a root such as
+            # "/" already ends with the separator
+            sep = re.escape(os.sep)
+            alternatives = []
+            for ignored_dir in self.ignored_dirs:
+                case_dir = os.path.normcase(ignored_dir)
+                if case_dir.endswith(os.sep):
+                    alternatives.append(re.escape(case_dir))
+                else:
+                    alternatives.append(f"{re.escape(case_dir)}(?:{sep}|$)")
+            self._dir_regex = re.compile("|".join(alternatives))
+        
+        self._pattern_regex = None
+        # Joining patterns renumbers their groups, which would break numbered
+        # backreferences, so only group-free patterns are combined
+        if len(self.ignored_patterns) > 1 and all(pattern.groups == 0 for pattern in self.ignored_patterns):
+            try:
+                self._pattern_regex = re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in self.ignored_patterns), re.IGNORECASE)
+            except re.error:
+                # e.g. inline global flags such as (?s), which are only valid
+                # at the start of a pattern; match the patterns one by one instead
+                self._pattern_regex = None
+        
+        self._regexes_built = True
     
     def add_file(self, file_path: str):
         """Add a specific file to the ignore list."""
         self.ignored_files.add(os.path.normpath(file_path))
+        self.clear_cache()
         logger.info(f"Added file to ignore list: {file_path}")
     
     def add_directory(self, dir_path: str):
         """Add a directory to the ignore list."""
         self.ignored_dirs.add(os.path.normpath(dir_path))
+        self.clear_cache()
         logger.info(f"Added directory to ignore list: {dir_path}")
     
     def add_pattern(self, pattern: str):
@@ -90,6 +140,7 @@ class IgnoreList:
         try:
             compiled_pattern = re.compile(pattern, re.IGNORECASE)
             self.ignored_patterns.append(compiled_pattern)
+            self.clear_cache()
             logger.info(f"Added pattern to ignore list: {pattern}")
         except re.error as e:
             logger.error(f"Invalid regex pattern: {pattern}, Error: {e}")
@@ -99,6 +150,7 @@ class IgnoreList:
         if not extension.startswith('.'):
             extension = '.' + extension
         self.ignored_extensions.add(extension.lower())
+        self.clear_cache()
         logger.info(f"Added extension to ignore list: {extension}")
     
     def add_size_range(self, min_size_mb: float, max_size_mb: float):
@@ -118,41 +170,69 @@ class IgnoreList:
         Returns:
             True if the path should be ignored, False otherwise
         """
-        path_obj = Path(path)
+        if not self._any_rules:
+            return False
+        
         norm_path = os.path.normpath(path)
         
-        # Check if it's an exact file match
-        if norm_path in self.ignored_files:
+        ignored = self._ignored_cache.get(norm_path)
+        if ignored is None:
+            ignored = self._matches_path_rules(norm_path)
+            if len(self._ignored_cache) >= _IGNORED_CACHE_MAX:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del self._ignored_cache[next(iter(self._ignored_cache))]
+            self._ignored_cache[norm_path] = ignored
+        if ignored:
             return True
         
-        # Check if it's in an ignored directory
-        for ignored_dir in self.ignored_dirs:
+        # Size ranges are checked last since they cost a stat call
+        if self.ignored_sizes:
             try:
-                if path_obj.is_relative_to(Path(ignored_dir)):
-                    return True
-            except ValueError:
-                # is_relative_to raises ValueError if paths are on different drives (Windows)
-                continue
+                file_size = os.path.getsize(path)
+                for min_size, max_size in self.ignored_sizes:
+                    if min_size <= file_size <= max_size:
+                        return True
+            except (OSError, IOError):
+                # If we can't get the file size, we can't ignore based on size
+                pass
+        
+        return False
+    
+    @property
+    def _any_rules(self) -> bool:
+        """Whether any ignore rule is configured at all."""
+        return bool(self.ignored_files or self.ignored_dirs or self.ignored_extensions
+                    or self.ignored_patterns or self.ignored_sizes)
+    
+    def _matches_path_rules(self, norm_path: str) -> bool:
+        """
+        Check the rules that depend only on the path string (file, directory,
+        extension and pattern rules). The result is safe to cache per path.
+        """
+        # Cheapest checks first: set lookups, then prefix scans, then regexes
+        if self.ignored_files and norm_path in self.ignored_files:
+            return True
+        
+        basename = os.path.basename(norm_path)
         
         # Check if the extension is ignored
-        if path_obj.suffix.lower() in self.ignored_extensions:
+        if self.ignored_extensions and os.path.splitext(basename)[1].lower() in self.ignored_extensions:
+            return True
+        
+        if not self._regexes_built:
+            self._build_regexes()
+        
+        # Check if it's in an ignored directory
+        if self._dir_regex is not None and self._dir_regex.match(os.path.normcase(norm_path)):
             return True
         
         # Check if it matches any ignored patterns
+        if self._pattern_regex is not None:
+            return self._pattern_regex.search(basename) is not None
         for pattern in self.ignored_patterns:
-            if pattern.search(path_obj.name):
+            if pattern.search(basename):
                 return True
         
-        # Check if it matches any ignored size ranges
-        try:
-            file_size = os.path.getsize(path)
-            for min_size, max_size in self.ignored_sizes:
-                if min_size <= file_size <= max_size:
-                    return True
-        except (OSError, IOError):
-            # If we can't get the file size, we can't ignore based on size
-            pass
-        
         return False
     
     def filter_paths(self, file_paths: List[str]) -> List[str]:
@@ -165,6 +245,9 @@ class IgnoreList:
         Returns:
             List of file paths that are not in the ignore list
         """
+        if not self._any_rules:
+            return list(file_paths)
+        
         filtered_paths = []
         
         for path in file_paths:
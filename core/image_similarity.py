@@ -20,6 +20,7 @@ DEPENDENCIES:
 - typing: For type hints (List, Dict, Tuple)
 - logging: For logging operations
 - core.hashing: For file size checks
+- numpy (optional): For vectorized Hamming distances
 
 USAGE:
 Use the main functions to detect similar images:
@@ -40,10 +41,15 @@ file content but visually appear the same or very similar.
 import imagehash
 from PIL import Image
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, Iterable, List, Dict, Tuple
 import logging
 from .hashing import get_file_size
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +75,52 @@ def calculate_image_hash(image_path: str, hash_size: int = 8) -> str:
         return ""
 
 
+def _popcount64(values):
+    """
+    Count the set bits of each element of a uint64 numpy array.
+    
+    Args:
+        values: numpy array of uint64 values
+        
+    Returns:
+        numpy array with the number of set bits per element
+    """
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+, a hardware popcount
+        return np.bitwise_count(values)
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+def _hamming_neighbours(hash_values: List[int], threshold: int) -> Callable[[int], Iterable[int]]:
+    """
+    Build a lookup of later hashes within a Hamming distance of a given one.
+    
+    With numpy available (and hashes of at most 64 bits), the distances from
+    one hash to all later ones are computed as a single vectorized XOR and
+    popcount; otherwise they are computed one pair at a time.
+    
+    Args:
+        hash_values: Perceptual hashes as integers
+        threshold: Maximum Hamming distance to report
+        
+    Returns:
+        Function mapping an index i to the indices j > i, in ascending order,
+        whose hash is within threshold of hash_values[i]
+    """
+    if np is not None and all(value.bit_length() <= 64 for value in hash_values):
+        packed = np.array(hash_values, dtype=np.uint64)
+        
+        def close_to(i: int) -> Iterable[int]:
+            distances = _popcount64(packed[i + 1:] ^ packed[i])
+            return (np.flatnonzero(distances <= threshold) + (i + 1)).tolist()
+    else:
+        def close_to(i: int) -> Iterable[int]:
+            hash1 = hash_values[i]
+            return [j for j in range(i + 1, len(hash_values))
+                    if bin(hash1 ^ hash_values[j]).count("1") <= threshold]
+    
+    return close_to
+
+
 def find_similar_images(image_paths: List[str], threshold: int = 5) -> List[List[str]]:
     """
     Find visually similar images based on perceptual hashing.
@@ -94,39 +146,38 @@ def find_similar_images(image_paths: List[str], threshold: int = 5) -> List[List
     
     logger.info(f"Calculated {len(image_hashes)} image hashes")
     
-    # Group similar images
+    # Images with the same perceptual hash always end up in the same group,
+    # so compare each distinct hash once instead of every pair of images.
+    # Hashes are kept as integers: the Hamming distance is then a popcount
+    # of their XOR instead of a hex_to_hash conversion per comparison.
+    indices_by_hash = {}
+    for index, (_, img_hash) in enumerate(image_hashes):
+        indices_by_hash.setdefault(img_hash, []).append(index)
+    distinct = [(int(img_hash, 16), indices) for img_hash, indices in indices_by_hash.items()]
+    close_to = _hamming_neighbours([hash_value for hash_value, _ in distinct], threshold)
+    
+    # Group similar images, seeding each group with the first image not yet
+    # grouped, as a pairwise comparison in input order would
     similar_groups = []
-    processed = set()
+    processed = [False] * len(distinct)
     
-    for i, (img1_path, img1_hash) in enumerate(image_hashes):
-        if img1_path in processed:
+    for i, (_, indices1) in enumerate(distinct):
+        if processed[i]:
             continue
-            
-        current_group = [img1_path]
-        processed.add(img1_path)
         
-        # Compare with remaining images
-        for j in range(i + 1, len(image_hashes)):
-            img2_path, img2_hash = image_hashes[j]
-            
-            if img2_path in processed:
-                continue
-                
-            # Calculate hamming distance between hashes
-            try:
-                hash1 = imagehash.hex_to_hash(img1_hash)
-                hash2 = imagehash.hex_to_hash(img2_hash)
-                distance = hash1 - hash2  # Hamming distance
-                
-                if distance <= threshold:
-                    current_group.append(img2_path)
-                    processed.add(img2_path)
-            except Exception as e:
-                logger.error(f"Error comparing hashes for {img1_path} and {img2_path}: {e}")
+        group_indices = list(indices1)
+        processed[i] = True
+        
+        # Join the remaining distinct hashes within the threshold
+        for j in close_to(i):
+            if not processed[j]:
+                group_indices.extend(distinct[j][1])
+                processed[j] = True
         
         # Only add groups with more than one image
-        if len(current_group) > 1:
-            similar_groups.append(current_group)
+        if len(group_indices) > 1:
+            group_indices.sort()
+            similar_groups.append([image_hashes[index][0] for index in group_indices])
     
     logger.info(f"Found {len(similar_groups)} groups of similar images")
     return similar_groups
@@ -24,23 +24,66 @@ Import specific models as needed in other modules:
 These models provide automatic validation and serialization capabilities
 that ensure data integrity across the application.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, validator, root_validator, model_serializer
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import xxhash
 
+# Default number of threads used to stat files; stat releases the GIL, and on
+# network or spinning storage its latency dominates, so parallel stats scale well.
+# Defined here rather than in core.size_filtering so that loading the models
+# (e.g. for configuration) does not import NumPy.
+DEFAULT_STAT_THREADS = 16
+
 
 class FileInfo(BaseModel):
     """Model representing information about a single file."""
     path: Path
     size: int = Field(ge=0, description="File size in bytes")
     hash_value: Optional[str] = None
-    created_time: datetime
-    modified_time: datetime
+    created_timestamp: float = Field(description="Raw st_ctime of the file")
+    modified_timestamp: float = Field(description="Raw st_mtime of the file")
     extension: str
     name: str
     
+    @root_validator(pre=True)
+    def accept_datetime_fields(cls, values):
+        # Allow callers to pass created_time/modified_time as datetimes, ISO strings or timestamps
+        if isinstance(values, dict):
+            for field, timestamp_field in (('created_time', 'created_timestamp'),
+                                           ('modified_time', 'modified_timestamp')):
+                if field in values and timestamp_field not in values:
+                    value = values.pop(field)
+                    if isinstance(value, str):
+                        value = datetime.fromisoformat(value)
+                    values[timestamp_field] = value.timestamp() if isinstance(value, datetime) else value
+        return values
+    
+    @model_serializer(mode='wrap')
+    def serialize_datetime_fields(self, handler, info):
+        # Keep the serialized created_time/modified_time keys and datetime values
+        data = handler(self)
+        serialized = {}
+        for key, value in data.items():
+            if key in ('created_timestamp', 'modified_timestamp'):
+                key = key.replace('_timestamp', '_time')
+                value = datetime.fromtimestamp(value)
+                if info.mode == 'json':
+                    value = value.isoformat()
+            serialized[key] = value
+        return serialized
+    
+    @property
+    def created_time(self) -> datetime:
+        """Creation time as a datetime, built on demand."""
+        return datetime.fromtimestamp(self.created_timestamp)
+    
+    @property
+    def modified_time(self) -> datetime:
+        """Modification time as a datetime, built on demand."""
+        return datetime.fromtimestamp(self.modified_timestamp)
+    
     @validator('path')
     def path_must_exist(cls, v):
         if not v.exists():
@@ -107,6 +150,9 @@ class ScanSettings(BaseModel):
     containing_rules: Optional[List[str]] = []
     regex_rules: Optional[List[str]] = []
     keywords: Optional[List[str]] = []
+    ignored_directories: Optional[List[str]] = []
+    ignored_extensions: Optional[List[str]] = []
+    stat_threads: int = Field(ge=1, default=DEFAULT_STAT_THREADS)
     
     @validator('image_similarity_threshold')
     def similarity_threshold_range(cls, v):
@@ -0,0 +1,117 @@
+"""
+File classification pipeline for duplicate detection.
+
+PURPOSE:
+This module classifies scanned files in a single pass. Instead of building a
+new list for ignore-list filtering, another for size filtering and another to
+split out images, each file is checked once: its extension is parsed once,
+it is statted at most once, and it lands in exactly one of the image, other
+or excluded lists. Kept files are also listed together in scan order, so
+callers that do not need the image split see the files in the order the
+scanner produced them.
+
+RELATIONSHIPS:
+- Used by: core.duplicate_detection to prepare scanned files for detection
+- Uses: core.size_filtering for stat and size range helpers, core.ignore_list for ignore rules
+- Depends on: os, collections, typing, logging
+- Provides: classify and the Classification result
+
+DEPENDENCIES:
+- os: For extension parsing
+- core.size_filtering: For statting files and building the size test
+- core.ignore_list: For ignore rules
+
+USAGE:
+Classify the output of the scanner:
+    from core.pipeline import classify
+    from core.scanning import scan_directory_for_entries
+    
+    entries = scan_directory_for_entries("/path/to/directory")
+    classification = classify(entries, min_size_mb=0.1, ignore_list=ignore_list)
+    print(len(classification.kept), len(classification.images), len(classification.excluded))
+    
+    # Also keep each kept file's stat result for later stages
+    file_stats = {}
+    classification = classify(entries, ignore_list=ignore_list, stats=file_stats)
+"""
+import os
+from collections import namedtuple
+from typing import Dict, Iterable
+import logging
+from core.ignore_list import IgnoreList
+from core.size_filtering import PathOrEntry, safe_stat, size_predicate
+
+logger = logging.getLogger(__name__)
+
+# Extensions classified as images
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'})
+
+# Classified file paths (lists of str): kept passed every filter, in scan
+# order, and is split into images and others; excluded were dropped by the
+# ignore list or the size limits
+Classification = namedtuple("Classification", "kept images others excluded")
+
+
+def classify(
+    entries: Iterable[PathOrEntry],
+    min_size_mb: float = None,
+    max_size_mb: float = None,
+    ignore_list: IgnoreList = None,
+    stats: Dict[str, os.stat_result] = None
+) -> Classification:
+    """
+    Apply the ignore list and size limits and split images from other files
+    in one pass.
+    
+    Args:
+        entries: File paths or os.DirEntry objects, e.g. from the scanner
+        min_size_mb: Minimum file size in MB (files smaller will be excluded)
+        max_size_mb: Maximum file size in MB (files larger will be excluded)
+        ignore_list: Optional IgnoreList; ignored files are excluded
+        stats: Optional dictionary filled with the stat result of every file
+            that passed the filters and could be statted, so later stages
+            (size bucketing, hashing) need not stat again; a DirEntry's
+            cached stat is reused
+    
+    Returns:
+        Classification(kept, images, others, excluded), each in input order
+    """
+    kept = []
+    images = []
+    others = []
+    excluded = []
+    
+    size_filtered = min_size_mb is not None or max_size_mb is not None
+    in_range = size_predicate(min_size_mb, max_size_mb) if size_filtered else None
+    is_ignored = ignore_list.is_ignored if ignore_list is not None else None
+    
+    splitext = os.path.splitext
+    for entry in entries:
+        path = os.fspath(entry)
+        
+        if is_ignored is not None and is_ignored(path):
+            excluded.append(path)
+            continue
+        
+        stat = None
+        if in_range is not None:
+            stat = safe_stat(entry)
+            if stat is None or not in_range(stat.st_size):
+                excluded.append(path)
+                continue
+        
+        if stats is not None:
+            if stat is None:
+                stat = safe_stat(entry)
+            if stat is not None:
+                stats[path] = stat
+        
+        kept.append(path)
+        if splitext(path)[1].lower() in IMAGE_EXTENSIONS:
+            images.append(path)
+        else:
+            others.append(path)
+    
+    logger.info(f"Classified {len(images)} images and {len(others)} other files, "
+                f"{len(excluded)} files excluded")
+    return Classification(kept, images, others, excluded)
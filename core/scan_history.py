@@ -32,6 +32,9 @@ Use the ScanHistory class to manage scan history:
     # Add a scan result to history
     scan_id = history.add_scan_result(scan_result)
     
+    # Add several scan results in one transaction
+    scan_ids = history.add_scan_results([scan_result_a, scan_result_b])
+    
     # Get recent scans
     recent_scans = history.get_recent_scans(limit=10)
     
@@ -51,6 +54,7 @@ This module provides persistent storage and retrieval of scan history for later
 """
 import json
 import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -69,15 +73,36 @@ class ScanHistory:
     A class to manage scan history records using SQLite database.
     """
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, tune_pragmas: bool = True):
         """
         Initialize the scan history manager.
         
         Args:
             db_path: Path to the database file. If None, uses default location.
+            tune_pragmas: Whether to enable WAL and the SQLite performance PRAGMAs
         """
         self.db_path = Path(db_path) if db_path else Path("duplicates.db")
-        self.database = DuplicateDatabase(self.db_path)
+        self.tune_pragmas = tune_pragmas
+        self._database = None
+        self._database_lock = threading.Lock()
+    
+    @property
+    def database(self) -> DuplicateDatabase:
+        """The underlying database, opened and initialized on first use."""
+        if self._database is None:
+            with self._database_lock:
+                if self._database is None:
+                    self._database = DuplicateDatabase(self.db_path, tune_pragmas=self.tune_pragmas)
+        return self._database
+    
+    def optimize(self):
+        """Refresh the database's query planner statistics where they are stale."""
+        self.database.optimize()
+    
+    def close(self):
+        """Close the database connections if the database was opened."""
+        if self._database is not None:
+            self._database.close()
     
     def add_scan_result(self, scan_result: ScanResult) -> int:
         """
@@ -93,6 +118,20 @@ class ScanHistory:
         logger.info(f"Added scan result: {scan_id} for directory {scan_result.directory}")
         return scan_id
     
+    def add_scan_results(self, scan_results: List[ScanResult]) -> List[int]:
+        """
+        Add several scan results to the history, committed together.
+        
+        Args:
+            scan_results: ScanResult models containing the scan results
+            
+        Returns:
+            The IDs of the newly created records, in the same order
+        """
+        scan_ids = self.database.save_scan_results(scan_results)
+        logger.info(f"Added {len(scan_ids)} scan results")
+        return scan_ids
+    
     def add_scan_record(self, directory: str, results: Dict, 
                        file_count: int = 0, duplicate_groups: int = 0) -> str:
         """
@@ -146,9 +185,7 @@ class ScanHistory:
         Returns:
             List of scan records for the directory
         """
-        # Filter recent scans by directory
-        all_scans = self.database.get_recent_scans(limit=100)  # Get more scans to ensure we find matches
-        return [scan for scan in all_scans if str(scan['directory']) == directory]
+        return self.database.get_scans_by_directory(directory)
     
     def delete_scan(self, scan_id: int):
         """
@@ -168,14 +205,48 @@ class ScanHistory:
         logger.info("Cleared scan history")
 
 
+# Shared ScanHistory instances, keyed by normalized (absolute, case-normalized) database path
+_shared_histories: Dict[str, ScanHistory] = {}
+_shared_histories_lock = threading.Lock()
+
+
 def get_scan_history(db_path: str = None) -> ScanHistory:
     """
-    Get a scan history instance.
+    Get the shared scan history instance for a database file.
+    
+    Later calls for the same file return the same instance, so its database
+    connections are opened and initialized once. The path is made absolute
+    and case-normalized first, so get_scan_history(), get_scan_history(None)
+    and any spelling of the same file (relative, absolute, or differently
+    cased on Windows) all share one instance.
     
     Args:
-        db_path: Path to the database file
+        db_path: Path to the database file. If None, uses default location.
         
     Returns:
         ScanHistory instance
     """
-    return ScanHistory(db_path)
\ No newline at end of file
+    db_path = str(db_path or "duplicates.db")
+    key = db_path
+    if db_path != ":memory:":
+        db_path = os.path.abspath(db_path)
+        key = os.path.normcase(db_path)
+    
+    with _shared_histories_lock:
+        scan_history = _shared_histories.get(key)
+        if scan_history is None:
+            scan_history = _shared_histories[key] = ScanHistory(db_path)
+        return scan_history
+
+
+def close_shared_scan_histories():
+    """
+    Close every instance handed out by get_scan_history and forget them.
+    
+    The next get_scan_history call opens a fresh instance.
+    """
+    with _shared_histories_lock:
+        histories = list(_shared_histories.values())
+        _shared_histories.clear()
+    for scan_history in histories:
+        scan_history.close()
\ No newline at end of file
@@ -9,15 +9,15 @@ will be analyzed for duplicates.
 
 RELATIONSHIPS:
 - Used by: main application flow, UI controllers, duplicate detection modules
-- Uses: core.concurrency for concurrent scanning, utils.path_helper for file type validation
+- Uses: utils.path_helper for file type validation
 - Depends on: os, pathlib, typing, logging
 - Provides file lists to: core.hashing, core.image_similarity, core.duplicate_detection
 
 DEPENDENCIES:
 - os: For directory traversal
 - pathlib: For path manipulation
-- core.concurrency: For concurrent file scanning (performance optimization)
 - core.models: For ScanSettings and ScanResult models
+- core.size_filtering: For size filtering in scan_with_models
 - utils.path_helper: For file type validation
 
 USAGE:
@@ -36,49 +36,110 @@ The module handles errors gracefully and provides progress logging.
 """
 import os
 from pathlib import Path
-from typing import List, Generator, Tuple
+from typing import Iterable, List, Generator, Tuple
 import logging
 from utils.path_helper import is_valid_file_type
 from core.models import FileInfo, ScanResult, ScanSettings
+from core.size_filtering import collect_sized_paths
 from datetime import datetime
 
-# Import concurrent processing functions
-from core.concurrency import scan_directory_concurrent, get_file_info_concurrent_batch
-
 logger = logging.getLogger(__name__)
 
 
-def scan_directory_for_files(directory_path: str, extensions: List[str] = None) -> Generator[str, None, None]:
+# Extensions scanned when the caller does not specify any
+DEFAULT_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp',
+    '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.txt', '.pdf',
+    '.doc', '.docx', '.xls', '.xlsx'
+})
+
+
+def _iter_matching_entries(directory_path: str, extensions: List[str] = None,
+                           ignored_dirs: Iterable[str] = None,
+                           ignored_extensions: Iterable[str] = None) -> Generator[os.DirEntry, None, None]:
     """
-    Scan a directory recursively for files with specified extensions.
+    Walk a directory tree and yield DirEntry objects for files with matching extensions.
+    
+    The tree is walked iteratively with an explicit stack, so deep trees do not
+    pay a generator frame per directory level. Symlinks are not followed.
+    Directories whose name is in ignored_dirs are pruned without being listed.
     
     Args:
         directory_path: Path to the directory to scan
         extensions: List of file extensions to include (e.g., ['.jpg', '.png'])
+        ignored_dirs: Directory names to skip entirely (e.g., ['.git', 'node_modules'])
+        ignored_extensions: File extensions to exclude even if listed in extensions
         
     Yields:
-        File paths matching the specified extensions
+        os.DirEntry for each matching file
     """
     if extensions is None:
-        extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', 
-                      '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.txt', '.pdf', 
-                      '.doc', '.docx', '.xls', '.xlsx']
+        ext_set = DEFAULT_EXTENSIONS
+    else:
+        ext_set = frozenset(ext.lower() for ext in extensions)
+    if ignored_extensions:
+        ext_set = ext_set - frozenset(ext.lower() for ext in ignored_extensions)
+    ignored_dir_set = frozenset(ignored_dirs or ())
+    stack = [directory_path]
+    
+    while stack:
+        current_dir = stack.pop()
+        try:
+            with os.scandir(current_dir) as scan_iter:
+                for entry in scan_iter:
+                    if entry.is_file(follow_symlinks=False):
+                        name = entry.name
+                        dot = name.rfind('.')
+                        # Match Path.suffix: a leading dot (".bashrc") is not an extension
+                        if dot > 0 and name[dot:].lower() in ext_set:
+                            yield entry
+                    elif entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignored_dir_set:
+                            stack.append(entry.path)
+        except PermissionError as e:
+            logger.warning(f"Permission denied when scanning directory {current_dir}: {e}")
+        except OSError as e:
+            logger.error(f"Error scanning directory {current_dir}: {e}")
+
+
+def scan_directory_for_entries(directory_path: str, extensions: List[str] = None,
+                               ignored_dirs: Iterable[str] = None,
+                               ignored_extensions: Iterable[str] = None) -> Generator[os.DirEntry, None, None]:
+    """
+    Scan a directory recursively, yielding os.DirEntry objects for matching files.
     
-    extensions = [ext.lower() for ext in extensions]
+    Use this instead of scan_directory_for_files when sizes or other stat data
+    are needed later, so the DirEntry's cached stat can be reused.
     
-    try:
-        with os.scandir(directory_path) as scan_iter:
-            for entry in scan_iter:
-                if entry.is_file():
-                    if Path(entry.path).suffix.lower() in extensions:
-                        yield entry.path
-                elif entry.is_dir():
-                    # Recursively scan subdirectories
-                    yield from scan_directory_for_files(entry.path, extensions)
-    except PermissionError as e:
-        logger.warning(f"Permission denied when scanning directory {directory_path}: {e}")
-    except OSError as e:
-        logger.error(f"Error scanning directory {directory_path}: {e}")
+    Args:
+        directory_path: Path to the directory to scan
+        extensions: List of file extensions to include (e.g., ['.jpg', '.png'])
+        ignored_dirs: Directory names to skip entirely (e.g., ['.git', 'node_modules'])
+        ignored_extensions: File extensions to exclude even if listed in extensions
+        
+    Yields:
+        os.DirEntry for each matching file
+    """
+    return _iter_matching_entries(directory_path, extensions, ignored_dirs, ignored_extensions)
+
+
+def scan_directory_for_files(directory_path: str, extensions: List[str] = None,
+                             ignored_dirs: Iterable[str] = None,
+                             ignored_extensions: Iterable[str] = None) -> Generator[str, None, None]:
+    """
+    Scan a directory recursively for files with specified extensions.
+    
+    Args:
+        directory_path: Path to the directory to scan
+        extensions: List of file extensions to include (e.g., ['.jpg', '.png'])
+        ignored_dirs: Directory names to skip entirely (e.g., ['.git', 'node_modules'])
+        ignored_extensions: File extensions to exclude even if listed in extensions
+        
+    Yields:
+        File paths matching the specified extensions
+    """
+    for entry in _iter_matching_entries(directory_path, extensions, ignored_dirs, ignored_extensions):
+        yield entry.path
 
 
 def scan_directory_for_duplicates(directory_path: str) -> Tuple[List[str], int]:
@@ -143,43 +204,27 @@ def scan_with_models(settings: ScanSettings) -> ScanResult:
     start_time = datetime.now()
     logger.info(f"Starting scan with models for directory: {settings.directory}")
     
-    # Get all files based on settings
-    extensions = settings.extensions or [
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp',
-        '.mp3', '.mp4', '.avi', '.mov', '.mkv', '.txt', '.pdf',
-        '.doc', '.docx', '.xls', '.xlsx'
-    ]
-    
-    # Use concurrent scanning if available
-    file_paths = scan_directory_concurrent(str(settings.directory), extensions)
-    scanned_files_count = len(file_paths)
-    
-    logger.info(f"Found {scanned_files_count} files to scan")
-    
-    # Apply size filters if specified
-    if settings.min_file_size_mb is not None or settings.max_file_size_mb is not None:
-        # Use concurrent processing to get file info
-        path_to_info = get_file_info_concurrent_batch(file_paths)
-        
-        filtered_paths = []
-        min_size_bytes = (settings.min_file_size_mb or 0) * 1024 * 1024
-        max_size_bytes = (settings.max_file_size_mb or float('inf')) * 1024 * 1024
-        
-        for path in file_paths:
-            if path in path_to_info and path_to_info[path]:
-                size = path_to_info[path].size
-                if min_size_bytes <= size <= max_size_bytes:
-                    filtered_paths.append(path)
-            else:
-                # If we couldn't get file info, try direct size check
-                try:
-                    size = Path(path).stat().st_size
-                    if min_size_bytes <= size <= max_size_bytes:
-                        filtered_paths.append(path)
-                except (OSError, IOError) as e:
-                    logger.warning(f"Could not access file {path} for size filtering: {e}")
-        
-        file_paths = filtered_paths
+    # Get all files based on settings (None selects the default extensions)
+    extensions = settings.extensions or None
+    size_filtered = settings.min_file_size_mb is not None or settings.max_file_size_mb is not None
+    
+    if not size_filtered:
+        file_paths = list(scan_directory_for_files(str(settings.directory), extensions,
+                                                   settings.ignored_directories, settings.ignored_extensions))
+        scanned_files_count = len(file_paths)
+        logger.info(f"Found {scanned_files_count} files to scan")
+    else:
+        # Reuse the walk's DirEntry stats and the shared size limits of core.size_filtering
+        entries = list(scan_directory_for_entries(str(settings.directory), extensions,
+                                                  settings.ignored_directories, settings.ignored_extensions))
+        scanned_files_count = len(entries)
+        logger.info(f"Found {scanned_files_count} files to scan")
+        file_paths, _, _ = collect_sized_paths(
+            entries,
+            min_size_mb=settings.min_file_size_mb,
+            max_size_mb=settings.max_file_size_mb,
+            stat_threads=settings.stat_threads
+        )
         logger.info(f"After size filtering: {len(file_paths)} files to scan")
     
     # In a real implementation, we would process the files using various methods
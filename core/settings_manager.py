@@ -10,12 +10,15 @@ or share configurations.
 
 RELATIONSHIPS:
 - Used by: Main application flow for configuration management
-- Uses: json, os, pathlib, typing, logging standard libraries
+- Uses: json, os, pathlib, typing, logging standard libraries; orjson when installed
 - Provides: Settings export/import and persistence functionality
 - Called when: Loading/saving application configuration
 
 DEPENDENCIES:
 - json: For settings serialization/deserialization
+- orjson (optional): Faster drop-in for json; the json module is used when it is missing
+- copy: For handing out independent copies of the default settings
+- threading: For guarding the shared SettingsManager instances
 - os: For file system operations
 - pathlib: For path manipulation
 - typing: For type hints (Dict, Any, Optional)
@@ -48,15 +51,92 @@ Use the SettingsManager class to manage application settings:
 
 This module enables persistent configuration management across application sessions.
 """
+import copy
 import json
+import threading
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# Template for the default settings; callers always receive a deep copy
+_DEFAULT_SETTINGS: Dict[str, Any] = {
+    "auto_select_strategy": "oldest",
+    "image_similarity_threshold": 10,
+    "last_scan_directory": ".",
+    "default_extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".mp4", ".avi", ".mov"],
+    "min_file_size_mb": 0.1,
+    "max_file_size_mb": 1000.0,
+    "use_custom_rules": False,
+    "use_advanced_grouping": False,
+    "suffix_rules": ["_copy", "_duplicate"],
+    "prefix_rules": [],
+    "containing_rules": ["copy", "duplicate"],
+    "regex_rules": [r".*_[0-9]+$", r".*\([0-9]+\)$"],
+    "keywords": [],
+    "ignore_list": {
+        "files": [],
+        "directories": ["$RECYCLE.BIN", ".git", ".svn", "__pycache__", "node_modules", ".vscode", ".idea"],
+        "patterns": [r"\.tmp$", r"\.log$", r"\.cache$"],
+        "extensions": [".tmp", ".log", ".cache", ".bak", ".DS_Store"],
+        "size_ranges": []  # List of tuples (min_mb, max_mb)
+    }
+}
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parse JSON from UTF-8 bytes, with orjson when it is installed.
+    
+    Both parsers raise json.JSONDecodeError (orjson's error subclasses it)
+    or UnicodeDecodeError for bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _write_file_atomic(path: str, data: bytes):
+    """
+    Write data to a file atomically.
+    
+    The data goes to a temporary file in the same directory, is flushed to disk,
+    and then replaces the target, so a crash never leaves a half-written file.
+    
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _default_settings_file_path() -> str:
+    """Return the settings file used when no path is given."""
+    return os.path.join(
+        os.path.expanduser("~"), 
+        ".duplicate_file_finder", 
+        "app_settings.json"
+    )
+
+
 class SettingsManager:
     """
     A class to manage application settings export/import.
@@ -69,15 +149,14 @@ class SettingsManager:
         Args:
             settings_file_path: Path to the settings file. If None, uses default location.
         """
-        self.settings_file_path = settings_file_path or os.path.join(
-            os.path.expanduser("~"), 
-            ".duplicate_file_finder", 
-            "app_settings.json"
-        )
+        self.settings_file_path = settings_file_path or _default_settings_file_path()
         
         # Ensure the directory exists
         os.makedirs(os.path.dirname(self.settings_file_path), exist_ok=True)
         
+        # Bytes last written to settings_file_path, used to skip no-op saves
+        self._last_saved_data = None
+        
         # Load existing settings
         self.settings = self.load_settings()
     
@@ -94,11 +173,13 @@ class SettingsManager:
         path = export_path or self.settings_file_path
         
         try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            data = self._serialize_settings()
+            _write_file_atomic(path, data)
+            if os.path.abspath(path) == os.path.abspath(self.settings_file_path):
+                self._last_saved_data = data
             logger.info(f"Settings exported to: {path}")
             return True
-        except IOError as e:
+        except (IOError, OSError) as e:
             logger.error(f"Error exporting settings to {path}: {e}")
             return False
     
@@ -117,8 +198,8 @@ class SettingsManager:
             return False
         
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                imported_settings = json.load(f)
+            with open(import_path, 'rb') as f:
+                imported_settings = _loads(f.read())
             
             # Validate that it's a dictionary
             if not isinstance(imported_settings, dict):
@@ -128,43 +209,70 @@ class SettingsManager:
             self.settings = imported_settings
             logger.info(f"Settings imported from: {import_path}")
             return True
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             logger.error(f"Error importing settings from {import_path}: {e}")
             return False
     
     def save_settings(self):
         """
         Save current settings to the default file.
+        
+        The write is skipped when the settings are unchanged since the last save.
         """
         try:
-            with open(self.settings_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            data = self._serialize_settings()
+            if data == self._last_saved_data:
+                logger.debug("Settings unchanged since last save, skipping write")
+                return
+            _write_file_atomic(self.settings_file_path, data)
+            self._last_saved_data = data
             logger.info(f"Settings saved to: {self.settings_file_path}")
-        except IOError as e:
+        except (IOError, OSError) as e:
             logger.error(f"Error saving settings to {self.settings_file_path}: {e}")
     
+    def _serialize_settings(self) -> bytes:
+        """Serialize the current settings to the bytes written to disk."""
+        if orjson is not None:
+            # Same layout as the json fallback: 2-space indent, UTF-8, no trailing newline
+            return orjson.dumps(self.settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.settings, indent=2, ensure_ascii=False).encode('utf-8')
+    
     def load_settings(self) -> Dict[str, Any]:
         """
         Load settings from the file.
         
+        When the file already holds every setting, its bytes are remembered
+        as the last save, so saving settings that were only read is a no-op.
+        
         Returns:
             Dictionary of settings
         """
-        if not os.path.exists(self.settings_file_path):
+        try:
+            with open(self.settings_file_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return self.get_default_settings()
+        except IOError as e:
+            logger.error(f"Error loading settings from {self.settings_file_path}: {e}")
             return self.get_default_settings()
         
         try:
-            with open(self.settings_file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # Merge with defaults to ensure all keys are present
-                    defaults = self.get_default_settings()
-                    defaults.update(data)
-                    return defaults
-                else:
-                    logger.warning(f"Invalid settings file format, using defaults")
-                    return self.get_default_settings()
-        except (json.JSONDecodeError, IOError) as e:
+            data = _loads(raw)
+            if isinstance(data, dict):
+                # Merge with defaults to ensure all keys are present,
+                # copying only the defaults the file does not override
+                missing_defaults = False
+                for key, value in _DEFAULT_SETTINGS.items():
+                    if key not in data:
+                        data[key] = copy.deepcopy(value)
+                        missing_defaults = True
+                if not missing_defaults:
+                    self._last_saved_data = raw
+                return data
+            else:
+                logger.warning(f"Invalid settings file format, using defaults")
+                return self.get_default_settings()
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error(f"Error loading settings from {self.settings_file_path}: {e}")
             return self.get_default_settings()
     
@@ -198,28 +306,7 @@ class SettingsManager:
         Returns:
             Dictionary of default settings
         """
-        return {
-            "auto_select_strategy": "oldest",
-            "image_similarity_threshold": 10,
-            "last_scan_directory": ".",
-            "default_extensions": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".mp4", ".avi", ".mov"],
-            "min_file_size_mb": 0.1,
-            "max_file_size_mb": 1000.0,
-            "use_custom_rules": False,
-            "use_advanced_grouping": False,
-            "suffix_rules": ["_copy", "_duplicate"],
-            "prefix_rules": [],
-            "containing_rules": ["copy", "duplicate"],
-            "regex_rules": [r".*_[0-9]+$", r".*\([0-9]+\)$"],
-            "keywords": [],
-            "ignore_list": {
-                "files": [],
-                "directories": ["$RECYCLE.BIN", ".git", ".svn", "__pycache__", "node_modules", ".vscode", ".idea"],
-                "patterns": [r"\.tmp$", r"\.log$", r"\.cache$"],
-                "extensions": [".tmp", ".log", ".cache", ".bak", ".DS_Store"],
-                "size_ranges": []  # List of tuples (min_mb, max_mb)
-            }
-        }
+        return copy.deepcopy(_DEFAULT_SETTINGS)
     
     def reset_to_defaults(self):
         """
@@ -229,9 +316,21 @@ class SettingsManager:
         logger.info("Settings reset to defaults")
 
 
+# Shared SettingsManager instances, keyed by normalized (absolute, case-normalized) settings file path
+_shared_managers: Dict[str, SettingsManager] = {}
+_shared_managers_lock = threading.Lock()
+
+
 def get_settings_manager(settings_file_path: str = None) -> SettingsManager:
     """
-    Get a settings manager instance.
+    Get the shared settings manager instance for a settings file.
+    
+    The file is read once; later calls for the same file return the same
+    instance, so changes made through one caller are seen by all. The path
+    is made absolute and case-normalized first, so get_settings_manager(),
+    get_settings_manager(None) and any spelling of the same file (relative,
+    absolute, or differently cased on Windows) all share one instance.
+    Construct SettingsManager directly for an independent instance.
     
     Args:
         settings_file_path: Path to the settings file
@@ -239,4 +338,21 @@ def get_settings_manager(settings_file_path: str = None) -> SettingsManager:
     Returns:
         SettingsManager instance
     """
-    return SettingsManager(settings_file_path)
\ No newline at end of file
+    settings_file_path = os.path.abspath(settings_file_path or _default_settings_file_path())
+    key = os.path.normcase(settings_file_path)
+    
+    with _shared_managers_lock:
+        settings_manager = _shared_managers.get(key)
+        if settings_manager is None:
+            settings_manager = _shared_managers[key] = SettingsManager(settings_file_path)
+        return settings_manager
+
+
+def clear_shared_settings_managers():
+    """
+    Forget every instance handed out by get_settings_manager.
+    
+    The next get_settings_manager call reads its settings file again.
+    """
+    with _shared_managers_lock:
+        _shared_managers.clear()
\ No newline at end of file
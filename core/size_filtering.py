@@ -10,12 +10,15 @@ the type of duplicates the user wants to find.
 
 RELATIONSHIPS:
 - Used by: core.duplicate_detection, core.scanning for size-based filtering
-- Uses: os, pathlib, typing, logging standard libraries
+- Uses: os, pathlib, typing, logging standard libraries; core.models for the default stat thread count
 - Provides: Size-based file filtering functionality
 - Called when: Size filtering is enabled in scan settings
 
 DEPENDENCIES:
+- math: For rounding size limits to whole bytes
 - os: For getting file sizes
+- concurrent.futures: For statting files in parallel
+- numpy (optional): For vectorized size statistics
 - pathlib: For path manipulation
 - typing: For type hints (List, Tuple)
 - logging: For logging operations
@@ -36,57 +39,431 @@ Use the main functions to filter files by size:
     
     # Get size statistics for a list of files
     min_size, max_size, avg_size = get_size_stats(file_paths)
+    
+    # Keep sizes alongside the paths for later stages
+    paths, sizes, excluded = collect_sized_paths(entries, min_size_mb=0.1)
 
 This module helps optimize scanning performance and focus on files within desired size ranges.
 """
+import math
 import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import logging
+from core.models import DEFAULT_STAT_THREADS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# A file path, or a DirEntry from os.scandir whose cached stat can be reused
+PathOrEntry = Union[str, os.DirEntry]
+
+# Paths handed to each stat worker at a time, to keep per-task overhead low
+_STAT_BATCH_SIZE = 256
+
+# Files that passed a size filter as parallel arrays: paths (list of str),
+# sizes (int64 NumPy array when NumPy is available, else a list of int) and
+# excluded (list of str). Downstream stages read sizes from here instead of
+# statting the same files again.
+SizedPaths = namedtuple("SizedPaths", "paths sizes excluded")
+
+
+def safe_stat(file_path: PathOrEntry) -> Optional[os.stat_result]:
+    """
+    Stat a file, or return None if it cannot be read.
+    
+    DirEntry objects from os.scandir answer from their cached stat data where
+    the platform provides it, without another path lookup.
+    
+    Args:
+        file_path: Path string, path-like or os.DirEntry to stat
+        
+    Returns:
+        The stat result, or None if the file could not be statted
+    """
+    try:
+        if isinstance(file_path, os.DirEntry):
+            return file_path.stat(follow_symlinks=False)
+        return os.stat(file_path)
+    except (OSError, IOError) as e:
+        # Unreadable files are expected in large trees; they are simply excluded
+        logger.debug("Error getting size for file %s: %s", os.fspath(file_path), e)
+        return None
+
+
+def _log_stat_failures(failures: int):
+    """Log one summary line for files that could not be statted."""
+    if failures:
+        logger.info("Stat failures: %d paths", failures)
+
+
+def _stat_batch(file_paths: List[PathOrEntry]) -> List[Optional[os.stat_result]]:
+    """
+    Stat a batch of files, in order.
+    
+    Plain path strings are statted inline with os.stat bound locally, so the
+    common case skips the per-file helper call; DirEntry objects and other
+    path-likes go through safe_stat.
+    """
+    stat = os.stat
+    stats = []
+    append = stats.append
+    for file_path in file_paths:
+        if type(file_path) is str:
+            try:
+                append(stat(file_path))
+            except OSError as e:
+                logger.debug("Error getting size for file %s: %s", file_path, e)
+                append(None)
+        else:
+            append(safe_stat(file_path))
+    return stats
+
+
+def _iter_stats(file_paths: Iterable[PathOrEntry],
+                stat_threads: int) -> Iterator[Tuple[PathOrEntry, Optional[os.stat_result]]]:
+    """
+    Lazily stat files as they arrive, yielding (item, stat or None) in order.
+    
+    With more than one thread, input is consumed in batches that are statted
+    on a thread pool while the next batches are read.
+    """
+    if stat_threads <= 1:
+        for file_path in file_paths:
+            yield file_path, safe_stat(file_path)
+        return
+    
+    iterator = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=stat_threads) as executor:
+        # Keep a bounded number of batches in flight, oldest first
+        pending = deque()
+        while True:
+            while len(pending) < stat_threads * 2:
+                batch = list(islice(iterator, _STAT_BATCH_SIZE))
+                if not batch:
+                    break
+                pending.append((batch, executor.submit(_stat_batch, batch)))
+            if not pending:
+                break
+            
+            batch, future = pending.popleft()
+            yield from zip(batch, future.result())
+
+
+def get_file_stats(file_paths: Iterable[PathOrEntry], 
+                   stat_threads: int = DEFAULT_STAT_THREADS) -> List[Optional[os.stat_result]]:
+    """
+    Stat many files in parallel.
+    
+    Args:
+        file_paths: File paths or os.DirEntry objects
+        stat_threads: Number of threads used to stat files (1 disables threading)
+        
+    Returns:
+        List of stat results in the same order as file_paths; None for files
+        that could not be read
+    """
+    file_paths = list(file_paths)
+    if stat_threads <= 1 or len(file_paths) <= _STAT_BATCH_SIZE:
+        return _stat_batch(file_paths)
+    
+    batches = [file_paths[i:i + _STAT_BATCH_SIZE] for i in range(0, len(file_paths), _STAT_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=stat_threads) as executor:
+        stats = []
+        for batch_stats in executor.map(_stat_batch, batches):
+            stats.extend(batch_stats)
+    return stats
+
+
+def get_file_sizes(file_paths: Iterable[PathOrEntry],
+                   stat_threads: int = DEFAULT_STAT_THREADS) -> List[Optional[int]]:
+    """
+    Get the sizes of many files, statting them in parallel.
+    
+    Args:
+        file_paths: File paths or os.DirEntry objects
+        stat_threads: Number of threads used to stat files (1 disables threading)
+        
+    Returns:
+        List of sizes in bytes, in the same order as file_paths; None for files
+        whose size could not be read
+    """
+    return [stat.st_size if stat is not None else None 
+            for stat in get_file_stats(file_paths, stat_threads)]
+
+
+def size_limits_bytes(min_size_mb: Optional[float],
+                      max_size_mb: Optional[float]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Convert MB size limits to inclusive whole-byte bounds.
+    
+    File sizes are whole bytes, so a fractional minimum rounds up and a
+    fractional maximum rounds down; comparing integer sizes against these
+    bounds gives the same answer as comparing against the exact limits.
+    Every size filter uses this, so they all agree at the boundaries.
+    
+    Args:
+        min_size_mb: Minimum file size in MB, or None for no lower bound
+        max_size_mb: Maximum file size in MB, or None for no upper bound
+        
+    Returns:
+        Tuple of (min_size_bytes, max_size_bytes), None where no limit is set
+    """
+    min_size_bytes = math.ceil(min_size_mb * 1024 * 1024) if min_size_mb is not None else None
+    max_size_bytes = math.floor(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+    return min_size_bytes, max_size_bytes
+
+
+def size_predicate(min_size_mb: Optional[float], max_size_mb: Optional[float]) -> Callable[[int], bool]:
+    """
+    Build a size test specialized for the limits that are actually set.
+    
+    A min-only or max-only filter gets a single comparison instead of
+    comparing against a sentinel bound on the other side.
+    
+    Args:
+        min_size_mb: Minimum file size in MB, or None for no lower bound
+        max_size_mb: Maximum file size in MB, or None for no upper bound
+        
+    Returns:
+        Function taking a size in bytes and returning whether it is in range
+    """
+    min_size_bytes, max_size_bytes = size_limits_bytes(min_size_mb, max_size_mb)
+    
+    if max_size_bytes is None:
+        def _filter_min_only(size_bytes: int) -> bool:
+            return size_bytes >= min_size_bytes
+        return _filter_min_only
+    
+    if min_size_bytes is None:
+        def _filter_max_only(size_bytes: int) -> bool:
+            return size_bytes <= max_size_bytes
+        return _filter_max_only
+    
+    def _filter_range(size_bytes: int) -> bool:
+        return min_size_bytes <= size_bytes <= max_size_bytes
+    return _filter_range
+
+
+def _size_range_mask(size_array, min_size_mb: Optional[float], max_size_mb: Optional[float]):
+    """
+    Vectorized size test over an int64 NumPy array of sizes.
+    
+    Unreadable files are marked with a negative size and never match. Only the
+    comparisons for the limits that are set are evaluated.
+    
+    Args:
+        size_array: Sizes in bytes, with -1 for files that could not be statted
+        min_size_mb: Minimum file size in MB, or None for no lower bound
+        max_size_mb: Maximum file size in MB, or None for no upper bound
+        
+    Returns:
+        NumPy bool array, True where the size is within the range
+    """
+    min_size_bytes, max_size_bytes = size_limits_bytes(min_size_mb, max_size_mb)
+    if min_size_bytes is not None:
+        mask = size_array >= max(min_size_bytes, 0)
+    else:
+        mask = size_array >= 0
+    if max_size_bytes is not None:
+        mask &= size_array <= max_size_bytes
+    return mask
+
+
+def _split_by_size(
+    file_paths: Iterable[PathOrEntry],
+    min_size_mb: Optional[float],
+    max_size_mb: Optional[float],
+    stat_threads: int,
+    stats: Optional[Dict[str, os.stat_result]] = None
+) -> Tuple[List[PathOrEntry], Sequence[int], List[PathOrEntry]]:
+    """
+    Stat files as they arrive and split them by the size limits.
+    
+    filter_files_by_size, collect_sized_paths and get_size_stats all go
+    through here, so they share one stat loop and the limit semantics of
+    size_limits_bytes. Files that cannot be statted are excluded.
+    
+    Args:
+        file_paths: File paths or os.DirEntry objects
+        min_size_mb: Minimum file size in MB, or None for no lower bound
+        max_size_mb: Maximum file size in MB, or None for no upper bound
+        stat_threads: Number of threads used to stat files (1 disables threading)
+        stats: Optional dictionary that receives each statted path's stat result
+        
+    Returns:
+        Tuple of (kept_items, kept_sizes, excluded_items), items as given and in
+        input order; kept_sizes is an int64 NumPy array when NumPy is available,
+        else a list of int
+    """
+    items = []
+    sizes = []
+    for file_path, stat in _iter_stats(file_paths, stat_threads):
+        items.append(file_path)
+        if stat is None:
+            sizes.append(-1)
+        else:
+            sizes.append(stat.st_size)
+            if stats is not None:
+                stats[os.fspath(file_path)] = stat
+    _log_stat_failures(sizes.count(-1))
+    
+    if np is not None:
+        # Compare all sizes in one branchless mask, then gather by index
+        size_array = np.fromiter(sizes, dtype=np.int64, count=len(sizes))
+        mask = _size_range_mask(size_array, min_size_mb, max_size_mb)
+        return ([items[i] for i in np.flatnonzero(mask)], size_array[mask],
+                [items[i] for i in np.flatnonzero(~mask)])
+    
+    size_filtered = min_size_mb is not None or max_size_mb is not None
+    in_range = size_predicate(min_size_mb, max_size_mb) if size_filtered else None
+    
+    kept = []
+    kept_sizes = []
+    excluded = []
+    for file_path, size_bytes in zip(items, sizes):
+        if size_bytes >= 0 and (in_range is None or in_range(size_bytes)):
+            kept.append(file_path)
+            kept_sizes.append(size_bytes)
+        else:
+            excluded.append(file_path)
+    return kept, kept_sizes, excluded
+
 
 def filter_files_by_size(
-    file_paths: List[str], 
+    file_paths: Iterable[PathOrEntry], 
     min_size_mb: float = None, 
-    max_size_mb: float = None
-) -> Tuple[List[str], List[str]]:
+    max_size_mb: float = None,
+    stat_threads: int = DEFAULT_STAT_THREADS
+) -> Tuple[List[PathOrEntry], List[PathOrEntry]]:
     """
     Filter files based on size thresholds.
     
+    Items are returned as given, so passing os.DirEntry objects yields
+    DirEntry objects back (use .path for the path string).
+    
     Args:
-        file_paths: List of file paths to filter
+        file_paths: File paths or os.DirEntry objects to filter
         min_size_mb: Minimum file size in MB (files smaller will be excluded)
         max_size_mb: Maximum file size in MB (files larger will be excluded)
+        stat_threads: Number of threads used to stat files (1 disables threading)
         
     Returns:
         Tuple of (filtered_file_paths, excluded_file_paths)
     """
-    filtered_files = []
-    excluded_files = []
-    
-    min_size_bytes = int(min_size_mb * 1024 * 1024) if min_size_mb is not None else 0
-    max_size_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else float('inf')
-    
-    for file_path in file_paths:
-        try:
-            size_bytes = os.path.getsize(file_path)
-            
-            # Check if file size is within the allowed range
-            if (min_size_bytes <= size_bytes <= max_size_bytes):
-                filtered_files.append(file_path)
-            else:
-                excluded_files.append(file_path)
-                
-        except (OSError, IOError) as e:
-            logger.error(f"Error getting size for file {file_path}: {e}")
-            excluded_files.append(file_path)
+    # Without limits every file passes, so nothing needs to be statted
+    if min_size_mb is None and max_size_mb is None:
+        return list(file_paths), []
     
+    filtered_files, _, excluded_files = _split_by_size(file_paths, min_size_mb, max_size_mb, stat_threads)
     logger.info(f"Size filtering: {len(filtered_files)} files passed, {len(excluded_files)} files excluded")
     return filtered_files, excluded_files
 
 
+def collect_sized_paths(
+    file_paths: Iterable[PathOrEntry],
+    min_size_mb: float = None,
+    max_size_mb: float = None,
+    stat_threads: int = DEFAULT_STAT_THREADS,
+    stats: Optional[Dict[str, os.stat_result]] = None
+) -> SizedPaths:
+    """
+    Stat files as they arrive and keep their sizes alongside the paths.
+    
+    Statting overlaps with reading the input, so it can run straight off the
+    scanner. Every file is statted (even without limits) and the result is
+    a SizedPaths of parallel path and size arrays. Files that cannot be
+    statted are excluded.
+    
+    Args:
+        file_paths: File paths or os.DirEntry objects
+        min_size_mb: Minimum file size in MB (files smaller will be excluded)
+        max_size_mb: Maximum file size in MB (files larger will be excluded)
+        stat_threads: Number of threads used to stat files (1 disables threading)
+        stats: Optional dictionary that receives each statted path's stat result,
+            so later stages (timestamps, FileInfo) can reuse it without statting
+        
+    Returns:
+        SizedPaths(paths, sizes, excluded) with paths as strings, in input order
+    """
+    kept, sizes, excluded = _split_by_size(file_paths, min_size_mb, max_size_mb, stat_threads, stats)
+    return SizedPaths([os.fspath(file_path) for file_path in kept], sizes,
+                      [os.fspath(file_path) for file_path in excluded])
+
+
+def shared_size_mask(sizes: Sequence[int]) -> Sequence[bool]:
+    """
+    Mark the files whose size is shared with at least one other file.
+    
+    Files with a unique size cannot have identical content, so only the
+    marked files need hashing.
+    
+    Args:
+        sizes: File sizes in bytes, e.g. SizedPaths.sizes
+        
+    Returns:
+        Sequence of booleans parallel to sizes (a NumPy bool array when
+        NumPy is available)
+    """
+    if np is not None:
+        size_array = np.asarray(sizes, dtype=np.int64)
+        if not len(size_array):
+            return np.zeros(0, dtype=bool)
+        _, inverse, counts = np.unique(size_array, return_inverse=True, return_counts=True)
+        return counts[inverse] > 1
+    
+    counts = {}
+    for size_bytes in sizes:
+        counts[size_bytes] = counts.get(size_bytes, 0) + 1
+    return [counts[size_bytes] > 1 for size_bytes in sizes]
+
+
+def filter_unique_by_size(
+    file_paths: Sequence[PathOrEntry],
+    sizes: Sequence[int] = None,
+    stat_threads: int = DEFAULT_STAT_THREADS
+) -> Tuple[List[PathOrEntry], List[PathOrEntry]]:
+    """
+    Split files into hash candidates and files whose size is unique.
+    
+    A file whose size no other file shares cannot be a content duplicate,
+    so only the candidates need hashing. Order is preserved.
+    
+    Args:
+        file_paths: File paths or os.DirEntry objects
+        sizes: Optional sizes in bytes parallel to file_paths (e.g. from
+            SizedPaths); files are statted when not given
+        stat_threads: Number of threads used to stat files (1 disables threading)
+        
+    Returns:
+        Tuple of (candidate_files, unique_files); files whose size could not
+        be read are counted as unique since they cannot be hashed either
+    """
+    if sizes is None:
+        file_sizes = get_file_sizes(file_paths, stat_threads)
+        readable = [i for i, size_bytes in enumerate(file_sizes) if size_bytes is not None]
+        shared = [False] * len(file_sizes)
+        for i, is_shared in zip(readable, shared_size_mask([file_sizes[i] for i in readable])):
+            shared[i] = bool(is_shared)
+    else:
+        shared = shared_size_mask(sizes)
+    
+    candidate_files = []
+    unique_files = []
+    for file_path, is_shared in zip(file_paths, shared):
+        (candidate_files if is_shared else unique_files).append(file_path)
+    
+    logger.info(f"Size bucketing: {len(candidate_files)} hash candidates, {len(unique_files)} unique sizes skipped")
+    return candidate_files, unique_files
+
+
 def get_file_size_mb(file_path: str) -> float:
     """
     Get the size of a file in MB.
@@ -101,16 +478,17 @@ def get_file_size_mb(file_path: str) -> float:
         size_bytes = os.path.getsize(file_path)
         return size_bytes / (1024 * 1024)
     except (OSError, IOError) as e:
-        logger.error(f"Error getting size for file {file_path}: {e}")
+        logger.debug("Error getting size for file %s: %s", file_path, e)
         return 0.0
 
 
-def get_size_stats(file_paths: List[str]) -> Tuple[float, float, float]:
+def get_size_stats(file_paths: List[str], stat_threads: int = DEFAULT_STAT_THREADS) -> Tuple[float, float, float]:
     """
     Get size statistics for a list of files.
     
     Args:
         file_paths: List of file paths to analyze
+        stat_threads: Number of threads used to stat files (1 disables threading)
         
     Returns:
         Tuple of (min_size_mb, max_size_mb, avg_size_mb)
@@ -118,15 +496,14 @@ def get_size_stats(file_paths: List[str]) -> Tuple[float, float, float]:
     if not file_paths:
         return 0.0, 0.0, 0.0
     
-    sizes = []
-    for file_path in file_paths:
-        try:
-            size_bytes = os.path.getsize(file_path)
-            sizes.append(size_bytes / (1024 * 1024))
-        except (OSError, IOError) as e:
-            logger.error(f"Error getting size for file {file_path}: {e}")
+    _, sizes, _ = _split_by_size(file_paths, None, None, stat_threads)
     
-    if not sizes:
+    if not len(sizes):
         return 0.0, 0.0, 0.0
     
-    return min(sizes), max(sizes), sum(sizes) / len(sizes)
\ No newline at end of file
+    mb = 1024 * 1024
+    if np is not None:
+        # Reduce over the contiguous int64 buffer instead of boxed floats
+        return float(sizes.min()) / mb, float(sizes.max()) / mb, float(sizes.mean()) / mb
+    
+    return min(sizes) / mb, max(sizes) / mb, sum(sizes) / len(sizes) / mb
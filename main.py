@@ -17,11 +17,13 @@ RELATIONSHIPS:
 
 DEPENDENCIES:
 - sys, os: For system operations
+- sqlite3: For hash cache errors
 - pathlib: For path manipulation
 - typing: For type hints
 - logging: For application logging
 - argparse: For command-line argument parsing
 - datetime: For timestamp operations
+- time: For timing the scan
 - utils.logger: For logging setup
 - utils.config: For configuration management
 - core modules: For all duplicate detection functionality
@@ -31,6 +33,7 @@ USAGE:
 Run the application from the command line with various options:
     python main.py /path/to/directory --strategy oldest --delete --extensions .jpg .png .pdf
     python main.py /path/to/directory --method hash --min-size 0.1 --max-size 100
+    python main.py /path/to/directory --method hash --no-hash-cache
     python main.py --export-settings /path/to/settings.json
     python main.py --import-settings /path/to/settings.json
 
@@ -38,39 +41,53 @@ The application supports multiple detection methods, custom rules, and file oper
 """
 import sys
 import os
+import sqlite3
 from pathlib import Path
 from typing import List, Dict
 import logging
 import argparse
-import datetime
+import time
+from datetime import datetime, timedelta
 
 from utils.logger import setup_logger
 from utils.config import Config
-from core.duplicate_detection import find_all_duplicates, merge_duplicate_groups, find_all_duplicates_with_models
-from core.file_operations import safe_delete_files, auto_select_duplicates_for_deletion
-from core.ignore_list import IgnoreList, create_default_ignore_list
-from core.scan_history import ScanHistory
-from core.settings_manager import SettingsManager
-from core.models import ScanResult, ScanSettings
-from datetime import datetime as dt
+from core.settings_manager import get_settings_manager
+from core.models import ScanResult, ScanSettings, DEFAULT_STAT_THREADS
 
 
-def main():
-    """
-    Main entry point for the duplicate file finder application.
+def positive_int(value: str) -> int:
     """
-    # Generate a timestamped log filename for this run
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = f"scan_run_{timestamp}.log"
+    Parse a command-line value that must be an integer of at least 1.
     
-    # Setup logging
-    logger = setup_logger('duplicate_finder', log_filename, logging.DEBUG)  # Changed to DEBUG level
-    logger.info("Starting Duplicate File Finder Application")
-    
-    # Load configuration
-    config = Config()
+    Args:
+        value: The raw argument string
+        
+    Returns:
+        The parsed integer
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser(config) -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
     
-    # Parse command line arguments
+    Args:
+        config: Configuration providing defaults through get(key, default);
+            a plain dict works too
+        
+    Returns:
+        The configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(description='Find and manage duplicate files')
     parser.add_argument('directory', nargs='?', help='Directory to scan for duplicates')
     parser.add_argument('--strategy', choices=['oldest', 'newest', 'lowest_res'], 
@@ -93,6 +110,10 @@ def main():
                        help='Minimum file size in MB to include in scan')
     parser.add_argument('--max-size', type=float,
                        help='Maximum file size in MB to include in scan')
+    parser.add_argument('--stat-threads', type=positive_int, default=DEFAULT_STAT_THREADS,
+                       help=f'Number of threads used to read file sizes (default: {DEFAULT_STAT_THREADS})')
+    parser.add_argument('--no-hash-cache', action='store_true',
+                       help='Hash every file again instead of reusing hashes of unchanged files from earlier scans')
     parser.add_argument('--ignore-list-file', 
                        help='Path to a file containing ignore patterns')
     parser.add_argument('--export-settings', 
@@ -110,10 +131,31 @@ def main():
     parser.add_argument('--keywords', nargs='+', 
                        help='Keywords to search for in filenames')
     
+    return parser
+
+
+def main():
+    """
+    Main entry point for the duplicate file finder application.
+    """
+    # Generate a timestamped log filename for this run
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_filename = f"scan_run_{timestamp}.log"
+    
+    # Setup logging
+    logger = setup_logger('duplicate_finder', log_filename, logging.DEBUG)  # Changed to DEBUG level
+    logger.info("Starting Duplicate File Finder Application")
+    
+    # Load configuration
+    config = Config()
+    
+    # Parse command line arguments
+    parser = build_parser(config)
+    
     args = parser.parse_args()
     
     # Handle settings import/export before loading config
-    settings_manager = SettingsManager()
+    settings_manager = get_settings_manager()
     
     if args.import_settings:
         if settings_manager.import_settings(args.import_settings):
@@ -132,6 +174,15 @@ def main():
             print(f"Failed to export settings to {args.export_settings}")
             return 1
     
+    # Scanning modules are imported only once a scan is actually going to run,
+    # so settings import/export and argument errors return without loading them
+    from core.duplicate_detection import find_all_duplicates_with_models_and_count
+    from core.hash_cache import HashCache, DEFAULT_HASH_CACHE_PATH
+    from core.file_operations import safe_delete_files, auto_select_duplicates_for_deletion
+    from core.ignore_list import create_default_ignore_list
+    from core.scan_history import get_scan_history
+    from core.scanning import scan_directory_for_files
+    
     # If no directory provided, use the last scanned directory or current directory
     scan_directory = args.directory
     if not scan_directory:
@@ -176,6 +227,7 @@ def main():
     containing_rules = args.containing_rules or settings_manager.get_setting('containing_rules', [])
     regex_rules = args.regex_rules or settings_manager.get_setting('regex_rules', [])
     keywords = args.keywords or settings_manager.get_setting('keywords', [])
+    ignore_settings = settings_manager.get_setting('ignore_list', {}) or {}
     
     # Create scan settings model
     scan_settings = ScanSettings(
@@ -194,6 +246,9 @@ def main():
         containing_rules=containing_rules,
         regex_rules=regex_rules,
         keywords=keywords,
+        ignored_directories=ignore_settings.get('directories', []),
+        ignored_extensions=ignore_settings.get('extensions', []),
+        stat_threads=args.stat_threads,
         image_similarity_threshold=args.similarity
     )
     
@@ -201,10 +256,25 @@ def main():
     logger.debug(f"Scan settings: {scan_settings}")
     
     # Run duplicate detection with models
-    start_time = dt.now()
+    # Wall-clock start for the record; the duration comes from the monotonic clock
+    start_time = datetime.now()
+    start_counter = time.perf_counter()
     logger.info(f"Starting duplicate detection with method: {args.method}")
-    duplicate_groups = find_all_duplicates_with_models(scan_settings)
-    end_time = dt.now()
+    # Reuse hashes of files that are unchanged since an earlier scan
+    hash_cache = None
+    if use_hash and not args.no_hash_cache:
+        try:
+            hash_cache = HashCache(DEFAULT_HASH_CACHE_PATH)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open hash cache {DEFAULT_HASH_CACHE_PATH}, hashing every file: {e}")
+    try:
+        duplicate_groups, scanned_files_count = find_all_duplicates_with_models_and_count(
+            scan_settings, hash_cache=hash_cache)
+    finally:
+        if hash_cache is not None:
+            hash_cache.close()
+    scan_duration = time.perf_counter() - start_counter
+    end_time = start_time + timedelta(seconds=scan_duration)
     
     # Log the results of the detection for debugging
     logger.debug(f"Found {len(duplicate_groups)} potential duplicate groups")
@@ -214,7 +284,6 @@ def main():
             logger.debug(f"  - {file_info.path} ({file_info.size} bytes)")
     
     # Create scan result model
-    scanned_files_count = len(list(Path(scan_directory).rglob('*')))
     methods_used = []
     if use_hash: methods_used.append('hash')
     if use_size: methods_used.append('size')
@@ -228,12 +297,12 @@ def main():
         duplicate_groups=duplicate_groups,
         scan_start_time=start_time,
         scan_end_time=end_time,
-        scan_duration=(end_time - start_time).total_seconds(),
+        scan_duration=scan_duration,
         methods_used=methods_used
     )
     
     # Create scan history record using the new database
-    scan_history = ScanHistory()
+    scan_history = get_scan_history()
     scan_id = scan_history.add_scan_result(scan_result)
     
     print(f"\nScan Results:")
@@ -263,8 +332,12 @@ def main():
         # Convert DuplicateGroup models to the format expected by auto_select_duplicates_for_deletion
         duplicate_groups_paths = [[str(file_info.path) for file_info in group.files] 
                                   for group in duplicate_groups if len(group.files) > 1]
+        # Reuse the modification times recorded during the scan instead of statting again
+        mtimes = {str(file_info.path): file_info.modified_timestamp 
+                  for group in duplicate_groups for file_info in group.files}
         
-        files_to_delete = auto_select_duplicates_for_deletion(duplicate_groups_paths, strategy=args.strategy)
+        files_to_delete = auto_select_duplicates_for_deletion(duplicate_groups_paths, strategy=args.strategy, 
+                                                              mtimes=mtimes)
         
         if files_to_delete:
             print(f"\nAuto-selected {len(files_to_delete)} files for deletion using '{args.strategy}' strategy:")
@@ -287,17 +360,17 @@ def main():
     else:
         # Log more detailed info when no duplicates found
         logger.info(f"No duplicates found. Scanning may have found {scanned_files_count} total files in {scan_directory}")
-        # Check what files were actually found
-        all_files = list(Path(scan_directory).rglob('*'))
-        text_files = [f for f in all_files if f.is_file() and f.suffix.lower() == '.txt']
-        logger.info(f"Found {len(text_files)} .txt files in directory: {[str(f) for f in text_files]}")
+        # Check what files were actually found; the scanner matches extensions
+        # on the name string, without a Path object or is_file() stat per file
+        text_files = list(scan_directory_for_files(scan_directory, ['.txt']))
+        logger.info(f"Found {len(text_files)} .txt files in directory: {text_files}")
         
         # Check content of text files to verify if they are actually duplicates
         for f in text_files:
             try:
                 with open(f, 'r', encoding='utf-8') as file:
                     content = file.read()
-                    logger.info(f"File {f.name}: content length = {len(content)}, content hash = {hash(content)}")
+                    logger.info(f"File {os.path.basename(f)}: content length = {len(content)}, content hash = {hash(content)}")
             except Exception as e:
                 logger.error(f"Could not read file {f}: {e}")
     
@@ -10,53 +10,152 @@ This script automates the entire process:
 
 import sys
 import os
+import functools
+import hashlib
+import importlib.util
+import shutil
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 import argparse
 import re
+from importlib.metadata import PackageNotFoundError, distributions, version as metadata_version
+
+# packaging parses requirement specifiers; pip vendors a copy when it is not
+# installed on its own
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+except ImportError:
+    try:
+        from pip._vendor.packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:
+        Requirement = None
 
 
 def read_requirements(requirements_path):
     """Read requirements from a file and return a list of requirements"""
-    with open(requirements_path, 'r', encoding='utf-8') as f:
-        requirements = [
-            line.strip() 
-            for line in f 
-            if line.strip() and not line.strip().startswith('#')
-        ]
+    requirements = []
+    for line in Path(requirements_path).read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line and line[0] != '#':
+            requirements.append(line)
     return requirements
 
 
+def _canonical_name(name):
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+# Keeps pip's child processes from opening a console window on Windows
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+
+def _needs_install_pip(req):
+    """Ask pip, in a dry run, whether a requirement would need installing"""
+    result = subprocess.run([
+        sys.executable, '-m', 'pip', 'install', '--dry-run', '--no-input',
+        '--disable-pip-version-check', req
+    ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, creationflags=_NO_WINDOW)
+    
+    # If return code is not 0, or if the dry run shows it would install something,
+    # then the package is missing or outdated
+    return result.returncode != 0 or "Would install" in result.stdout
+
+
+def _needs_install_metadata(req, installed):
+    """
+    Decide from installed package metadata whether a requirement needs installing.
+    
+    Returns True or False, None if the requirement does not apply to this
+    platform, or raises InvalidRequirement if it cannot be parsed.
+    """
+    requirement = Requirement(req)
+    if requirement.marker is not None and not requirement.marker.evaluate():
+        return None
+    version = installed.get(_canonical_name(requirement.name))
+    return version is None or not requirement.specifier.contains(version, prereleases=True)
+
+
 def check_installed_packages(requirements):
     """Check which packages are already installed with correct versions"""
     missing_or_outdated = []
     
+    # Installed versions are read once, in-process, from the package metadata
+    installed = {}
+    if Requirement is not None:
+        for dist in distributions():
+            name = dist.metadata['Name']
+            if name:
+                installed.setdefault(_canonical_name(name), dist.version)
+    
+    # Decide what the metadata can answer; the rest needs a pip dry run
+    results = {}
+    pip_probes = []
     for req in requirements:
-        if not req or req.startswith('#'):
+        if Requirement is None:
+            pip_probes.append(req)
             continue
-            
         try:
-            # Try to install package in dry-run mode to check if it's available
-            result = subprocess.run([
-                sys.executable, '-m', 'pip', 'install', '--dry-run', req
-            ], capture_output=True, text=True)
-            
-            # If return code is not 0, or if the dry run shows it would install something,
-            # then the package is missing or outdated
-            if result.returncode != 0 or "Would install" in result.stdout or "Would update" in result.stderr:
-                print(f"✗ {req} needs to be installed/updated")
-                missing_or_outdated.append(req)
-            else:
-                print(f"✓ {req} is already satisfied")
+            results[req] = _needs_install_metadata(req, installed)
+        except InvalidRequirement:
+            # Leave anything packaging cannot parse (URLs, options) to pip
+            pip_probes.append(req)
         except Exception as e:
-            print(f"⚠ Error checking {req}: {e}")
+            results[req] = e
+    
+    # Each dry run is a separate, mostly waiting, pip process, so run them concurrently
+    if pip_probes:
+        def probe(req):
+            try:
+                return _needs_install_pip(req)
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(pip_probes))) as executor:
+            results.update(zip(pip_probes, executor.map(probe, pip_probes)))
+    
+    # Report in requirements order
+    for req in requirements:
+        needs_install = results[req]
+        if isinstance(needs_install, Exception):
+            print(f"⚠ Error checking {req}: {needs_install}")
+            missing_or_outdated.append(req)
+        elif needs_install is None:
+            print(f"✓ {req} does not apply to this platform")
+        elif needs_install:
+            print(f"✗ {req} needs to be installed/updated")
             missing_or_outdated.append(req)
+        else:
+            print(f"✓ {req} is already satisfied")
     
     return missing_or_outdated
 
 
-def install_packages(packages):
+def run_streaming(cmd, verbose=False, tail_lines=20):
+    """
+    Run a command, reading its combined output line by line as it arrives.
+    
+    Only the last tail_lines lines are kept, so memory stays bounded however
+    much the command prints.
+    
+    Returns:
+        Tuple of (return code, the last lines of output as one string)
+    """
+    tail = deque(maxlen=tail_lines)
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                               text=True, bufsize=1)
+    with process:
+        for line in process.stdout:
+            tail.append(line)
+            if verbose:
+                sys.stdout.write(line)
+    return process.returncode, ''.join(tail)
+
+
+def install_packages(packages, verbose=False):
     """Install the specified packages using pip"""
     if not packages:
         print("No packages to install.")
@@ -64,30 +163,51 @@ def install_packages(packages):
     
     print(f"Installing {len(packages)} packages...")
     
-    # Create a temporary requirements file for installation
-    with open('.temp_requirements.txt', 'w', encoding='utf-8') as temp_file:
-        for package in packages:
-            temp_file.write(package + '\n')
+    # One pip invocation resolves and installs every package together
+    returncode, output_tail = run_streaming([
+        sys.executable, '-m', 'pip', 'install', '--no-input', *packages
+    ], verbose=verbose)
     
-    try:
-        result = subprocess.run([
-            sys.executable, '-m', 'pip', 'install', '-r', '.temp_requirements.txt'
-        ], check=True, capture_output=True, text=True)
-        
-        print("Installation completed successfully!")
-        if result.stdout:
-            print(result.stdout[-500:])  # Print last 500 chars of output
-    except subprocess.CalledProcessError as e:
-        print(f"Installation failed: {e}")
-        print(e.stderr)
+    if returncode != 0:
+        print(f"Installation failed with exit code {returncode}")
+        print(output_tail)
         return False
-    finally:
-        # Clean up the temporary file
-        Path('.temp_requirements.txt').unlink(missing_ok=True)
+    
+    print("Installation completed successfully!")
+    if output_tail and not verbose:
+        print(output_tail)
     
     return True
 
 
+# A plain 'name==version' pin, with no extras, markers or options
+_PINNED_REQUIREMENT = re.compile(r'([A-Za-z0-9][A-Za-z0-9._-]*)\s*==\s*([^\s;,*]+)')
+
+
+def pinned_requirements_satisfied(requirements):
+    """
+    Fast path for a fully pinned requirements file.
+    
+    When every requirement is a plain 'name==version' pin, compare the pins
+    directly with the installed versions; no specifier parsing and no pip.
+    
+    Returns:
+        True only if every requirement is pinned and installed at exactly that
+        version; False means the generic check has to run
+    """
+    pins = [_PINNED_REQUIREMENT.fullmatch(req) for req in requirements]
+    if not pins or not all(pins):
+        return False
+    
+    for pin in pins:
+        try:
+            if metadata_version(pin.group(1)) != pin.group(2):
+                return False
+        except PackageNotFoundError:
+            return False
+    return True
+
+
 def check_and_install_python_deps():
     """Check and install Python dependencies if needed"""
     requirements_file = 'requirements.txt'
@@ -101,6 +221,10 @@ def check_and_install_python_deps():
     
     print(f"Found {len(requirements)} requirements in {requirements_file}")
     
+    if pinned_requirements_satisfied(requirements):
+        print("\nAll pinned Python requirements are already installed!")
+        return True
+    
     missing_or_outdated = check_installed_packages(requirements)
     
     if not missing_or_outdated:
@@ -120,46 +244,141 @@ def check_and_install_python_deps():
             return False
 
 
+def _start_version_probe(command):
+    """Start a '<command> --version' process, or return None if it cannot be run"""
+    try:
+        return subprocess.Popen([command, '--version'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    except FileNotFoundError:
+        return None
+
+
+def _finish_version_probe(process):
+    """Wait for a version probe and return its version string, or None if it failed"""
+    if process is None:
+        return None
+    stdout, _ = process.communicate()
+    return stdout.strip() if process.returncode == 0 else None
+
+
+# Prints the Node.js version and the version of the npm bundled next to the
+# node executable, so both come from a single process; exits with 2 if the
+# bundled npm cannot be found
+_NODE_VERSIONS_SCRIPT = (
+    "const path = require('path'), fs = require('fs');"
+    "const dir = path.dirname(process.execPath);"
+    "console.log('v' + process.versions.node);"
+    "for (const p of [path.join(dir, 'node_modules', 'npm', 'package.json'),"
+    "                 path.join(dir, '..', 'lib', 'node_modules', 'npm', 'package.json')]) {"
+    "  try { console.log(JSON.parse(fs.readFileSync(p, 'utf8')).version); process.exit(0); } catch (e) {}"
+    "}"
+    "process.exit(2);"
+)
+
+
+def _probe_node_versions(node_bin):
+    """Return (node_version, npm_version) from one node process, or None if that is not possible"""
+    try:
+        result = subprocess.run([node_bin, '-e', _NODE_VERSIONS_SCRIPT],
+                                capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    lines = result.stdout.split()
+    if result.returncode != 0 or len(lines) != 2:
+        return None
+    return lines[0], lines[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_node_versions():
+    """
+    Return (node_version, npm_version), with None for a tool that is missing.
+    
+    Prints nothing, so it can run on a background thread. The result is
+    cached for the rest of the run.
+    """
+    # Look the tools up on PATH first, so a missing tool costs no process spawn
+    node_bin = shutil.which('node')
+    npm_bin = shutil.which('npm')
+    if node_bin is None:
+        return None, None
+    
+    versions = _probe_node_versions(node_bin) if npm_bin is not None else None
+    if versions is not None:
+        return versions
+    
+    # Fall back to asking each tool; launch both probes before waiting on either
+    node_process = _start_version_probe(node_bin)
+    npm_process = _start_version_probe(npm_bin) if npm_bin is not None else None
+    return _finish_version_probe(node_process), _finish_version_probe(npm_process)
+
+
+@functools.lru_cache(maxsize=1)
 def check_node_environment():
-    """Check if Node.js and npm are available"""
-    node_available = False
-    npm_available = False
+    """
+    Check if Node.js and npm are available.
     
-    try:
-        node_result = subprocess.run(['node', '--version'], 
-                                    capture_output=True, text=True, check=True)
-        print(f"✓ Node.js version: {node_result.stdout.strip()}")
-        node_available = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    The result is cached for the rest of the run, since setup_environment,
+    main and run_electron_app all ask the same question.
+    """
+    node_version, npm_version = _detect_node_versions()
+    
+    if node_version is None:
         print("✗ Node.js not found in PATH")
         return False  # If Node.js is not available, we can't proceed
+    print(f"✓ Node.js version: {node_version}")
     
-    try:
-        npm_result = subprocess.run(['npm', '--version'], 
-                                    capture_output=True, text=True, check=True)
-        print(f"✓ npm version: {npm_result.stdout.strip()}")
-        npm_available = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if npm_version is None:
         print("✗ npm not found in PATH")
         npm_available = False
+    else:
+        print(f"✓ npm version: {npm_version}")
+        npm_available = True
     
     # We need both Node.js and npm for the GUI to work properly
-    return node_available and npm_available
+    return npm_available
 
 
-def install_node_deps():
+def install_node_deps(verbose=False):
     """Install Node.js dependencies using npm"""
-    try:
-        print("Installing Node.js dependencies...")
-        result = subprocess.run(['npm', 'install'], 
-                                capture_output=True, text=True, check=True)
-        print("Node.js dependencies installed successfully!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to install Node.js dependencies: {e}")
+    print("Installing Node.js dependencies...")
+    returncode, output_tail = run_streaming([shutil.which('npm') or 'npm', 'install'], verbose=verbose)
+    if returncode != 0:
+        print(f"Failed to install Node.js dependencies (exit code {returncode}):")
+        print(output_tail)
         print("This might be because 'npm install' requires a package.json file.")
         print("Make sure you're running this script from the project root directory.")
         return False
+    print("Node.js dependencies installed successfully!")
+    return True
+
+
+# Fingerprint of the last environment setup that completed without errors
+SETUP_FINGERPRINT_PATH = Path('logs') / '.setup_fingerprint'
+
+
+def environment_fingerprint():
+    """
+    Hash everything the environment setup depends on: the dependency files,
+    the interpreter and platform, and which Node.js tools are on PATH.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for dependency_file in ('requirements.txt', 'package.json', 'package-lock.json'):
+        path = Path(dependency_file)
+        digest.update(dependency_file.encode('utf-8') + b'\0')
+        digest.update(path.read_bytes() if path.exists() else b'<missing>')
+    digest.update(repr(tuple(sys.version_info)).encode('utf-8'))
+    digest.update(sys.executable.encode('utf-8'))
+    digest.update(platform.platform().encode('utf-8'))
+    digest.update(repr((shutil.which('node'), shutil.which('npm'))).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _write_fingerprint(fingerprint):
+    """Record the fingerprint atomically so a crash never leaves a partial file"""
+    temp_path = SETUP_FINGERPRINT_PATH.with_name(SETUP_FINGERPRINT_PATH.name + '.tmp')
+    temp_path.write_text(fingerprint, encoding='utf-8')
+    os.replace(temp_path, SETUP_FINGERPRINT_PATH)
 
 
 def setup_environment():
@@ -174,14 +393,28 @@ def setup_environment():
     else:
         print("[OK] Logs directory already exists")
     
-    # Check and install Python dependencies
-    python_success = check_and_install_python_deps()
+    # Skip the checks when nothing they depend on changed since the last good setup
+    fingerprint = environment_fingerprint()
+    try:
+        if SETUP_FINGERPRINT_PATH.read_text(encoding='utf-8').strip() == fingerprint:
+            print("Environment already set up (fingerprint match)")
+            return True
+    except OSError:
+        pass
+    
+    # The Python dependency check and the Node.js probes are independent, so
+    # probe Node.js in the background; all output stays on this thread, in order
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        node_versions_future = executor.submit(_detect_node_versions)
+        python_success = check_and_install_python_deps()
+        node_versions_future.result()
+    node_available = check_node_environment()
+    
     if not python_success:
         print("Failed to install Python dependencies.")
         return False
     
-    # Check Node.js environment
-    node_available = check_node_environment()
+    node_success = True
     if node_available:
         # Install Node.js dependencies if needed
         node_success = install_node_deps()
@@ -190,10 +423,21 @@ def setup_environment():
     else:
         print("Node.js or npm not found in PATH. GUI mode will not work, but you can use CLI mode.")
     
+    # Only a setup without failures is remembered, so failed steps are retried next run
+    if node_success:
+        try:
+            _write_fingerprint(fingerprint)
+        except OSError as e:
+            print(f"Could not record the setup fingerprint: {e}")
+    
     print("Environment setup completed!")
     return True
 
 
+# Ignore list for --skip-build-dirs, shipped with the project
+BUILD_IGNORE_PATH = Path(__file__).parent / 'configs' / 'default_build_ignore.txt'
+
+
 def run_cli_app(directory=None, extensions=None, method=None, skip_build_dirs=False):
     """Run the command-line interface version of the app"""
     cmd = [sys.executable, 'main.py']
@@ -208,54 +452,21 @@ def run_cli_app(directory=None, extensions=None, method=None, skip_build_dirs=Fa
         cmd.extend(['--method', method])
     
     if skip_build_dirs:
-        # Create a temporary ignore list file with the correct format
-        import tempfile
-        import os
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='_ignore_list.txt', delete=False) as f:
-            f.write("# Auto-generated ignore list to skip build directories\n")
-            f.write("DIR:node_modules\n")      # node_modules directory
-            f.write("DIR:.git\n")             # .git directory
-            f.write("DIR:.svn\n")             # .svn directory
-            f.write("DIR:.hg\n")              # .hg directory
-            f.write("DIR:dist\n")             # dist directory
-            f.write("DIR:build\n")            # build directory
-            f.write("DIR:target\n")           # target directory (Rust/Java)
-            f.write("DIR:.vscode\n")          # VSCode settings
-            f.write("DIR:.idea\n")            # IntelliJ/PyCharm settings
-            f.write("DIR:__pycache__\n")      # Python cache
-            f.write("DIR:.pytest_cache\n")    # pytest cache
-            f.write("DIR:.next\n")            # Next.js cache
-            f.write("DIR:out\n")              # Output directory
-            ignore_file = f.name
-        
-        cmd.extend(['--ignore-list-file', ignore_file])
-        
-        try:
-            print(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True)
-            return result.returncode
-        except subprocess.CalledProcessError as e:
-            print(f"Error running the CLI app: {e}")
-            return e.returncode
-        except FileNotFoundError:
-            print("Error: main.py not found in the current directory.")
-            return 1
-        finally:
-            # Clean up the temporary file
-            import os
-            os.remove(ignore_file)
-    else:
-        try:
-            print(f"Running command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True)
-            return result.returncode
-        except subprocess.CalledProcessError as e:
-            print(f"Error running the CLI app: {e}")
-            return e.returncode
-        except FileNotFoundError:
-            print("Error: main.py not found in the current directory.")
+        if not BUILD_IGNORE_PATH.is_file():
+            print(f"Error: build-directory ignore list not found: {BUILD_IGNORE_PATH}")
             return 1
+        cmd.extend(['--ignore-list-file', str(BUILD_IGNORE_PATH)])
+    
+    try:
+        print(f"Running command: {' '.join(cmd)}")
+        result = subprocess.run(cmd, check=True)
+        return result.returncode
+    except subprocess.CalledProcessError as e:
+        print(f"Error running the CLI app: {e}")
+        return e.returncode
+    except FileNotFoundError:
+        print("Error: main.py not found in the current directory.")
+        return 1
 
 
 def run_electron_app():
@@ -284,6 +495,59 @@ def run_electron_app():
         return 1
 
 
+def use_tk_picker(flag=None):
+    """
+    Decide whether to offer the Python directory picker.
+    
+    The --tk-picker/--no-tk-picker flag wins, then the DFF_TK_PICKER
+    environment variable; otherwise the user is asked, but only when stdin is
+    a terminal, so headless runs never block on the prompt.
+    """
+    if flag is not None:
+        return flag
+    
+    env_value = os.environ.get('DFF_TK_PICKER', '').strip().lower()
+    if env_value in ('1', 'true', 'yes', 'y', 'on'):
+        return True
+    if env_value in ('0', 'false', 'no', 'n', 'off'):
+        return False
+    
+    if not sys.stdin or not sys.stdin.isatty():
+        return False
+    
+    print("\nPython GUI components are available. Would you like to try the Python-based file selector?")
+    print("This will allow you to select a directory for scanning.")
+    return input("Use Python GUI for directory selection? (y/n): ").lower().strip().startswith('y')
+
+
+def pick_directory_with_tk():
+    """
+    Ask for a directory with a Tk dialog.
+    
+    tkinter is imported, and Tcl/Tk started, only here; the hidden root
+    window is always destroyed afterwards.
+    
+    Returns:
+        The selected directory, or None if the dialog was cancelled or Tk
+        could not start
+    """
+    import tkinter
+    from tkinter import filedialog
+    
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        # e.g. no display available
+        print(f"Could not start the Python GUI: {e}")
+        return None
+    
+    root.withdraw()  # Hide the main window
+    try:
+        return filedialog.askdirectory(title="Select Directory to Scan for Duplicates") or None
+    finally:
+        root.destroy()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Setup and run Duplicate File Finder')
     parser.add_argument('--mode', choices=['cli', 'gui'], default='gui',
@@ -296,6 +560,11 @@ def main():
                         help='Detection method to use (CLI mode only)')
     parser.add_argument('--skip-build-dirs', action='store_true',
                         help='Skip common build directories like node_modules, .git, etc. for faster scanning')
+    parser.add_argument('--tk-picker', dest='tk_picker', action='store_true', default=None,
+                        help='Use the Python directory picker when the Electron GUI is unavailable '
+                             '[default: $DFF_TK_PICKER, else ask when run interactively]')
+    parser.add_argument('--no-tk-picker', dest='tk_picker', action='store_false', default=None,
+                        help='Never use the Python directory picker')
     
     args = parser.parse_args()
     
@@ -333,21 +602,10 @@ def main():
             print("The Electron-based GUI application cannot be started.")
             print("\nHowever, you can still use the Python-based GUI if available.")
             
-            # Check if tkinter is available for a simple GUI
-            try:
-                import tkinter
-                from tkinter import filedialog
-                
-                print("\nPython GUI components are available. Would you like to try the Python-based file selector?")
-                print("This will allow you to select a directory for scanning.")
-                
-                use_python_gui = input("Use Python GUI for directory selection? (y/n): ").lower().strip()
-                
-                if use_python_gui.startswith('y'):
-                    root = tkinter.Tk()
-                    root.withdraw()  # Hide the main window
-                    
-                    directory = filedialog.askdirectory(title="Select Directory to Scan for Duplicates")
+            # Check if tkinter is available for a simple GUI, without loading Tcl/Tk yet
+            if importlib.util.find_spec('tkinter') is not None:
+                if use_tk_picker(args.tk_picker):
+                    directory = pick_directory_with_tk()
                     
                     if directory:
                         print(f"Selected directory: {directory}")
@@ -365,7 +623,7 @@ def main():
                     print("  python setup_and_run.py --mode cli [directory]")
                     print("\nOr install dependencies with: npm install")
                     exit_code = 1
-            except ImportError:
+            else:
                 print("\nPython GUI components (tkinter) are not available.")
                 print("\nAs an alternative, you can run in CLI mode using:")
                 print("  python setup_and_run.py --mode cli [directory]")
@@ -1,6 +1,10 @@
-import tempfile
 import os
-from pathlib import Path
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from core.advanced_grouping import (
     group_by_advanced_patterns,
     group_files_by_relationships,
@@ -9,85 +13,107 @@ from core.advanced_grouping import (
     normalize_for_grouping
 )
 
-# Create temporary files for testing
-with tempfile.TemporaryDirectory() as tmp_dir:
-    # Create test files with various naming patterns that should be grouped
-    test_files = [
-        'abc.jpg',
-        'abc_1.jpg',
-        'abc_2.jpg',
-        'abc (1).jpg',
-        'abc (2).jpg',
-        'photo.png',
-        'photo_1.png',
-        'photo (copy).png',
-        'document.pdf',
-        'document_v1.pdf',
-        'document_v2.pdf',
-        'image copy.jpg',
-        'image (copy).jpg',
-        'special_001.jpg',
-        'special_002.jpg',
-        'unique_file.txt'
-    ]
-    
-    file_paths = []
-    for filename in test_files:
-        file_path = os.path.join(tmp_dir, filename)
-        with open(file_path, 'w') as f:
-            # Write content based on the file type to create actual duplicates where needed
-            if 'abc' in filename:
-                f.write('abc content')
-            elif 'photo' in filename:
-                f.write('photo content')
-            elif 'document' in filename:
-                f.write('document content')
-            elif 'image' in filename:
-                f.write('image content')
-            elif 'special' in filename:
-                f.write('special content')
-            else:
-                f.write('unique content')
-        file_paths.append(file_path)
-    
-    print('Test files created:')
-    for path in file_paths:
-        print(f'  {Path(path).name}')
+# Test files with various naming patterns that should be grouped
+TEST_FILES = [
+    'abc.jpg',
+    'abc_1.jpg',
+    'abc_2.jpg',
+    'abc (1).jpg',
+    'abc (2).jpg',
+    'photo.png',
+    'photo_1.png',
+    'photo (copy).png',
+    'document.pdf',
+    'document_v1.pdf',
+    'document_v2.pdf',
+    'image copy.jpg',
+    'image (copy).jpg',
+    'special_001.jpg',
+    'special_002.jpg',
+    'unique_file.txt'
+]
+
+
+# Content by file type, so files that should match really do
+CONTENT_MAP = {
+    'abc': b'abc content',
+    'photo': b'photo content',
+    'document': b'document content',
+    'image': b'image content',
+    'special': b'special content',
+}
+_CONTENT_KEY = re.compile('|'.join(CONTENT_MAP))
+
+
+def file_content(filename):
+    match = _CONTENT_KEY.search(filename)
+    return CONTENT_MAP[match.group(0)] if match else b'unique content'
+
+
+@pytest.fixture(scope="module")
+def grouping_files(tmp_path_factory):
+    """Create the test files once and share them across the module's tests."""
+    tmp_dir = tmp_path_factory.mktemp("advanced_grouping")
     
-    # Test advanced grouping functionality
-    print('\n--- Testing Advanced Grouping ---')
+    items = [(tmp_dir / filename, file_content(filename)) for filename in TEST_FILES]
     
-    # Test 1: Advanced pattern grouping
-    print('\n1. Testing advanced pattern grouping:')
-    results = group_by_advanced_patterns(file_paths)
-    for base_name, matches in results.items():
-        if matches:
-            print(f'  {base_name}: {[Path(f).name for f in matches]}')
+    # File creation is I/O bound, so write the files concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: item[0].write_bytes(item[1]), items))
     
-    # Test 2: Relationship-based grouping
-    print('\n2. Testing relationship-based grouping:')
-    relationship_results = group_files_by_relationships(file_paths)
-    for i, group in enumerate(relationship_results, 1):
-        if group:
-            print(f'  Group {i}: {[Path(f).name for f in group]}')
+    # The grouping API takes path strings; convert once here
+    return [str(file_path) for file_path, _ in items]
+
+
+def names(paths):
+    return sorted(os.path.basename(f) for f in paths)
+
+
+def test_advanced_patterns(grouping_files):
+    results = group_by_advanced_patterns(grouping_files)
+    groups = [names(matches) for matches in results.values() if matches]
     
-    # Test 3: Custom rule-based grouping
-    print('\n3. Testing custom rule-based grouping:')
-    custom_results = group_by_custom_rules(file_paths)
-    for rule_name, matches in custom_results.items():
-        if matches:
-            print(f'  {rule_name}: {[Path(f).name for f in matches]}')
+    assert ['abc.jpg', 'abc_1.jpg', 'abc_2.jpg'] in groups
+    assert ['photo.png', 'photo_1.png'] in groups
+    assert ['special_001.jpg', 'special_002.jpg'] in groups
+    assert not any('unique_file.txt' in group for group in groups)
+
+
+def test_relationship_grouping(grouping_files):
+    groups = [names(group) for group in group_files_by_relationships(grouping_files) if group]
     
-    # Test 4: Extract base name with pattern
-    print('\n4. Testing base name extraction:')
-    for filename in test_files[:6]:  # Test with first few files
-        base_name, pattern_type = extract_base_name_with_pattern(filename)
-        print(f'  {filename} -> Base: {base_name}, Pattern: {pattern_type}')
+    assert ['abc.jpg', 'abc_1.jpg', 'abc_2.jpg'] in groups
+    assert ['photo.png', 'photo_1.png'] in groups
+    assert not any('unique_file.txt' in group for group in groups)
+
+
+def test_custom_rule_grouping(grouping_files):
+    results = group_by_custom_rules(grouping_files)
     
-    # Test 5: Normalize for grouping
-    print('\n5. Testing normalization for grouping:')
-    for filename in test_files[:6]:  # Test with first few files
-        normalized = normalize_for_grouping(filename)
-        print(f'  {filename} -> Normalized: {normalized}')
+    assert names(results['underscore_number:abc']) == ['abc_1.jpg', 'abc_2.jpg']
+    assert names(results['underscore_number:special']) == ['special_001.jpg', 'special_002.jpg']
+    assert names(results['version_number:document']) == ['document_v1.pdf', 'document_v2.pdf']
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ('abc.jpg', ('abc', 'original')),
+    ('abc_1.jpg', ('abc', 'underscore_number_1')),
+    ('abc_2.jpg', ('abc', 'underscore_number_2')),
+    ('photo.png', ('photo', 'original')),
+])
+def test_extract_base_name_with_pattern(filename, expected):
+    assert extract_base_name_with_pattern(filename) == expected
+
+
+@pytest.mark.parametrize("filename, expected", [
+    ('abc.jpg', 'abc'),
+    ('abc_1.jpg', 'abc'),
+    ('abc_2.jpg', 'abc'),
+    ('photo.png', 'photo'),
+])
+def test_normalize_for_grouping(filename, expected):
+    assert normalize_for_grouping(filename) == expected
+
 
-print('\n--- Advanced Grouping Test Complete ---')
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
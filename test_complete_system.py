@@ -3,14 +3,15 @@ Complete system test suite for Duplicate File Finder.
 
 This test suite validates both the backend functionality and UI components.
 """
-import tempfile
 import os
 import json
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
+import pytest
+
 # Backend imports
 from core.duplicate_detection import find_all_duplicates, merge_duplicate_groups
 from core.scanning import scan_directory_for_files
@@ -35,111 +36,133 @@ def create_test_files(base_dir: str, file_specs: List[tuple]) -> List[str]:
     Returns:
         List of created file paths
     """
-    file_paths = []
-    for filename, content in file_specs:
-        file_path = os.path.join(base_dir, filename)
-        with open(file_path, 'wb') as f:
-            f.write(content)
-        file_paths.append(file_path)
+    file_paths = [os.path.join(base_dir, filename) for filename, _ in file_specs]
+    
+    # File creation is I/O bound, so write the files concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write_file, file_paths, (content for _, content in file_specs)))
     return file_paths
 
 
-def test_backend_functions():
+def _write_file(file_path: str, content: bytes):
+    """Write content with one os.write, without a buffered file object."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+    try:
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def module_tmp(tmp_path_factory):
+    """One temporary directory shared by all tests in this module."""
+    return tmp_path_factory.mktemp("complete_system")
+
+
+@pytest.fixture
+def tmp_dir(module_tmp, request):
+    """A fresh subdirectory of the module's temporary directory for one test."""
+    test_dir = module_tmp / request.node.name
+    test_dir.mkdir()
+    return str(test_dir)
+
+
+@pytest.fixture
+def history(module_tmp, request):
+    """A scan history in the module's temporary directory, outside the scanned test files."""
+    scan_history = ScanHistory(str(module_tmp / f"{request.node.name}_history.db"))
+    yield scan_history
+    scan_history.close()
+
+
+def test_backend_functions(tmp_dir, history):
     """Test all backend functions."""
     print("\n--- Testing Backend Functions ---")
     
-    # Create a new scan history instance with a temporary file to avoid conflicts
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_hist_file:
-        tmp_hist_path = tmp_hist_file.name
-    
-    # Create history manager with temporary path
-    history = ScanHistory(tmp_hist_path)
-    
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create test files
-        test_files = [
-            ('file1.txt', b'content1'),
-            ('file2.txt', b'content1'),  # duplicate of file1
-            ('file3.txt', b'content2'),
-            ('file4.txt', b'content2'),  # duplicate of file3
-            ('file5.txt', b'unique_content'),
-            ('abc.jpg', b'jpg_content'),
-            ('abc_1.jpg', b'jpg_content'),  # related to abc
-            ('abc_2.jpg', b'jpg_content'),  # related to abc
-            ('abc (1).jpg', b'jpg_content2'),
-            ('abc (2).jpg', b'jpg_content2'),  # related to abc (1)
-            ('normal.txt', b'content2'),
-            ('ignored.tmp', b'content3'),
-        ]
-        
-        file_paths = create_test_files(tmp_dir, test_files)
-        
-        # Test basic duplicate detection
-        hash_results = find_duplicates_by_hash(file_paths)
-        print(f"✓ Hash detection: {len(hash_results)} groups found")
-        # Note: The actual number might vary based on the content, so we'll just verify it runs without error
-        
-        # Test filename-based detection
-        filename_results = find_duplicates_by_filename(file_paths)
-        print(f"✓ Filename detection: {len(filename_results)} groups found")
-        
-        # Test full detection
-        results = find_all_duplicates(tmp_dir, extensions=['.txt', '.jpg'])
-        print(f"✓ Full detection: {len(results)} methods tested")
-        assert len(results) >= 3, f"Expected at least 3 detection methods, got {len(results)}"
-        
-        # Test merging
-        merged = merge_duplicate_groups(results)
-        print(f"✓ Merged results: {len(merged)} groups created")
-        assert len(merged) >= 1, f"Expected at least 1 merged group, got {len(merged)}"
-        
-        # Test advanced grouping
-        advanced_results = group_by_advanced_patterns(file_paths)
-        print(f"✓ Advanced pattern grouping: {len(advanced_results)} groups found")
-        
-        relationship_results = group_files_by_relationships(file_paths)
-        print(f"✓ Relationship-based grouping: {len(relationship_results)} groups found")
-        assert len(relationship_results) >= 1, f"Expected at least 1 relationship group, got {len(relationship_results)}"
-        
-        # Test size filtering
-        filtered, excluded = filter_files_by_size(file_paths, min_size_mb=0.0005, max_size_mb=0.5)
-        print(f"✓ Size filtering: {len(filtered)} included, {len(excluded)} excluded")
-        
-        # Test ignore list
-        ignore_list = IgnoreList()
-        ignore_list.add_extension('.tmp')
-        filtered_by_ignore = ignore_list.filter_paths(file_paths)
-        print(f"✓ Ignore list: {len(file_paths)} total, {len(filtered_by_ignore)} after filtering")
-        
-        # Should only have normal_file.txt and image.jpg left (2 files)
-        expected_remaining = len(file_paths) - 1  # Only ignored.tmp should be filtered out
-        assert len(filtered_by_ignore) == expected_remaining, f"Expected {expected_remaining} files after ignore, got {len(filtered_by_ignore)}"
-        
-        # Test custom rules
-        custom_rules, rule_names = create_custom_rule_set(
-            suffix_rules=['_copy', '_duplicate'],
-            regex_rules=[r'.*_[0-9]+\.[^.]+$']  # Pattern for abc_1, abc_2
-        )
-        
-        custom_results = find_duplicates_by_custom_rules(file_paths, custom_rules, rule_names)
-        print(f"✓ Custom rules: {len(custom_results)} groups found")
-        # Note: The test files don't have _copy or _duplicate suffixes, so we might not get groups for those
-        # But the regex should match abc_1.jpg and abc_2.jpg patterns
-        
-        # Test scan history - add a record and verify it's the only one
-        history.add_scan_record(tmp_dir, results, file_count=10, duplicate_groups=2)
-        recent = history.get_recent_scans(5)
-        print(f"✓ Scan history: {len(recent)} records found after adding one")
-        assert len(recent) == 1, f"Expected 1 scan record after adding one, got {len(recent)}"
-        
-        # Test settings manager
-        settings = SettingsManager()
-        settings.set_setting('test_option', 'test_value')
-        retrieved_value = settings.get_setting('test_option')
-        print(f"✓ Settings manager: retrieved value '{retrieved_value}'")
-        assert retrieved_value == 'test_value', f"Expected 'test_value', got {retrieved_value}"
-        
-        print("✓ All backend functions tested successfully")
+    # Create test files
+    test_files = [
+        ('file1.txt', b'content1'),
+        ('file2.txt', b'content1'),  # duplicate of file1
+        ('file3.txt', b'content2'),
+        ('file4.txt', b'content2'),  # duplicate of file3
+        ('file5.txt', b'unique_content'),
+        ('abc.jpg', b'jpg_content'),
+        ('abc_1.jpg', b'jpg_content'),  # related to abc
+        ('abc_2.jpg', b'jpg_content'),  # related to abc
+        ('abc (1).jpg', b'jpg_content2'),
+        ('abc (2).jpg', b'jpg_content2'),  # related to abc (1)
+        ('normal.txt', b'content2'),
+        ('ignored.tmp', b'content3'),
+    ]
+    
+    file_paths = create_test_files(tmp_dir, test_files)
+    
+    # Test basic duplicate detection
+    hash_results = find_duplicates_by_hash(file_paths)
+    print(f"✓ Hash detection: {len(hash_results)} groups found")
+    # Note: The actual number might vary based on the content, so we'll just verify it runs without error
+    
+    # Test filename-based detection
+    filename_results = find_duplicates_by_filename(file_paths)
+    print(f"✓ Filename detection: {len(filename_results)} groups found")
+    
+    # Test full detection
+    results = find_all_duplicates(tmp_dir, extensions=['.txt', '.jpg'])
+    print(f"✓ Full detection: {len(results)} methods tested")
+    assert len(results) >= 3, f"Expected at least 3 detection methods, got {len(results)}"
+    
+    # Test merging
+    merged = merge_duplicate_groups(results)
+    print(f"✓ Merged results: {len(merged)} groups created")
+    assert len(merged) >= 1, f"Expected at least 1 merged group, got {len(merged)}"
+    
+    # Test advanced grouping
+    advanced_results = group_by_advanced_patterns(file_paths)
+    print(f"✓ Advanced pattern grouping: {len(advanced_results)} groups found")
+    
+    relationship_results = group_files_by_relationships(file_paths)
+    print(f"✓ Relationship-based grouping: {len(relationship_results)} groups found")
+    assert len(relationship_results) >= 1, f"Expected at least 1 relationship group, got {len(relationship_results)}"
+    
+    # Test size filtering
+    filtered, excluded = filter_files_by_size(file_paths, min_size_mb=0.0005, max_size_mb=0.5)
+    print(f"✓ Size filtering: {len(filtered)} included, {len(excluded)} excluded")
+    
+    # Test ignore list
+    ignore_list = IgnoreList()
+    ignore_list.add_extension('.tmp')
+    filtered_by_ignore = ignore_list.filter_paths(file_paths)
+    print(f"✓ Ignore list: {len(file_paths)} total, {len(filtered_by_ignore)} after filtering")
+    
+    # Should only have normal_file.txt and image.jpg left (2 files)
+    expected_remaining = len(file_paths) - 1  # Only ignored.tmp should be filtered out
+    assert len(filtered_by_ignore) == expected_remaining, f"Expected {expected_remaining} files after ignore, got {len(filtered_by_ignore)}"
+    
+    # Test custom rules
+    custom_rules, rule_names = create_custom_rule_set(
+        suffix_rules=['_copy', '_duplicate'],
+        regex_rules=[r'.*_[0-9]+\.[^.]+$']  # Pattern for abc_1, abc_2
+    )
+    
+    custom_results = find_duplicates_by_custom_rules(file_paths, custom_rules, rule_names)
+    print(f"✓ Custom rules: {len(custom_results)} groups found")
+    # Note: The test files don't have _copy or _duplicate suffixes, so we might not get groups for those
+    # But the regex should match abc_1.jpg and abc_2.jpg patterns
+    
+    # Test scan history - add a record and verify it's the only one
+    history.add_scan_record(tmp_dir, results, file_count=10, duplicate_groups=2)
+    recent = history.get_recent_scans(5)
+    print(f"✓ Scan history: {len(recent)} records found after adding one")
+    assert len(recent) == 1, f"Expected 1 scan record after adding one, got {len(recent)}"
+    
+    # Test settings manager
+    settings = SettingsManager()
+    settings.set_setting('test_option', 'test_value')
+    retrieved_value = settings.get_setting('test_option')
+    print(f"✓ Settings manager: retrieved value '{retrieved_value}'")
+    assert retrieved_value == 'test_value', f"Expected 'test_value', got {retrieved_value}"
+    
+    print("✓ All backend functions tested successfully")
 
 
 def test_ui_components():
@@ -202,16 +225,15 @@ def test_cli_interface():
     """Test the command-line interface."""
     print("\n--- Testing CLI Interface ---")
     
-    # Test help command
+    # Test help command, rendered in-process instead of spawning an interpreter
     try:
-        result = subprocess.run([sys.executable, 'main.py', '--help'], 
-                               capture_output=True, text=True, cwd=os.getcwd())
+        from main import build_parser
+        help_output = build_parser({}).format_help()
         
-        if result.returncode == 0:
+        if help_output:
             print("✓ CLI help command: PASSED")
             
             # Check if expected options are present
-            help_output = result.stdout
             expected_options = [
                 '--strategy', '--delete', '--similarity', '--extensions', 
                 '--method', '--use-custom-rules', '--use-advanced-grouping',
@@ -229,175 +251,133 @@ def test_cli_interface():
             else:
                 print("✓ All expected CLI options present")
         else:
-            print(f"✗ CLI help command: FAILED - {result.stderr}")
+            print("✗ CLI help command: FAILED - empty help output")
             
     except Exception as e:
         print(f"✗ CLI help command test failed: {str(e)}")
     
+    # A non-positive thread count is a usage error, not a validation traceback
+    from main import build_parser
+    parser = build_parser({})
+    for bad_value in ('0', '-1', 'two'):
+        try:
+            parser.parse_args(['.', '--stat-threads', bad_value])
+        except SystemExit as e:
+            assert e.code == 2, f"Expected a usage error for --stat-threads {bad_value}"
+        else:
+            raise AssertionError(f"--stat-threads {bad_value} should be rejected")
+    assert parser.parse_args(['.', '--stat-threads', '4']).stat_threads == 4
+    print("✓ --stat-threads validation: PASSED")
+    
     print("✓ CLI interface test completed")
 
 
-def test_settings_export_import():
+def test_settings_export_import(tmp_dir):
     """Test settings export/import functionality."""
     print("\n--- Testing Settings Export/Import ---")
     
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        export_path = os.path.join(tmp_dir, 'exported_settings.json')
-        
-        # Create settings manager and modify some settings
-        settings = SettingsManager()
-        settings.set_setting('auto_select_strategy', 'newest')
-        settings.set_setting('min_file_size_mb', 0.5)
-        settings.set_setting('test_custom_option', 'custom_value')
-        
-        # Export settings
-        export_success = settings.export_settings(export_path)
-        print(f"✓ Settings export: {'PASSED' if export_success else 'FAILED'}")
+    export_path = os.path.join(tmp_dir, 'exported_settings.json')
+    
+    # Create settings manager and modify some settings
+    settings = SettingsManager()
+    settings.set_setting('auto_select_strategy', 'newest')
+    settings.set_setting('min_file_size_mb', 0.5)
+    settings.set_setting('test_custom_option', 'custom_value')
+    
+    # Export settings
+    export_success = settings.export_settings(export_path)
+    print(f"✓ Settings export: {'PASSED' if export_success else 'FAILED'}")
+    
+    if export_success:
+        # Import settings to a new manager
+        new_settings = SettingsManager()
+        import_success = new_settings.import_settings(export_path)
+        print(f"✓ Settings import: {'PASSED' if import_success else 'FAILED'}")
         
-        if export_success:
-            # Import settings to a new manager
-            new_settings = SettingsManager()
-            import_success = new_settings.import_settings(export_path)
-            print(f"✓ Settings import: {'PASSED' if import_success else 'FAILED'}")
+        if import_success:
+            # Verify settings were imported
+            strategy = new_settings.get_setting('auto_select_strategy')
+            min_size = new_settings.get_setting('min_file_size_mb')
+            custom_val = new_settings.get_setting('test_custom_option')
+            
+            print(f"✓ Imported strategy: {strategy}")
+            print(f"✓ Imported min size: {min_size}")
+            print(f"✓ Imported custom value: {custom_val}")
             
-            if import_success:
-                # Verify settings were imported
-                strategy = new_settings.get_setting('auto_select_strategy')
-                min_size = new_settings.get_setting('min_file_size_mb')
-                custom_val = new_settings.get_setting('test_custom_option')
-                
-                print(f"✓ Imported strategy: {strategy}")
-                print(f"✓ Imported min size: {min_size}")
-                print(f"✓ Imported custom value: {custom_val}")
-                
-                if strategy == 'newest' and min_size == 0.5 and custom_val == 'custom_value':
-                    print("✓ Settings values match expected values")
-                else:
-                    print("✗ Settings values do not match expected values")
+            if strategy == 'newest' and min_size == 0.5 and custom_val == 'custom_value':
+                print("✓ Settings values match expected values")
             else:
-                print("✗ Settings import failed")
+                print("✗ Settings values do not match expected values")
         else:
-            print("✗ Settings export failed")
+            print("✗ Settings import failed")
+    else:
+        print("✗ Settings export failed")
 
 
-def test_integration():
+def test_integration(tmp_dir, history):
     """Test integration of all components."""
     print("\n--- Testing Integration ---")
     
-    # Create a new scan history instance with a temporary file to avoid conflicts
-    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp_hist_file:
-        tmp_hist_path = tmp_hist_file.name
-    
-    # Create history manager with temporary path
-    history = ScanHistory(tmp_hist_path)
-    
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        # Create files with various patterns
-        test_files = [
-            ('abc.jpg', b'content1'),
-            ('abc_1.jpg', b'content1'),  # related to abc
-            ('abc_2.jpg', b'content1'),  # related to abc
-            ('normal.txt', b'content2'),
-            ('ignored.tmp', b'content3'),
-        ]
-        
-        file_paths = create_test_files(tmp_dir, test_files)
-        
-        # Create an ignore list
-        ignore_list = IgnoreList()
-        ignore_list.add_extension('.tmp')
-        
-        # Run full detection with multiple features enabled
-        results = find_all_duplicates(
-            tmp_dir,
-            extensions=['.jpg', '.txt', '.tmp'],
-            use_hash=True,
-            use_filename=True,
-            use_size=True,
-            use_patterns=True,
-            use_custom_rules=True,
-            use_advanced_grouping=True,
-            min_file_size_mb=0.000001,  # Very small min size
-            max_file_size_mb=1.0,      # 1MB max
-            ignore_list=ignore_list,
-            suffix_rules=['_copy', '_duplicate'],
-            regex_rules=[r'.*_[0-9]+\.[^.]+$']  # Pattern for abc_1, abc_2
-        )
-        
-        print(f"✓ Integration test found results for methods: {list(results.keys())}")
-        
-        # Check that ignore list worked (should not include ignored.tmp)
-        all_files_found = []
-        for method_results in results.values():
-            for file_list in method_results.values():
-                all_files_found.extend(file_list)
-        
-        ignored_files = [f for f in all_files_found if 'ignored.tmp' in f]
-        if len(ignored_files) == 0:
-            print("✓ Ignore list correctly filtered files")
-        else:
-            print(f"✗ Ignore list failed, found {len(ignored_files)} ignored files in results")
-        
-        # Test merging results
-        merged = merge_duplicate_groups(results)
-        print(f"✓ Integration test merged into {len(merged)} groups")
-        
-        # Record in scan history
-        history.add_scan_record(
-            tmp_dir, 
-            results, 
-            file_count=len(file_paths), 
-            duplicate_groups=len(merged)
-        )
-        
-        recent = history.get_recent_scans(1)
-        if recent:
-            print(f"✓ Scan history recorded: {recent[0]['id']}")
-        
-        assert len(merged) >= 1, f"Expected at least 1 merged group, got {len(merged)}"
-        print("✓ Integration test passed")
-    
-    # Clean up temporary history file
-    if os.path.exists(tmp_hist_path):
-        os.remove(tmp_hist_path)
-
-
-def run_complete_system_tests():
-    """Run all system tests and report results."""
-    print("Running Complete System Test Suite for Duplicate File Finder")
-    print("=" * 70)
-    
-    tests = [
-        ("Backend Functions", test_backend_functions),
-        ("UI Components", test_ui_components),
-        ("CLI Interface", test_cli_interface),
-        ("Settings Export/Import", test_settings_export_import),
-        ("Integration", test_integration)
+    # Create files with various patterns
+    test_files = [
+        ('abc.jpg', b'content1'),
+        ('abc_1.jpg', b'content1'),  # related to abc
+        ('abc_2.jpg', b'content1'),  # related to abc
+        ('normal.txt', b'content2'),
+        ('ignored.tmp', b'content3'),
     ]
     
-    passed = 0
-    failed = 0
+    file_paths = create_test_files(tmp_dir, test_files)
     
-    for test_name, test_func in tests:
-        try:
-            print(f"\n{'='*20} {test_name} {'='*20}")
-            test_func()
-            passed += 1
-        except Exception as e:
-            print(f"\n✗ {test_name} FAILED: {str(e)}")
-            failed += 1
-    
-    print("\n" + "=" * 70)
-    print(f"Complete System Test Results: {passed} passed, {failed} failed")
-    
-    if failed == 0:
-        print("🎉 All system tests passed! The application is working correctly.")
-        return True
-    else:
-        print("❌ Some system tests failed. Please review the output above.")
-        return False
+    # Create an ignore list
+    ignore_list = IgnoreList()
+    ignore_list.add_extension('.tmp')
+    
+    # Run full detection with multiple features enabled
+    results = find_all_duplicates(
+        tmp_dir,
+        extensions=['.jpg', '.txt', '.tmp'],
+        use_hash=True,
+        use_filename=True,
+        use_size=True,
+        use_patterns=True,
+        use_custom_rules=True,
+        use_advanced_grouping=True,
+        min_file_size_mb=0.000001,  # Very small min size
+        max_file_size_mb=1.0,      # 1MB max
+        ignore_list=ignore_list,
+        suffix_rules=['_copy', '_duplicate'],
+        regex_rules=[r'.*_[0-9]+\.[^.]+$']  # Pattern for abc_1, abc_2
+    )
+    
+    print(f"✓ Integration test found results for methods: {list(results.keys())}")
+    
+    # Check that ignore list worked (should not include ignored.tmp)
+    found_basenames = {os.path.basename(f) for method_results in results.values()
+                       for file_list in method_results.values() for f in file_list}
+    
+    assert 'ignored.tmp' not in found_basenames, "Ignore list failed, found ignored.tmp in results"
+    print("✓ Ignore list correctly filtered files")
+    
+    # Test merging results
+    merged = merge_duplicate_groups(results)
+    print(f"✓ Integration test merged into {len(merged)} groups")
+    
+    # Record in scan history
+    history.add_scan_record(
+        tmp_dir, 
+        results, 
+        file_count=len(file_paths), 
+        duplicate_groups=len(merged)
+    )
+    
+    recent = history.get_recent_scans(1)
+    if recent:
+        print(f"✓ Scan history recorded: {recent[0]['id']}")
+    
+    assert len(merged) >= 1, f"Expected at least 1 merged group, got {len(merged)}"
+    print("✓ Integration test passed")
 
 
 if __name__ == "__main__":
-    success = run_complete_system_tests()
-    exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -5,13 +5,15 @@ This module runs automated tests on all core functions without UI.
 import os
 import sys
 import time
+import atexit
+import shutil
 import tempfile
 import logging
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 from PIL import Image
-import hashlib
 import xxhash
 
 from utils.logger import setup_logger
@@ -39,6 +41,28 @@ class TestEngine:
         self.test_results = []
         self.test_count = 0
         self.passed_count = 0
+        # Encoded image bytes by (extension, size, color)
+        self._image_bytes = {}
+        # One root directory for every test's files, on tmpfs when available
+        self._temp_root = tempfile.mkdtemp(prefix='dff_test_engine_', dir=self._temp_base())
+        atexit.register(shutil.rmtree, self._temp_root, ignore_errors=True)
+        
+    @staticmethod
+    def _temp_base():
+        """
+        Directory to create the test root in: DFF_TEST_TMP if set, otherwise
+        /dev/shm where it exists, otherwise the system default.
+        """
+        base = os.environ.get('DFF_TEST_TMP')
+        if base:
+            return base
+        return '/dev/shm' if os.path.isdir('/dev/shm') else None
+    
+    def temp_directory(self):
+        """
+        Create a temporary directory for one test under the shared test root.
+        """
+        return tempfile.TemporaryDirectory(dir=self._temp_root)
         
     def log_test_result(self, test_name: str, passed: bool, details: str = ""):
         """
@@ -77,8 +101,14 @@ class TestEngine:
         """
         Create a proper image file that can be processed by the image functions.
         """
-        img = Image.new('RGB', size, color)
-        img.save(path)
+        # Identical images are encoded once and the bytes reused afterwards
+        key = (path.suffix.lower(), size, color)
+        data = self._image_bytes.get(key)
+        if data is None:
+            buffer = BytesIO()
+            Image.new('RGB', size, color).save(buffer, Image.registered_extensions()[key[0]])
+            data = self._image_bytes[key] = buffer.getvalue()
+        path.write_bytes(data)
         return path
 
     def create_text_file(self, path: Path, content: str):
@@ -154,27 +184,20 @@ class TestEngine:
         """
         Test the scanning function for finding duplicate files.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_test_files(temp_path)
             
             # Test scanning
             result = scan_directory_for_duplicates(str(temp_path))
             
-            # The scanning function returns a tuple (files, count)
-            if isinstance(result, tuple):
-                files, count = result
-                actual_extensions = {Path(f).suffix.lower() for f in files if isinstance(f, (str, Path))}
-                expected_extensions = {'.jpg'}
-                has_expected_extensions = expected_extensions.issubset(actual_extensions)
-                details = f"Found {len(files)} files with extensions: {actual_extensions}"
-            else:
-                # If it returns just a list
-                files = result
-                actual_extensions = {Path(f).suffix.lower() for f in files if isinstance(f, (str, Path))}
-                expected_extensions = {'.jpg'}
-                has_expected_extensions = expected_extensions.issubset(actual_extensions)
-                details = f"Found {len(files)} files with extensions: {actual_extensions}"
+            # The scanning function returns a tuple (files, count), or just a list
+            files = result[0] if isinstance(result, tuple) else result
+            splitext = os.path.splitext
+            actual_extensions = {splitext(f)[1].lower() for f in files if isinstance(f, (str, os.PathLike))}
+            expected_extensions = {'.jpg'}
+            has_expected_extensions = expected_extensions.issubset(actual_extensions)
+            details = f"Found {len(files)} files with extensions: {actual_extensions}"
             
             # Check if scanning found the expected file types
             self.log_test_result("Scanning Function Test", has_expected_extensions, details)
@@ -185,7 +208,7 @@ class TestEngine:
         """
         Test the scanning function with complex directory structures.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_complex_test_files(temp_path)
             
@@ -211,7 +234,7 @@ class TestEngine:
         """
         Test the hashing function for finding duplicates by hash.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_test_files(temp_path)
             file_paths = [str(f) for f in test_files]
@@ -231,7 +254,7 @@ class TestEngine:
         """
         Test the accuracy of the hashing function.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             
             # Create two identical files
@@ -289,7 +312,7 @@ class TestEngine:
         """
         Test the image similarity function.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_test_files(temp_path)
             file_paths = [str(f) for f in test_files]
@@ -316,7 +339,7 @@ class TestEngine:
         """
         Test file operations functions.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_test_files(temp_path)
             file_paths = [str(f) for f in test_files]
@@ -358,7 +381,7 @@ class TestEngine:
         Test the Pydantic data models for validation and functionality.
         """
         # Test FileInfo model with an existing file
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_file = temp_path / "test.txt"
             test_file.write_text("test content")
@@ -382,7 +405,7 @@ class TestEngine:
                 self.log_test_result("FileInfo Model Test", False, f"Error: {str(e)}")
         
         # Test DuplicateGroup model
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_file1 = temp_path / "test1.txt"
             test_file2 = temp_path / "test2.txt"
@@ -426,7 +449,7 @@ class TestEngine:
                 self.log_test_result("DuplicateGroup Model Test", False, f"Error: {str(e)}")
         
         # Test ScanSettings model
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             
             try:
@@ -463,14 +486,14 @@ class TestEngine:
         db_path = None
         temp_dir = None
         try:
-            temp_dir = tempfile.mkdtemp()
+            temp_dir = tempfile.mkdtemp(dir=self._temp_root)
             db_path = Path(temp_dir) / "test.db"
             
             # Initialize database
             db_manager = DuplicateDatabase(db_path)
             
             # Test connection by creating a simple scan result
-            with tempfile.TemporaryDirectory() as test_scan_dir:
+            with self.temp_directory() as test_scan_dir:
                 scan_dir_path = Path(test_scan_dir)
                 test_file = scan_dir_path / "test.txt"
                 test_file.write_text("test content")
@@ -531,7 +554,6 @@ class TestEngine:
             # Clean up temp directory
             if temp_dir and Path(temp_dir).exists():
                 try:
-                    import shutil
                     shutil.rmtree(temp_dir, ignore_errors=True)
                 except:
                     pass  # Ignore cleanup errors
@@ -540,7 +562,7 @@ class TestEngine:
         """
         Test the duplicate detection functionality.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_complex_test_files(temp_path)
             file_paths = [str(f) for f in test_files]
@@ -621,7 +643,7 @@ class TestEngine:
         """
         Test the advanced grouping functionality.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             test_files = self.create_complex_test_files(temp_path)
             file_paths = [str(f) for f in test_files]
@@ -647,7 +669,7 @@ class TestEngine:
         """
         Test the size filtering functionality.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             
             # Create files of different sizes
@@ -688,7 +710,7 @@ class TestEngine:
         Test edge cases like empty directories, non-existent paths, etc.
         """
         # Test with empty directory
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             
             # Empty directory should return empty list
@@ -726,7 +748,7 @@ class TestEngine:
                                 f"Correctly raised exception: {type(e).__name__}")
         
         # Test with single file (no duplicates possible)
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with self.temp_directory() as temp_dir:
             temp_path = Path(temp_dir)
             single_file = temp_path / "single.jpg"
             img = self.create_image_file(single_file, (50, 50), (255, 255, 255))
@@ -1,8 +1,11 @@
 import tempfile
 import os
 from pathlib import Path
-from core.size_filtering import filter_files_by_size, get_size_stats
+from core.size_filtering import filter_files_by_size, get_size_stats, collect_sized_paths, shared_size_mask, filter_unique_by_size
 from core.ignore_list import IgnoreList, create_default_ignore_list
+from core.pipeline import classify
+from core.scanning import scan_with_models
+from core.models import ScanSettings
 
 
 def test_size_filtering():
@@ -41,6 +44,120 @@ def test_size_filtering():
         print(f'\nSize stats: min={min_size:.2f}MB, max={max_size:.2f}MB, avg={avg_size:.2f}MB')
 
 
+def test_size_filter_fast_paths():
+    print('\n--- Testing Size Filter Fast Paths ---')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        small_path = os.path.join(tmp_dir, 'small.bin')
+        large_path = os.path.join(tmp_dir, 'large.bin')
+        with open(small_path, 'wb') as f:
+            f.write(b's' * 1024)
+        with open(large_path, 'wb') as f:
+            f.write(b'l' * (64 * 1024))
+        missing_path = os.path.join(tmp_dir, 'missing.bin')
+        file_paths = [small_path, large_path, missing_path]
+        
+        # No limits: everything passes without being statted
+        assert filter_files_by_size(file_paths) == (file_paths, [])
+        
+        # Min-only and max-only still exclude unreadable files
+        assert filter_files_by_size(file_paths, min_size_mb=0.01) == ([large_path], [small_path, missing_path])
+        assert filter_files_by_size(file_paths, max_size_mb=0.01) == ([small_path], [large_path, missing_path])
+        print('Fast paths match the full range filter')
+
+
+def test_sized_paths():
+    print('\n--- Testing Sized Paths ---')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        contents = {'a.bin': b'1' * 100, 'b.bin': b'2' * 100, 'c.bin': b'3' * 300}
+        file_paths = []
+        for filename, content in contents.items():
+            file_path = os.path.join(tmp_dir, filename)
+            with open(file_path, 'wb') as f:
+                f.write(content)
+            file_paths.append(file_path)
+        missing_path = os.path.join(tmp_dir, 'missing.bin')
+        
+        paths, sizes, excluded = collect_sized_paths(file_paths + [missing_path], stat_threads=1)
+        assert paths == file_paths
+        assert [int(size) for size in sizes] == [100, 100, 300]
+        assert excluded == [missing_path]
+        
+        # Only the two 100-byte files can be duplicates of each other
+        assert [bool(shared) for shared in shared_size_mask(sizes)] == [True, True, False]
+        
+        assert filter_unique_by_size(paths, sizes) == (file_paths[:2], [file_paths[2]])
+        assert filter_unique_by_size(file_paths + [missing_path]) == (file_paths[:2], [file_paths[2], missing_path])
+        
+        stats = {}
+        paths, sizes, excluded = collect_sized_paths(file_paths, min_size_mb=0.0002, stats=stats)
+        assert paths == [file_paths[2]] and excluded == file_paths[:2]
+        assert sorted(stats) == sorted(file_paths) and stats[file_paths[2]].st_size == 300
+        print('Sizes travel with their paths')
+
+
+def test_size_limit_boundaries():
+    print('\n--- Testing Size Limit Boundaries ---')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = []
+        for filename, size in (('empty.txt', 0), ('one.txt', 1), ('two.txt', 2)):
+            file_path = os.path.join(tmp_dir, filename)
+            with open(file_path, 'wb') as f:
+                f.write(b'x' * size)
+            file_paths.append(file_path)
+        
+        # Fractional byte limits: more than 0 bytes, at most 1.5 bytes
+        min_mb = 0.0000001
+        max_mb = 1.5 / (1024 * 1024)
+        expected = [file_paths[1]]
+        
+        included, _ = filter_files_by_size(file_paths, min_size_mb=min_mb, max_size_mb=max_mb, stat_threads=1)
+        assert included == expected
+        assert collect_sized_paths(file_paths, min_size_mb=min_mb, max_size_mb=max_mb).paths == expected
+        assert classify(file_paths, min_size_mb=min_mb, max_size_mb=max_mb).kept == expected
+        
+        settings = ScanSettings(directory=Path(tmp_dir), extensions=['.txt'],
+                                min_file_size_mb=min_mb, max_file_size_mb=max_mb)
+        assert scan_with_models(settings).scanned_files_count == 3
+        print('All size filters agree at fractional byte limits')
+
+
+def test_classify():
+    print('\n--- Testing Single-Pass Classification ---')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        contents = {'photo.JPG': b'p' * 4096, 'notes.txt': b'n' * 4096, 'tiny.png': b't', 'skip.tmp': b's' * 4096}
+        file_paths = []
+        for filename, content in contents.items():
+            file_path = os.path.join(tmp_dir, filename)
+            with open(file_path, 'wb') as f:
+                f.write(content)
+            file_paths.append(file_path)
+        
+        ignore_list = IgnoreList()
+        ignore_list.add_extension('.tmp')
+        kept, images, others, excluded = classify(file_paths, min_size_mb=0.001, ignore_list=ignore_list)
+        assert kept == file_paths[:2]
+        assert images == [file_paths[0]]
+        assert others == [file_paths[1]]
+        assert excluded == [file_paths[2], file_paths[3]]
+        print(f'Images: {len(images)}, others: {len(others)}, excluded: {len(excluded)}')
+        
+        # Stats are kept for classified files only, with or without size limits
+        stats = {}
+        classify(file_paths, ignore_list=ignore_list, stats=stats)
+        assert sorted(stats) == sorted(file_paths[:3])
+        assert stats[file_paths[2]].st_size == 1
+        
+        # Kept files stay in scan order when images and others interleave
+        reordered = [file_paths[1], file_paths[0], file_paths[2]]
+        classification = classify(reordered)
+        assert classification.kept == reordered
+        assert classification.images == [file_paths[0], file_paths[2]]
+
+
 def test_ignore_list():
     print('\n--- Testing Ignore List ---')
     
@@ -141,8 +258,75 @@ def test_ignore_list_with_file():
                 print(f'Saved file has {len(content)} characters')
 
 
+def test_ignore_list_cache():
+    print('\n--- Testing Ignore List Cache ---')
+    
+    ignore_list = IgnoreList()
+    ignore_list.add_pattern(r'^draft')
+    path = os.path.join('photos', 'holiday.tmp')
+    dir_path = os.path.join('photos', 'holiday.jpg')
+    kept_path = os.path.join('photos2', 'holiday.jpg')
+    paths = (path, dir_path, kept_path, 'draft.txt')
+    
+    # Repeated checks give the same verdicts as the first (cached) ones
+    verdicts = [ignore_list.is_ignored(p) for p in paths]
+    assert verdicts == [False, False, False, True]
+    assert [ignore_list.is_ignored(p) for p in paths] == verdicts
+    
+    # Rules added after a verdict was cached take effect
+    ignore_list.add_extension('.tmp')
+    assert ignore_list.is_ignored(path)
+    ignore_list.add_directory('photos')
+    assert ignore_list.is_ignored(dir_path)
+    
+    # Verdicts unaffected by the new rules stay the same
+    assert not ignore_list.is_ignored(kept_path)
+    assert ignore_list.is_ignored('draft.txt')
+    print('Cached verdicts follow rule changes')
+
+
+def test_ignore_list_regexes():
+    print('\n--- Testing Combined Ignore Rules ---')
+    
+    ignore_list = IgnoreList()
+    ignore_list.add_directory('build')
+    ignore_list.add_directory(os.path.join('src', 'gen'))
+    ignore_list.add_pattern(r'\.tmp$')
+    ignore_list.add_pattern(r'^~')
+    assert ignore_list.is_ignored(os.path.join('build', 'out.bin'))
+    assert ignore_list.is_ignored(os.path.join('src', 'gen', 'a.py'))
+    assert not ignore_list.is_ignored(os.path.join('builds', 'out.bin'))
+    assert ignore_list.is_ignored('notes.TMP') and ignore_list.is_ignored('~lock.docx')
+    assert not ignore_list.is_ignored('notes.txt')
+    
+    # Patterns that cannot be combined still match one by one
+    ignore_list.add_pattern(r'(?s)^draft')
+    assert ignore_list.is_ignored('draft.docx') and ignore_list.is_ignored('notes.tmp')
+    assert not ignore_list.is_ignored('final.docx')
+    print('Combined directory and pattern rules match like the individual rules')
+
+
+def test_ignore_list_backreferences():
+    print('\n--- Testing Ignore Patterns With Backreferences ---')
+    
+    ignore_list = IgnoreList()
+    ignore_list.add_pattern(r'(zz)\.tmp$')
+    ignore_list.add_pattern(r'(ab)\1')
+    assert ignore_list.is_ignored(os.path.join('x', 'abab.txt'))
+    assert ignore_list.is_ignored(os.path.join('x', 'zz.tmp'))
+    assert not ignore_list.is_ignored(os.path.join('x', 'abba.txt'))
+    print('Numbered backreferences match like the individual patterns')
+
+
 if __name__ == "__main__":
     test_size_filtering()
+    test_size_filter_fast_paths()
+    test_sized_paths()
+    test_size_limit_boundaries()
+    test_classify()
     test_ignore_list()
     test_ignore_list_with_file()
+    test_ignore_list_cache()
+    test_ignore_list_regexes()
+    test_ignore_list_backreferences()
     print('\n--- All Tests Complete ---')
\ No newline at end of file
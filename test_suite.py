@@ -8,24 +8,35 @@ This test suite validates all implemented features including:
 - Ignore list functionality
 - Custom rules
 - Scan history
+- Hash cache
 - Settings management
 """
 import tempfile
 import os
 import json
+import sqlite3
+import threading
+from datetime import datetime
 from pathlib import Path
 from typing import List
 
-from core.duplicate_detection import find_all_duplicates, merge_duplicate_groups
+from core.duplicate_detection import (find_all_duplicates, find_all_duplicates_with_models_and_count,
+                                      merge_duplicate_groups)
 from core.scanning import scan_directory_for_files
-from core.hashing import find_duplicates_by_hash
+from core.hashing import find_duplicates_by_hash, find_duplicates_by_hash_models, get_hash
+from core.hash_cache import HashCache
+from core.concurrency import CONTENT_HASHER, calculate_hashes_concurrent
+import core.hashing as hashing
+import core.image_similarity as image_similarity
 from core.filename_comparison import find_duplicates_by_filename, find_duplicates_by_patterns
 from core.advanced_grouping import group_by_advanced_patterns, group_files_by_relationships
 from core.size_filtering import filter_files_by_size
 from core.ignore_list import IgnoreList
 from core.custom_rules import create_custom_rule_set, find_duplicates_by_custom_rules
-from core.scan_history import ScanHistory
-from core.settings_manager import SettingsManager
+from core.scan_history import ScanHistory, get_scan_history, close_shared_scan_histories
+from core.settings_manager import SettingsManager, get_settings_manager, clear_shared_settings_managers
+from core.models import ScanSettings, ScanResult, DuplicateGroup, FileInfo
+from core.database import DuplicateDatabase
 
 
 def create_test_files(base_dir: str, file_specs: List[tuple]) -> List[str]:
@@ -249,6 +260,327 @@ def test_scan_history():
         print("✓ Scan history tests passed")
 
 
+def test_shared_instances():
+    """Test that shared history/settings instances are keyed by normalized path and can be released."""
+    print("\n--- Testing Shared Instances ---")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "history.db")
+        spellings = [db_path, os.path.join(temp_dir, ".", "history.db"), os.path.relpath(db_path)]
+        history = get_scan_history(db_path)
+        assert all(get_scan_history(path) is history for path in spellings), "Same database should share one instance"
+        history.add_scan_result(make_scan_result(temp_dir))
+        
+        close_shared_scan_histories()
+        reopened = get_scan_history(db_path)
+        assert reopened is not history, "Closing should drop the shared instance"
+        assert len(reopened.get_recent_scans()) == 1, "Reopened history should see saved scans"
+        close_shared_scan_histories()
+        
+        settings_path = os.path.join(temp_dir, "settings.json")
+        manager = get_settings_manager(settings_path)
+        assert get_settings_manager(os.path.relpath(settings_path)) is manager
+        clear_shared_settings_managers()
+        assert get_settings_manager(settings_path) is not manager, "Clearing should drop the shared instance"
+        clear_shared_settings_managers()
+    print("✓ Shared instance tests passed")
+
+
+def make_scan_result(directory, duplicate_groups=(), scanned_files_count=0) -> ScanResult:
+    """Build a ScanResult for database tests."""
+    now = datetime.now()
+    return ScanResult(directory=Path(directory), scanned_files_count=scanned_files_count,
+                      duplicate_groups=list(duplicate_groups), scan_start_time=now, scan_end_time=now,
+                      scan_duration=0.0, methods_used=["hash"])
+
+
+def test_file_info_serialization():
+    """Test that FileInfo keeps its created_time/modified_time serialized fields."""
+    print("\n--- Testing FileInfo Serialization ---")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = create_test_files(temp_dir, [("a.txt", b"a")])[0]
+        stat = os.stat(file_path)
+        file_info = FileInfo(path=Path(file_path), size=stat.st_size, created_timestamp=stat.st_ctime,
+                             modified_timestamp=stat.st_mtime, extension=".txt", name="a.txt")
+        
+        data = file_info.model_dump()
+        assert list(data) == ["path", "size", "hash_value", "created_time", "modified_time", "extension", "name"], \
+            f"Unexpected keys: {list(data)}"
+        assert data["modified_time"] == datetime.fromtimestamp(stat.st_mtime)
+        assert json.loads(file_info.model_dump_json())["created_time"] == file_info.created_time.isoformat()
+        
+        restored = FileInfo.model_validate_json(file_info.model_dump_json())
+        assert restored.modified_time == file_info.modified_time, "JSON round trip should keep the times"
+        assert FileInfo(**data).created_time == file_info.created_time, "dict round trip should keep the times"
+    print("✓ FileInfo serialization tests passed")
+
+
+def test_database_in_memory():
+    """Test that every thread sees the same in-memory database."""
+    print("\n--- Testing In-Memory Database ---")
+    
+    db = DuplicateDatabase(":memory:")
+    scan_id = db.save_scan_result(make_scan_result("/test/dir"))
+    
+    seen = []
+    worker = threading.Thread(target=lambda: seen.extend(scan["id"] for scan in db.get_recent_scans()))
+    worker.start()
+    worker.join()
+    db.close()
+    
+    assert seen == [scan_id], f"Worker thread saw scans {seen}"
+    print("✓ In-memory database tests passed")
+
+
+def test_database_legacy_migration():
+    """Test that the old files table is migrated without losing rows or order."""
+    print("\n--- Testing Database Legacy Migration ---")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_paths = create_test_files(temp_dir, [
+            ("b.txt", b"same"),
+            ("a.txt", b"same"),
+            ("c.txt", b"same"),
+        ])
+        db_path = os.path.join(temp_dir, "legacy.db")
+        now = datetime.now().isoformat()
+        
+        # Schema written by releases before the clustered files table
+        conn = sqlite3.connect(db_path)
+        conn.executescript("""
+            CREATE TABLE scans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, directory TEXT NOT NULL,
+                scanned_files_count INTEGER, scan_start_time TEXT, scan_end_time TEXT,
+                scan_duration REAL, methods_used TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE duplicate_groups (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, scan_id INTEGER,
+                group_id TEXT, detection_method TEXT
+            );
+            CREATE TABLE files (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, group_id INTEGER, path TEXT NOT NULL,
+                size INTEGER, hash_value TEXT, created_time TEXT, modified_time TEXT,
+                extension TEXT, name TEXT
+            );
+        """)
+        conn.execute("INSERT INTO scans VALUES (1, ?, 3, ?, ?, 0.5, '[\"hash\"]', ?)",
+                     (temp_dir, now, now, now))
+        conn.execute("INSERT INTO duplicate_groups VALUES (1, 1, 'hash_same', 'hash')")
+        # Insert out of id order; the migrated order must follow the old ids
+        for file_id, file_path in ((3, file_paths[2]), (1, file_paths[0]), (2, file_paths[1])):
+            conn.execute("INSERT INTO files VALUES (?, 1, ?, 4, 'same', ?, ?, '.txt', ?)",
+                         (file_id, file_path, now, now, os.path.basename(file_path)))
+        conn.commit()
+        conn.close()
+        
+        db = DuplicateDatabase(Path(db_path))
+        scan_result = db.get_scan_result(1)
+        columns = [row[1] for row in db._connect().execute("PRAGMA table_info(files)")]
+        scans = db.get_scans_by_directory(temp_dir)
+        db.close()
+        
+        assert scan_result is not None, "Legacy scan should still load"
+        assert [str(f.path) for f in scan_result.duplicate_groups[0].files] == file_paths, \
+            "Migrated files should keep their original order"
+        assert "position" in columns and "id" not in columns, f"Unexpected files columns: {columns}"
+        assert [scan["id"] for scan in scans] == [1], "Legacy scan should be found by directory"
+        print("✓ Database legacy migration tests passed")
+
+
+def test_database_directory_lookup():
+    """Test that scans are found by directory however the path is spelled."""
+    print("\n--- Testing Database Directory Lookup ---")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scanned_dir = os.path.join(temp_dir, "photos")
+        os.makedirs(scanned_dir)
+        db = DuplicateDatabase(":memory:")
+        scan_id = db.save_scan_result(make_scan_result(scanned_dir))
+        db.save_scan_result(make_scan_result(temp_dir))
+        
+        spellings = [
+            scanned_dir + os.sep,
+            os.path.join(scanned_dir, ".", "..", "photos"),
+            os.path.relpath(scanned_dir),
+            Path(scanned_dir),
+        ]
+        for spelling in spellings:
+            scans = db.get_scans_by_directory(spelling)
+            assert [scan["id"] for scan in scans] == [scan_id], f"Lookup failed for {spelling!r}"
+        db.close()
+        print("✓ Database directory lookup tests passed")
+
+
+def test_database_batch_save():
+    """Test that a batch of scans saved together loads back unchanged."""
+    print("\n--- Testing Database Batch Save ---")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_paths = create_test_files(temp_dir, [
+            ("one.txt", b"one"),
+            ("one_copy.txt", b"one"),
+            ("two.txt", b"two"),
+            ("two_copy.txt", b"two"),
+        ])
+        file_infos = [FileInfo(path=Path(path), size=os.path.getsize(path), hash_value="h",
+                               created_time=os.path.getctime(path), modified_time=os.path.getmtime(path),
+                               extension=".txt", name=os.path.basename(path))
+                      for path in file_paths]
+        scan_results = [
+            make_scan_result(temp_dir, [DuplicateGroup(id="hash_one", files=file_infos[:2], detection_method="hash")], 2),
+            make_scan_result(temp_dir, [DuplicateGroup(id="hash_two", files=file_infos[3:1:-1], detection_method="hash"),
+                                        DuplicateGroup(id="hash_one", files=file_infos[:2], detection_method="hash")], 4),
+        ]
+        
+        db = DuplicateDatabase(":memory:")
+        scan_ids = db.save_scan_results(scan_results)
+        loaded = [db.get_scan_result(scan_id) for scan_id in scan_ids]
+        db.close()
+        
+        assert len(set(scan_ids)) == 2, f"Expected two distinct scan ids, got {scan_ids}"
+        for saved, restored in zip(scan_results, loaded):
+            assert restored.scanned_files_count == saved.scanned_files_count
+            assert [g.id for g in restored.duplicate_groups] == [g.id for g in saved.duplicate_groups]
+            for saved_group, restored_group in zip(saved.duplicate_groups, restored.duplicate_groups):
+                assert [f.path for f in restored_group.files] == [f.path for f in saved_group.files]
+                assert [f.size for f in restored_group.files] == [f.size for f in saved_group.files]
+        print("✓ Database batch save tests passed")
+
+
+def test_hash_prefilters():
+    """Test that size and signature pre-filters keep hash results unchanged."""
+    print("\n--- Testing Hash Pre-filters ---")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        large = b"L" * (300 * 1024)
+        file_paths = create_test_files(tmp_dir, [
+            ("large_a.bin", large),
+            ("large_b.bin", large),
+            ("large_tail_differs.bin", large[:-1] + b"X"),  # same size and head, different tail
+            ("large_head_differs.bin", b"X" + large[1:]),
+            ("small_a.txt", b"tiny"),
+            ("small_b.txt", b"tiny"),
+            ("unique_size.txt", b"nothing else is this long"),
+        ])
+        
+        duplicates = find_duplicates_by_hash(file_paths)
+        groups = sorted(sorted(os.path.basename(p) for p in paths) for paths in duplicates.values())
+        assert groups == [["large_a.bin", "large_b.bin"], ["small_a.txt", "small_b.txt"]], groups
+        
+        # The model variant goes through the same pre-filters
+        model_groups = sorted(sorted(p.name for p in file_hash.file_paths)
+                              for file_hash in find_duplicates_by_hash_models(file_paths))
+        assert model_groups == groups, model_groups
+        
+        # The reused read buffer must not leak a larger file's bytes into a smaller one's hash
+        for file_path in file_paths:
+            with open(file_path, "rb") as f:
+                assert get_hash(file_path) == CONTENT_HASHER(f.read()).hexdigest(), file_path
+        
+        print("✓ Hash pre-filter tests passed")
+
+
+def test_hash_cache():
+    """Test that cached hashes are reused only for unchanged files."""
+    print("\n--- Testing Hash Cache ---")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_paths = create_test_files(tmp_dir, [
+            ("a.bin", b"same content"),
+            ("b.bin", b"same content"),
+            ("c.bin", b"other content"),
+        ])
+        cache = HashCache(os.path.join(tmp_dir, "hash_cache.db"))
+        
+        first = calculate_hashes_concurrent(file_paths, hash_cache=cache)
+        assert first == calculate_hashes_concurrent(file_paths), "Cached run must match an uncached run"
+        
+        # An unchanged file is answered from the cache, without reading it
+        stale = "0" * 32
+        st = os.stat(file_paths[0])
+        cache.update([(file_paths[0], st.st_size, st.st_mtime_ns, stale)], CONTENT_HASHER().name)
+        assert calculate_hashes_concurrent(file_paths, hash_cache=cache)[file_paths[0]] == stale
+        
+        # A changed mtime invalidates the entry
+        os.utime(file_paths[0], ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert calculate_hashes_concurrent(file_paths, hash_cache=cache)[file_paths[0]] == first[file_paths[0]]
+        
+        # Entries from a different algorithm are ignored
+        assert cache.get_hashes([(file_paths[1], len(b"same content"), os.stat(file_paths[1]).st_mtime_ns)],
+                                "other") == {}
+        
+        duplicates = find_duplicates_by_hash(file_paths, hash_cache=cache)
+        assert sorted(map(sorted, duplicates.values())) == [sorted(file_paths[:2])]
+        
+        # The model entry point used by main.py answers from the same cache
+        cache.update([(path, os.stat(path).st_size, os.stat(path).st_mtime_ns, stale) for path in file_paths[:2]],
+                     CONTENT_HASHER().name)
+        settings = ScanSettings(directory=Path(tmp_dir), extensions=[".bin"], use_filename=False,
+                                use_size=False, use_patterns=False)
+        groups, _ = find_all_duplicates_with_models_and_count(settings, hash_cache=cache)
+        assert [group.id for group in groups] == [f"hash_{stale}"]
+        cache.close()
+        
+        print("✓ Hash cache tests passed")
+
+
+def test_pipelined_hash_errors():
+    """Test that any reader-thread failure reaches the caller instead of hanging it."""
+    print("\n--- Testing Pipelined Hash Errors ---")
+    
+    class FailingFile:
+        def __init__(self, error):
+            self.error = error
+            self.reads = 0
+        
+        def readinto(self, buf):
+            self.reads += 1
+            if self.reads > 1:
+                raise self.error
+            buf[:4] = b"data"
+            return 4
+    
+    for error in (OSError("disk gone"), ValueError("closed file"), KeyboardInterrupt()):
+        raised = []
+        
+        def run():
+            try:
+                hashing._hash_stream_pipelined(FailingFile(error))
+            except BaseException as e:
+                raised.append(e)
+        
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=5)
+        assert not worker.is_alive(), f"Hashing hung after {error!r}"
+        assert raised == [error], f"Expected {error!r} to be re-raised, got {raised}"
+    print("✓ Pipelined hash error tests passed")
+
+
+def test_hamming_neighbours():
+    """Test that vectorized and pure-Python Hamming lookups agree."""
+    print("\n--- Testing Hamming Neighbours ---")
+    
+    hash_values = [0x0, 0x1, 0x3, 0xFF, 0xFFFFFFFFFFFFFFFF, 0x8000000000000001, 0x7]
+    expected = {i: [j for j in range(i + 1, len(hash_values))
+                    if bin(hash_values[i] ^ hash_values[j]).count("1") <= 2]
+                for i in range(len(hash_values))}
+    
+    close_to = image_similarity._hamming_neighbours(hash_values, 2)
+    assert {i: list(close_to(i)) for i in expected} == expected
+    
+    numpy_module = image_similarity.np
+    image_similarity.np = None
+    try:
+        close_to = image_similarity._hamming_neighbours(hash_values, 2)
+        assert {i: list(close_to(i)) for i in expected} == expected
+    finally:
+        image_similarity.np = numpy_module
+    
+    print("✓ Hamming neighbour tests passed")
+
+
 def test_settings_manager():
     """Test settings manager functionality."""
     print("\n--- Testing Settings Manager ---")
@@ -364,6 +696,16 @@ def run_all_tests():
         test_ignore_list,
         test_custom_rules,
         test_scan_history,
+        test_file_info_serialization,
+        test_database_in_memory,
+        test_shared_instances,
+        test_database_legacy_migration,
+        test_database_directory_lookup,
+        test_database_batch_save,
+        test_hash_prefilters,
+        test_hash_cache,
+        test_pipelined_hash_errors,
+        test_hamming_neighbours,
         test_settings_manager,
         test_integration
     ]